@@ -0,0 +1,78 @@
+import os
+
+from limits import BACKGROUND, INTERACTIVE, limiters
+
+# Gemini model used by every agent
+GEMINI_MODEL_ID = os.environ.get("INTERVIEWAI_GEMINI_MODEL", "gemini-2.0-flash-exp")
+
+_limited_model_classes = {}
+
+
+def limited_model_class(model_class):
+    """Subclass a phidata model so every request it sends holds its own slot on the Gemini budget.
+
+    An agent run makes one model request per turn, with tool calls in
+    between. Limiting the requests rather than the run means a multi-turn
+    research run neither holds a concurrency slot while its searches run
+    nor spends a single rate token on several requests. Requests queue at
+    the model's ``priority``, which :func:`copy_agent` sets per run.
+    """
+    if model_class not in _limited_model_classes:
+        class LimitedModel(model_class):
+            priority: int = INTERACTIVE
+
+            def invoke(self, *args, **kwargs):
+                with model_slot(self.priority):
+                    return super().invoke(*args, **kwargs)
+
+            def invoke_stream(self, *args, **kwargs):
+                with model_slot(self.priority):
+                    yield from super().invoke_stream(*args, **kwargs)
+
+        LimitedModel.__name__ = LimitedModel.__qualname__ = f"Limited{model_class.__name__}"
+        _limited_model_classes[model_class] = LimitedModel
+    return _limited_model_classes[model_class]
+
+
+def create_agent(api_key, **options):
+    """Create a Gemini-backed agent.
+
+    phidata and the Gemini client are imported here rather than at the top of
+    the app, so they load when the first agent is built instead of on every
+    cold start.
+    """
+    from phi.agent import Agent
+    from phi.model.google import Gemini
+
+    return Agent(model=limited_model_class(Gemini)(id=GEMINI_MODEL_ID, api_key=api_key), **options)
+
+
+def copy_agent(agent, priority=INTERACTIVE):
+    """Copy a shared agent for a single run whose model requests queue at ``priority``.
+
+    Agents are shared by every session, and a phidata run keeps its memory,
+    response and tool-call count on the agent, so each run gets its own copy.
+    """
+    run_agent = agent.deep_copy()
+    run_agent.model.priority = priority
+    return run_agent
+
+
+def create_search_tools(api_key):
+    """Create the Tavily web search toolkit, importing it on first use."""
+    from phi.tools.tavily import TavilyTools
+
+    tools = TavilyTools(api_key=api_key)
+    # Searches only run as part of research, which yields to interactive calls
+    for function in tools.functions.values():
+        function.entrypoint = limiters.throttled("tavily", "search", function.entrypoint, BACKGROUND)
+    return tools
+
+
+def model_slot(priority=INTERACTIVE):
+    """Wait for capacity on the Gemini budget; hold it with ``with model_slot():`` around a model request.
+
+    Interactive calls are admitted ahead of background prefetch and
+    research, and the shared limiter backs off when Gemini returns 429/5xx.
+    """
+    return limiters.slot("gemini", GEMINI_MODEL_ID, priority)
@@ -1,24 +1,28 @@
 import streamlit as st
 import os
-import pandas as pd
-from PIL import Image
-from io import BytesIO
-from phi.agent import Agent
-from phi.model.google import Gemini
-from phi.tools.tavily import TavilyTools
-from tempfile import NamedTemporaryFile
-import base64
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as ReportLabImage
-from reportlab.lib.units import inch
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import hashlib
+import uuid
 import re
-import json
-import PyPDF2
-import docx
+import extraction
+from agents import GEMINI_MODEL_ID, copy_agent, create_agent
+from cache import PersistentCache, normalize_key
+from context import PLAN_QUESTIONS_TOKENS, PLAN_QUESTIONS_TOP_K, build_context, select_profile_facts
+from limits import BACKGROUND, INTERACTIVE, is_overload, track_queue_wait
+from question_bank import bank
+from report import build_interview_report, report_fingerprint
+from research import (
+    JOB_CATEGORIES, create_research_agent, open_research_cache, research_cache_key, research_interview_questions,
+    run_research
+)
+from resilience import CallPolicy, backoff_delay, call_with_policy, is_retryable, stream_with_deadline
+from background import BackgroundJobs
+from sessions import SessionStore, changed_values, valid_token
+from storage import open_configured_storage
+from schemas import InterviewPlan, ResumeAnalysis, TranscriptEvaluation, TurnEvaluation
+from telemetry import start_metrics_server, tracer
 
 # Set page configuration
 st.set_page_config(
@@ -28,663 +32,18 @@ st.set_page_config(
     page_icon="🎯"
 )
 
-# Custom CSS for white theme with perfect contrast - FIXED VERSION
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Root variables - Enhanced contrast */
-    :root {
-        --primary-white: #FFFFFF;
-        --secondary-white: #FAFAFA;
-        --light-gray: #F5F5F5;
-        --medium-gray: #E0E0E0;
-        --dark-gray: #2C2C2C;
-        --text-primary: #1A1A1A;
-        --text-secondary: #404040;
-        --text-light: #666666;
-        --accent-blue: #1E40AF;
-        --accent-blue-light: #3B82F6;
-        --accent-green: #059669;
-        --accent-orange: #EA580C;
-        --border-color: #D1D5DB;
-        --border-color-dark: #9CA3AF;
-        --shadow-light: 0 2px 8px rgba(0, 0, 0, 0.08);
-        --shadow-medium: 0 4px 16px rgba(0, 0, 0, 0.12);
-        --focus-ring: 0 0 0 3px rgba(30, 64, 175, 0.2);
-    }
-    
-    /* Main app styling */
-    .stApp {
-        background-color: var(--primary-white);
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        color: var(--text-primary);
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Custom header styling */
-    .main-header {
-        background: linear-gradient(135deg, var(--primary-white) 0%, var(--secondary-white) 100%);
-        padding: 2rem 0;
-        border-bottom: 2px solid var(--border-color);
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    
-    .main-header h1 {
-        color: var(--text-primary) !important;
-        font-weight: 700 !important;
-        font-size: 3rem !important;
-        margin-bottom: 0.5rem !important;
-        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    .main-header .subtitle {
-        color: var(--text-secondary) !important;
-        font-size: 1.2rem !important;
-        font-weight: 400 !important;
-        margin-top: 0 !important;
-    }
-    
-    /* Title styling */
-    h1, h2, h3, h4, h5, h6 {
-        color: var(--text-primary) !important;
-        font-family: 'Inter', sans-serif !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Main title */
-    .stApp > div > div > div > div > h1 {
-        color: var(--text-primary) !important;
-        font-size: 2.5rem !important;
-        font-weight: 700 !important;
-        margin-bottom: 0.5rem !important;
-        border-bottom: 3px solid var(--accent-blue);
-        padding-bottom: 1rem;
-    }
-    
-    /* Subtitle */
-    .stApp > div > div > div > div > div[data-testid="stMarkdownContainer"] h2 {
-        color: var(--text-secondary) !important;
-        font-size: 1.3rem !important;
-        font-weight: 500 !important;
-        margin-top: 0 !important;
-    }
-    
-    /* Text content - Enhanced contrast */
-    p, div, span, li {
-        color: var(--text-primary) !important;
-        line-height: 1.6 !important;
-    }
-    
-    /* Card-like containers */
-    .stContainer > div {
-        background-color: var(--primary-white);
-        border: 1px solid var(--border-color);
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: var(--shadow-light);
-    }
-    
-    /* Info boxes - Enhanced contrast */
-    .stInfo {
-        background-color: var(--secondary-white) !important;
-        border: 1px solid var(--accent-blue) !important;
-        border-left: 4px solid var(--accent-blue) !important;
-        color: var(--text-primary) !important;
-        border-radius: 8px !important;
-        box-shadow: var(--shadow-light) !important;
-    }
-    
-    .stInfo > div {
-        color: var(--text-primary) !important;
-    }
-    
-    .stInfo div[data-testid="stMarkdownContainer"] p {
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Success boxes */
-    .stSuccess {
-        background-color: var(--secondary-white) !important;
-        border: 1px solid var(--accent-green) !important;
-        border-left: 4px solid var(--accent-green) !important;
-        color: var(--text-primary) !important;
-        border-radius: 8px !important;
-        box-shadow: var(--shadow-light) !important;
-    }
-    
-    .stSuccess > div {
-        color: var(--text-primary) !important;
-    }
-    
-    .stSuccess div[data-testid="stMarkdownContainer"] p {
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Error boxes */
-    .stError {
-        background-color: var(--secondary-white) !important;
-        border: 1px solid var(--accent-orange) !important;
-        border-left: 4px solid var(--accent-orange) !important;
-        color: var(--text-primary) !important;
-        border-radius: 8px !important;
-        box-shadow: var(--shadow-light) !important;
-    }
-    
-    .stError > div {
-        color: var(--text-primary) !important;
-    }
-    
-    .stError div[data-testid="stMarkdownContainer"] p {
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Buttons - Enhanced contrast */
-    .stButton > button {
-        background-color: var(--accent-blue) !important;
-        color: var(--primary-white) !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 0.75rem 2rem !important;
-        font-weight: 600 !important;
-        font-size: 1rem !important;
-        transition: all 0.3s ease !important;
-        box-shadow: var(--shadow-light) !important;
-        text-transform: none !important;
-        letter-spacing: 0.5px !important;
-        min-height: 3rem !important;
-    }
-    
-    .stButton > button:hover {
-        background-color: #1E3A8A !important;
-        box-shadow: var(--shadow-medium) !important;
-        transform: translateY(-2px) !important;
-    }
-    
-    .stButton > button:focus {
-        outline: none !important;
-        box-shadow: var(--focus-ring) !important;
-    }
-    
-    .stButton > button:disabled {
-        background-color: var(--medium-gray) !important;
-        color: var(--text-light) !important;
-        cursor: not-allowed !important;
-        transform: none !important;
-        box-shadow: none !important;
-    }
-    
-    /* Input fields - Enhanced contrast */
-    .stTextInput > div > div > input {
-        background-color: var(--primary-white) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-radius: 8px !important;
-        color: var(--text-primary) !important;
-        padding: 0.75rem !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        transition: border-color 0.3s ease !important;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: var(--accent-blue) !important;
-        box-shadow: var(--focus-ring) !important;
-        outline: none !important;
-    }
-    
-    .stTextInput > div > div > input::placeholder {
-        color: var(--text-light) !important;
-        opacity: 0.8 !important;
-    }
-    
-    /* Text areas - Enhanced contrast */
-    .stTextArea > div > div > textarea {
-        background-color: var(--primary-white) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-radius: 8px !important;
-        color: var(--text-primary) !important;
-        padding: 1rem !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        line-height: 1.6 !important;
-        transition: border-color 0.3s ease !important;
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: var(--accent-blue) !important;
-        box-shadow: var(--focus-ring) !important;
-        outline: none !important;
-    }
-    
-    .stTextArea > div > div > textarea::placeholder {
-        color: var(--text-light) !important;
-        opacity: 0.8 !important;
-    }
-    
-    /* Select boxes - COMPREHENSIVE FIX for dropdown contrast */
-    .stSelectbox > div > div {
-        background-color: var(--primary-white) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-radius: 8px !important;
-        min-height: 3rem !important;
-    }
-    
-    .stSelectbox > div > div > div {
-        color: var(--text-primary) !important;
-        padding: 0.75rem !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Main selectbox container */
-    .stSelectbox div[data-baseweb="select"] {
-        background-color: var(--primary-white) !important;
-        color: var(--text-primary) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-radius: 8px !important;
-    }
-    
-    /* Selectbox input field */
-    .stSelectbox div[data-baseweb="select"] > div {
-        background-color: var(--primary-white) !important;
-        color: var(--text-primary) !important;
-        border: none !important;
-        padding: 0.75rem !important;
-    }
-    
-    /* Selectbox dropdown container - CRITICAL */
-    .stSelectbox div[data-baseweb="select"] div[role="listbox"] {
-        background-color: var(--primary-white) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-radius: 8px !important;
-        box-shadow: var(--shadow-medium) !important;
-        max-height: 200px !important;
-        overflow-y: auto !important;
-        z-index: 9999 !important;
-    }
-    
-    /* Dropdown options - MAIN FIX */
-    .stSelectbox div[data-baseweb="select"] div[role="option"] {
-        background-color: var(--primary-white) !important;
-        color: var(--text-primary) !important;
-        padding: 0.75rem 1rem !important;
-        font-weight: 500 !important;
-        border-bottom: 1px solid var(--light-gray) !important;
-        cursor: pointer !important;
-        font-size: 1rem !important;
-    }
-    
-    /* Dropdown option hover state */
-    .stSelectbox div[data-baseweb="select"] div[role="option"]:hover {
-        background-color: var(--light-gray) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    /* Selected dropdown option */
-    .stSelectbox div[data-baseweb="select"] div[role="option"][aria-selected="true"] {
-        background-color: var(--accent-blue) !important;
-        color: var(--primary-white) !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Alternative targeting for dropdown menu */
-    .stSelectbox ul {
-        background-color: var(--primary-white) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-radius: 8px !important;
-        box-shadow: var(--shadow-medium) !important;
-        max-height: 200px !important;
-        overflow-y: auto !important;
-    }
-    
-    .stSelectbox li {
-        background-color: var(--primary-white) !important;
-        color: var(--text-primary) !important;
-        padding: 0.75rem 1rem !important;
-        font-weight: 500 !important;
-        border-bottom: 1px solid var(--light-gray) !important;
-        cursor: pointer !important;
-    }
-    
-    .stSelectbox li:hover {
-        background-color: var(--light-gray) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    .stSelectbox li:last-child {
-        border-bottom: none !important;
-    }
-    
-    /* Dropdown arrow */
-    .stSelectbox svg {
-        fill: var(--text-primary) !important;
-    }
-    
-    /* Additional BaseWeb component targeting */
-    div[data-baseweb="popover"] {
-        background-color: var(--primary-white) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-radius: 8px !important;
-        box-shadow: var(--shadow-medium) !important;
-    }
-    
-    div[data-baseweb="popover"] div {
-        background-color: var(--primary-white) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    /* Force override any dark backgrounds */
-    .stSelectbox * {
-        background-color: var(--primary-white) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    /* Specific targeting for BaseWeb select dropdown */
-    div[data-baseweb="select"] div[data-baseweb="popover"] {
-        background-color: var(--primary-white) !important;
-    }
-    
-    div[data-baseweb="select"] div[data-baseweb="popover"] > div {
-        background-color: var(--primary-white) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    /* File uploader - Enhanced contrast */
-    .stFileUploader > div {
-        background-color: var(--secondary-white) !important;
-        border: 2px dashed var(--border-color-dark) !important;
-        border-radius: 12px !important;
-        padding: 2rem !important;
-        text-align: center !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stFileUploader > div:hover {
-        border-color: var(--accent-blue) !important;
-        background-color: var(--light-gray) !important;
-    }
-    
-    .stFileUploader > div > div {
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Progress bar - Enhanced visibility */
-    .stProgress > div > div > div {
-        background-color: var(--accent-blue) !important;
-        border-radius: 10px !important;
-    }
-    
-    .stProgress > div > div {
-        background-color: var(--medium-gray) !important;
-        border-radius: 10px !important;
-        border: 1px solid var(--border-color) !important;
-    }
-    
-    /* Expanders - Enhanced contrast */
-    .streamlit-expanderHeader {
-        background-color: var(--secondary-white) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-radius: 8px 8px 0 0 !important;
-        color: var(--text-primary) !important;
-        font-weight: 600 !important;
-        padding: 1rem !important;
-        cursor: pointer !important;
-    }
-    
-    .streamlit-expanderHeader:hover {
-        background-color: var(--light-gray) !important;
-        border-color: var(--accent-blue) !important;
-    }
-    
-    .streamlit-expanderContent {
-        background-color: var(--primary-white) !important;
-        border: 2px solid var(--border-color-dark) !important;
-        border-top: none !important;
-        border-radius: 0 0 8px 8px !important;
-        padding: 1.5rem !important;
-    }
-    
-    /* Expander arrow */
-    .streamlit-expanderHeader svg {
-        fill: var(--text-primary) !important;
-    }
-    
-    /* Columns */
-    .stColumn {
-        background-color: var(--primary-white);
-        border-radius: 12px;
-        padding: 1rem;
-        margin: 0.5rem;
-        box-shadow: var(--shadow-light);
-        border: 1px solid var(--border-color);
-    }
-    
-    /* Spinner */
-    .stSpinner > div {
-        border-top-color: var(--accent-blue) !important;
-    }
-    
-    /* Labels - Enhanced contrast */
-    .stTextInput > label,
-    .stTextArea > label,
-    .stSelectbox > label,
-    .stFileUploader > label {
-        color: var(--text-primary) !important;
-        font-weight: 600 !important;
-        font-size: 1rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    /* Metric styling */
-    .stMetric {
-        background-color: var(--secondary-white) !important;
-        border: 1px solid var(--border-color) !important;
-        border-radius: 12px !important;
-        padding: 1.5rem !important;
-        text-align: center !important;
-        box-shadow: var(--shadow-light) !important;
-    }
-    
-    .stMetric > div {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Custom section headers */
-    .section-header {
-        background: linear-gradient(90deg, var(--accent-blue), var(--accent-green));
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-size: 2rem !important;
-        font-weight: 700 !important;
-        margin: 2rem 0 1rem 0 !important;
-        text-align: center;
-    }
-    
-    /* Stage indicators */
-    .stage-indicator {
-        background: linear-gradient(135deg, var(--secondary-white) 0%, var(--light-gray) 100%);
-        border: 2px solid var(--accent-blue);
-        border-radius: 50px;
-        padding: 0.5rem 1.5rem;
-        color: var(--accent-blue) !important;
-        font-weight: 600;
-        font-size: 1rem;
-        text-align: center;
-        margin-bottom: 1rem;
-        display: inline-block;
-    }
-    
-    /* Conversation history styling */
-    .conversation-entry {
-        background-color: var(--secondary-white);
-        border: 1px solid var(--border-color);
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: var(--shadow-light);
-    }
-    
-    /* Custom balloons effect */
-    .celebration {
-        background: linear-gradient(45deg, var(--accent-blue), var(--accent-green), var(--accent-orange));
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-size: 3rem;
-        text-align: center;
-        margin: 2rem 0;
-        animation: bounce 2s infinite;
-    }
-    
-    @keyframes bounce {
-        0%, 20%, 50%, 80%, 100% {
-            transform: translateY(0);
-        }
-        40% {
-            transform: translateY(-10px);
-        }
-        60% {
-            transform: translateY(-5px);
-        }
-    }
-    
-    /* Help text */
-    .help-text {
-        color: var(--text-secondary) !important;
-        font-size: 0.9rem !important;
-        font-style: italic !important;
-        margin-top: 0.5rem !important;
-    }
-    
-    /* Enhanced accessibility - Improved focus indicators */
-    *:focus-visible {
-        outline: 3px solid var(--accent-blue) !important;
-        outline-offset: 2px !important;
-        border-radius: 4px !important;
-    }
-    
-    /* High contrast text */
-    strong, b {
-        color: var(--text-primary) !important;
-        font-weight: 700 !important;
-    }
-    
-    /* Custom dividers */
-    hr {
-        border: none !important;
-        height: 2px !important;
-        background: linear-gradient(90deg, transparent, var(--border-color-dark), transparent) !important;
-        margin: 2rem 0 !important;
-    }
-    
-    /* Subheader styling */
-    .stSubheader {
-        color: var(--text-primary) !important;
-        font-weight: 600 !important;
-        font-size: 1.25rem !important;
-        margin-bottom: 1rem !important;
-    }
-    
-    /* Markdown content in containers */
-    .stMarkdown p {
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Textarea disabled state */
-    .stTextArea textarea:disabled {
-        background-color: var(--light-gray) !important;
-        color: var(--text-secondary) !important;
-        opacity: 0.8 !important;
-    }
-    
-    /* Loading states */
-    .stSpinner {
-        color: var(--accent-blue) !important;
-    }
-    
-    /* Warning boxes */
-    .stWarning {
-        background-color: var(--secondary-white) !important;
-        border: 1px solid var(--accent-orange) !important;
-        border-left: 4px solid var(--accent-orange) !important;
-        color: var(--text-primary) !important;
-        border-radius: 8px !important;
-        box-shadow: var(--shadow-light) !important;
-    }
-    
-    .stWarning > div {
-        color: var(--text-primary) !important;
-    }
-    
-    .stWarning div[data-testid="stMarkdownContainer"] p {
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Responsive design */
-    @media (max-width: 768px) {
-        .main-header h1 {
-            font-size: 2rem !important;
-        }
-        
-        .main-header .subtitle {
-            font-size: 1rem !important;
-        }
-        
-        .stColumn {
-            margin: 0.25rem;
-            padding: 0.75rem;
-        }
-        
-        .stButton > button {
-            padding: 0.5rem 1rem !important;
-            font-size: 0.9rem !important;
-        }
-    }
-    
-    /* Dark mode compatibility (if needed) */
-    @media (prefers-color-scheme: dark) {
-        :root {
-            --primary-white: #FFFFFF;
-            --secondary-white: #FAFAFA;
-            --text-primary: #1A1A1A;
-            --text-secondary: #404040;
-        }
-    }
-    
-    /* Ensure all text is readable */
-    div, p, span, label, input, textarea, select, button {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Override any Streamlit defaults that might interfere */
-    .stApp div[data-testid="stMarkdownContainer"] * {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Fix for selectbox placeholder */
-    .stSelectbox div[data-baseweb="select"] div[role="combobox"] {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Fix for selectbox icon */
-    .stSelectbox div[data-baseweb="select"] svg {
-        fill: var(--text-primary) !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Theme stylesheet, served once from ./static and cached by the browser instead of
+# being re-sent with every rerun; the content hash busts the cache when it changes
+THEME_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "theme.css")
+
+@st.cache_resource
+def theme_stylesheet_url():
+    """Relative URL of the theme stylesheet, versioned by its content hash."""
+    with open(THEME_CSS_PATH, "rb") as stylesheet:
+        version = hashlib.sha256(stylesheet.read()).hexdigest()[:12]
+    return f"app/static/theme.css?v={version}"
+
+st.markdown(f'<link rel="stylesheet" href="{theme_stylesheet_url()}">', unsafe_allow_html=True)
 
 # API Keys
 TAVILY_API_KEY = st.secrets.get("TAVILY_API_KEY")
@@ -695,37 +54,68 @@ if not TAVILY_API_KEY or not GOOGLE_API_KEY:
     st.error("🔑 API keys are missing. Please check your configuration.")
     st.stop()
 
-# Job categories and roles
-JOB_CATEGORIES = {
-    "Technology": [
-        "Software Engineer", "Data Scientist", "Machine Learning Engineer", 
-        "DevOps Engineer", "Cybersecurity Analyst", "Product Manager",
-        "UI/UX Designer", "Full Stack Developer", "Backend Developer",
-        "Frontend Developer", "Cloud Architect", "AI Engineer"
-    ],
-    "Finance": [
-        "Financial Analyst", "Investment Banker", "Risk Manager",
-        "Portfolio Manager", "Accountant", "Financial Planner",
-        "Quantitative Analyst", "Treasury Analyst"
-    ],
-    "Marketing": [
-        "Digital Marketing Manager", "Content Marketing Specialist",
-        "Social Media Manager", "Brand Manager", "SEO Specialist",
-        "Marketing Analyst", "Growth Hacker"
-    ],
-    "Healthcare": [
-        "Nurse", "Doctor", "Healthcare Administrator", "Medical Technician",
-        "Pharmacist", "Physical Therapist", "Healthcare Analyst"
-    ],
-    "Consulting": [
-        "Management Consultant", "Strategy Consultant", "Business Analyst",
-        "Operations Consultant", "IT Consultant"
-    ],
-    "Sales": [
-        "Sales Representative", "Account Manager", "Business Development Manager",
-        "Sales Engineer", "Customer Success Manager"
-    ]
+# Port for the Prometheus /metrics endpoint; unset disables it
+METRICS_PORT = os.environ.get("INTERVIEWAI_METRICS_PORT")
+
+# Deadline in seconds (retries included), attempts and hedging per model call; hedged calls get a
+# duplicate request once they run past their recent p95 latency
+CALL_POLICIES = {
+    "analyze_resume": CallPolicy(deadline=60, attempts=3, hedge=True),
+    "conduct_interview_session": CallPolicy(deadline=45, attempts=3, hedge=True),
+    "evaluate_answer": CallPolicy(deadline=60, attempts=3, hedge=True),
+    "plan_interview": CallPolicy(deadline=90, attempts=2),
+    "evaluate_interview_transcript": CallPolicy(deadline=120, attempts=2),
 }
+HEDGING_ENABLED = os.environ.get("INTERVIEWAI_HEDGING", "1") == "1"
+# Calls a function needs on record before its p95 is trusted for hedging
+HEDGE_MIN_SAMPLES = int(os.environ.get("INTERVIEWAI_HEDGE_MIN_SAMPLES", "20"))
+
+# Worker threads shared by the concurrent resume analysis / question research pipeline
+PREPARATION_MAX_WORKERS = int(os.environ.get("INTERVIEWAI_PREPARATION_WORKERS", "8"))
+
+# Render interview questions and feedback token by token as they are generated
+STREAM_RESPONSES = os.environ.get("INTERVIEWAI_STREAM_RESPONSES", "1") == "1"
+# Seconds a streamed response may go without a new chunk before it is abandoned
+STREAM_IDLE_TIMEOUT = float(os.environ.get("INTERVIEWAI_STREAM_IDLE_TIMEOUT", "20"))
+
+# Background generation of the next interview question while the user reads feedback
+PREFETCH_WORKERS = int(os.environ.get("INTERVIEWAI_PREFETCH_WORKERS", "4"))
+PREFETCH_MAX_PENDING = int(os.environ.get("INTERVIEWAI_PREFETCH_MAX_PENDING", "32"))
+PREFETCH_WAIT_SECONDS = float(os.environ.get("INTERVIEWAI_PREFETCH_WAIT", "10"))
+
+# Queued answer evaluation so "Submit Answer" never blocks on the model
+ASYNC_EVALUATION = os.environ.get("INTERVIEWAI_ASYNC_EVALUATION", "1") == "1"
+EVALUATION_WORKERS = int(os.environ.get("INTERVIEWAI_EVALUATION_WORKERS", "8"))
+EVALUATION_MAX_PENDING = int(os.environ.get("INTERVIEWAI_EVALUATION_MAX_PENDING", "64"))
+EVALUATION_POLL_SECONDS = float(os.environ.get("INTERVIEWAI_EVALUATION_POLL", "1"))
+
+# Generate all interview questions in one request, optionally re-planning when scores surprise
+INTERVIEW_PLAN_ENABLED = os.environ.get("INTERVIEWAI_INTERVIEW_PLAN", "1") == "1"
+REPLAN_SCORE_DELTA = int(os.environ.get("INTERVIEWAI_REPLAN_SCORE_DELTA", "3"))
+
+# "Answer all, review at end" mode: transcript characters scored per batched request
+BATCH_EVALUATION_MAX_CHARS = int(os.environ.get("INTERVIEWAI_BATCH_EVALUATION_MAX_CHARS", "24000"))
+
+# Number of extracted resumes kept in memory, keyed by a hash of the uploaded bytes
+RESUME_EXTRACTION_CACHE_ENTRIES = int(os.environ.get("INTERVIEWAI_EXTRACTION_CACHE_ENTRIES", "256"))
+
+# Number of rendered PDF reports kept in memory, keyed by a hash of their contents
+REPORT_CACHE_ENTRIES = int(os.environ.get("INTERVIEWAI_REPORT_CACHE_ENTRIES", "128"))
+
+# Shared cache for resume analyses, keyed by a hash of the normalized resume text, the role and the model
+RESUME_ANALYSIS_CACHE_TTL_SECONDS = int(os.environ.get("INTERVIEWAI_RESUME_CACHE_TTL", str(30 * 24 * 3600)))
+RESUME_ANALYSIS_CACHE_MAX_ENTRIES = int(os.environ.get("INTERVIEWAI_RESUME_CACHE_MAX_ENTRIES", "2000"))
+
+# Interview sessions persisted under a token in the URL so they survive restarts and reconnects
+SESSION_PERSISTENCE = os.environ.get("INTERVIEWAI_SESSION_PERSISTENCE", "1") == "1"
+SESSION_TTL_SECONDS = int(os.environ.get("INTERVIEWAI_SESSION_TTL", str(7 * 24 * 3600)))
+SESSION_QUERY_PARAM = "session"
+PERSISTED_SESSION_KEYS = (
+    'stage', 'selected_job', 'company_name', 'resume_text', 'resume_analysis', 'interview_questions',
+    'current_question_num', 'conversation_history', 'current_question', 'answer_submitted', 'current_answer',
+    'current_feedback', 'evaluation_pending', 'feedback_mode', 'interview_plan', 'adaptive_replanning',
+    'interview_memory'
+)
 
 # System prompts for different agents
 RESUME_ANALYSIS_PROMPT = """
@@ -744,23 +134,6 @@ Analyze the provided resume content and extract:
 Provide actionable insights that can be used to tailor interview questions and assess candidate fit.
 """
 
-INTERVIEW_QUESTIONS_SCRAPER_PROMPT = """
-You are an expert interview preparation specialist with deep knowledge of recruitment processes across industries.
-Your role is to research and compile comprehensive interview questions for specific companies and job roles.
-
-When given a company name and job role, use web search to find:
-1. Company-specific interview questions and experiences
-2. Technical questions relevant to the role
-3. Behavioral questions commonly asked
-4. Company culture and value-based questions
-5. Role-specific scenarios and case studies
-6. Recent interview experiences shared by candidates
-7. Questions about company products, services, and challenges
-
-Compile this information into a structured format categorized by question type (technical, behavioral, company-specific, etc.).
-Focus on authentic, recently reported interview questions rather than generic ones.
-"""
-
 INTERVIEW_CONDUCTOR_PROMPT = """
 You are an experienced interview conductor and career coach with expertise in conducting professional interviews across various industries.
 Your role is to conduct realistic, adaptive mock interviews that help candidates prepare effectively.
@@ -777,153 +150,415 @@ Based on the candidate's resume analysis and researched company questions, condu
 Be encouraging but realistic, and provide specific suggestions for improvement.
 """
 
+def model_error_message(action, error):
+    """Describe a failed model call for the user, telling rate limiting apart from other errors."""
+    if is_overload(error):
+        return f"🚦 The AI service is busy right now, so {action} did not finish. Please try again in a moment."
+    return f"🚨 Error {action}: {error}"
+
 @st.cache_resource
 def get_resume_agent():
     """Initialize and cache the resume analysis agent."""
     try:
-        return Agent(
-            model=Gemini(id="gemini-2.0-flash-exp", api_key=GOOGLE_API_KEY),
-            system_prompt=RESUME_ANALYSIS_PROMPT,
-            markdown=True,
-        )
+        with tracer.trace("get_resume_agent", model=GEMINI_MODEL_ID):
+            return create_agent(
+                GOOGLE_API_KEY,
+                system_prompt=RESUME_ANALYSIS_PROMPT,
+                response_model=ResumeAnalysis,
+            )
     except Exception as e:
         st.error(f"❌ Error initializing resume agent: {e}")
         return None
 
 @st.cache_resource
 def get_questions_agent():
-    """Initialize and cache the interview questions scraper agent."""
+    """Initialize and cache the research agent, the only profile with web search tools.
+
+    Requests run on a copy of this agent (see ``research.run_research``) so the
+    tool-call limit applies per request.
+    """
     try:
-        return Agent(
-            model=Gemini(id="gemini-2.0-flash-exp", api_key=GOOGLE_API_KEY),
-            system_prompt=INTERVIEW_QUESTIONS_SCRAPER_PROMPT,
-            tools=[TavilyTools(api_key=TAVILY_API_KEY)],
-            markdown=True,
-        )
+        with tracer.trace("get_questions_agent", model=GEMINI_MODEL_ID):
+            return create_research_agent(GOOGLE_API_KEY, TAVILY_API_KEY)
     except Exception as e:
         st.error(f"❌ Error initializing questions agent: {e}")
         return None
 
 @st.cache_resource
 def get_interview_agent():
-    """Initialize and cache the interview conductor agent."""
+    """Initialize and cache the tool-free interview conductor agent.
+
+    Questions and evaluations already receive the researched questions in
+    their prompts, so this profile never triggers web searches mid-interview.
+    """
     try:
-        return Agent(
-            model=Gemini(id="gemini-2.0-flash-exp", api_key=GOOGLE_API_KEY),
-            system_prompt=INTERVIEW_CONDUCTOR_PROMPT,
-            tools=[TavilyTools(api_key=TAVILY_API_KEY)],
-            markdown=True,
-        )
+        with tracer.trace("get_interview_agent", model=GEMINI_MODEL_ID):
+            return create_agent(
+                GOOGLE_API_KEY,
+                system_prompt=INTERVIEW_CONDUCTOR_PROMPT,
+                markdown=True,
+            )
     except Exception as e:
         st.error(f"❌ Error initializing interview agent: {e}")
         return None
 
-def extract_text_from_pdf(file):
-    """Extract text from PDF file."""
+@st.cache_resource
+def get_answer_evaluation_agent():
+    """Initialize and cache the agent that scores a single answer."""
     try:
-        reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
+        with tracer.trace("get_answer_evaluation_agent", model=GEMINI_MODEL_ID):
+            return create_agent(
+                GOOGLE_API_KEY,
+                system_prompt=INTERVIEW_CONDUCTOR_PROMPT,
+                response_model=TurnEvaluation,
+            )
     except Exception as e:
-        st.error(f"Error reading PDF: {e}")
+        st.error(f"❌ Error initializing answer evaluation agent: {e}")
         return None
 
-def extract_text_from_docx(file):
-    """Extract text from DOCX file."""
+@st.cache_resource
+def get_transcript_evaluation_agent():
+    """Initialize and cache the agent that scores a whole interview transcript at once."""
     try:
-        doc = docx.Document(file)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text.strip()
+        with tracer.trace("get_transcript_evaluation_agent", model=GEMINI_MODEL_ID):
+            return create_agent(
+                GOOGLE_API_KEY,
+                system_prompt=INTERVIEW_CONDUCTOR_PROMPT,
+                response_model=TranscriptEvaluation,
+            )
     except Exception as e:
-        st.error(f"Error reading DOCX: {e}")
+        st.error(f"❌ Error initializing transcript evaluation agent: {e}")
         return None
 
-def extract_text_from_txt(file):
-    """Extract text from TXT file."""
+@st.cache_resource
+def get_interview_plan_agent():
+    """Initialize and cache the agent that plans the interview questions up front."""
     try:
-        return str(file.read(), "utf-8")
+        with tracer.trace("get_interview_plan_agent", model=GEMINI_MODEL_ID):
+            return create_agent(
+                GOOGLE_API_KEY,
+                system_prompt=INTERVIEW_CONDUCTOR_PROMPT,
+                response_model=InterviewPlan,
+            )
     except Exception as e:
-        st.error(f"Error reading TXT: {e}")
+        st.error(f"❌ Error initializing interview plan agent: {e}")
         return None
 
-def analyze_resume(resume_text, job_role):
-    """Analyze resume content using AI."""
-    agent = get_resume_agent()
-    if agent is None:
-        return None
+# Resume formats by upload MIME type: label for error messages and text extractor
+RESUME_EXTRACTORS = {
+    "application/pdf": ("PDF", extraction.extract_pdf_text),
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ("DOCX", extraction.extract_docx_text),
+}
+TEXT_EXTRACTOR = ("TXT", extraction.extract_txt_text)
 
-    try:
-        with st.spinner("🔍 Analyzing your resume..."):
-            prompt = f"""
+@st.cache_data(max_entries=RESUME_EXTRACTION_CACHE_ENTRIES, show_spinner=False)
+def extract_resume_text(content_hash, file_type, _file_bytes):
+    """Extract text from an uploaded resume, memoized by a hash of its bytes.
+
+    The raw bytes are excluded from Streamlit's argument hashing; the
+    ``content_hash`` identifies the upload, so reruns and repeat uploads of
+    the same file skip parsing entirely. Extraction errors propagate rather
+    than being cached, so uploading the file again retries it.
+    """
+    _, extract = RESUME_EXTRACTORS.get(file_type, TEXT_EXTRACTOR)
+    return extract(_file_bytes)
+
+def build_resume_analysis_prompt(resume_text, job_role):
+    """Build the resume analysis prompt."""
+    return f"""
             Analyze this resume for a {job_role} position:
             
             Resume Content:
             {resume_text}
             
-            Provide a comprehensive analysis including:
-            - Key strengths and skills
-            - Experience level assessment
-            - Areas for improvement
-            - Fit for {job_role} role
-            - Specific technical/domain expertise
+            Provide:
+            - Key technical and domain skills, most relevant to {job_role} first
+            - Seniority level (entry, mid, senior or lead)
+            - Key strengths and notable achievements
+            - Gaps or areas for improvement for a {job_role} role
+            - A short assessment of fit for the {job_role} role
             """
-            response = agent.run(prompt)
-            return response.content.strip()
-    except Exception as e:
-        st.error(f"🚨 Error analyzing resume: {e}")
-        return None
 
-def scrape_interview_questions(company_name, job_role):
-    """Scrape interview questions for specific company and role."""
-    agent = get_questions_agent()
-    if agent is None:
+def run_model_call(call_name, agent, prompt, priority=INTERACTIVE, parse=None):
+    """Run a traced prompt on a copy of an agent under the call's deadline, retry and hedging policy.
+
+    Agents are shared by every session, and a phidata run keeps its memory
+    and response on the agent, so each attempt runs on its own copy, whose
+    model requests each hold a limiter slot. ``parse`` turns the response into the
+    result inside the attempt, so malformed structured output is retried
+    too. Background calls are never hedged.
+    """
+    def attempt():
+        response = tracer.run(call_name, copy_agent(agent, priority), prompt)
+        return parse(response) if parse else response
+
+    hedge_after = None
+    if HEDGING_ENABLED and priority == INTERACTIVE:
+        hedge_after = tracer.latency_percentile(call_name, 0.95, HEDGE_MIN_SAMPLES)
+    return call_with_policy(call_name, attempt, CALL_POLICIES[call_name], hedge_after)
+
+def run_agent_prompt(agent, prompt, call_name, priority=INTERACTIVE):
+    """Run a prompt and return the stripped response text with elapsed seconds."""
+    started = time.perf_counter()
+    response = run_model_call(call_name, agent, prompt, priority)
+    return response.content.strip(), time.perf_counter() - started
+
+def run_resume_analysis(agent, prompt):
+    """Analyze a resume and return the profile as a plain dict for session state, with elapsed seconds."""
+    started = time.perf_counter()
+    profile = run_model_call(
+        "analyze_resume", agent, prompt, parse=lambda response: parse_structured_response(response.content, ResumeAnalysis)
+    )
+    return profile.model_dump(), time.perf_counter() - started
+
+@st.cache_resource
+def get_storage():
+    """Open and cache the storage shared by the caches and the session store."""
+    return open_configured_storage()
+
+@st.cache_resource
+def get_research_cache():
+    """Initialize and cache the shared interview question research cache."""
+    cache = open_research_cache(get_storage())
+    tracer.add_collector(lambda: cache_metrics("interview_questions", cache.stats()))
+    return cache
+
+@st.cache_resource
+def get_resume_analysis_cache():
+    """Initialize and cache the shared resume analysis cache."""
+    cache = PersistentCache(
+        get_storage(),
+        namespace="resume_analysis",
+        ttl_seconds=RESUME_ANALYSIS_CACHE_TTL_SECONDS,
+        max_entries=RESUME_ANALYSIS_CACHE_MAX_ENTRIES,
+    )
+    tracer.add_collector(lambda: cache_metrics("resume_analysis", cache.stats()))
+    return cache
+
+@st.cache_resource
+def get_session_store():
+    """Initialize and cache the session store, or None when persistence is disabled."""
+    if not SESSION_PERSISTENCE:
         return None
+    store = SessionStore(get_storage(), ttl_seconds=SESSION_TTL_SECONDS)
+    tracer.add_collector(lambda: session_metrics(store.stats()))
+    return store
+
+def session_metrics(stats):
+    """Describe session store counters for the metrics endpoint."""
+    return [
+        ("interviewai_session_restores_total", "counter", "Sessions restored from the session store.", [({}, stats["restores"])]),
+        ("interviewai_session_writes_total", "counter", "Incremental session checkpoints written.", [({}, stats["writes"])]),
+        ("interviewai_session_keys_written_total", "counter", "State keys written by session checkpoints.", [({}, stats["keys_written"])]),
+    ]
 
+def restore_session():
+    """Start this browser session, restoring a saved interview when the URL carries its token.
+
+    The token doubles as the session id and is written to the URL so a
+    reload, reconnect or server restart finds the same interview again.
+    """
+    token = st.query_params.get(SESSION_QUERY_PARAM)
+    store = get_session_store()
+    digests = {}
+    if store is not None and valid_token(token):
+        try:
+            saved = store.load(token)
+        except Exception:
+            saved = {}
+        st.session_state.update(saved)
+        # Everything just loaded is already stored; only later changes need writing
+        changed_values(saved, saved.keys(), digests)
+    else:
+        token = uuid.uuid4().hex
+    st.session_state.session_id = token
+    st.session_state.persisted_digests = digests
+    if store is not None:
+        st.query_params[SESSION_QUERY_PARAM] = token
+
+def checkpoint_session():
+    """Write the session keys that changed since the last checkpoint.
+
+    Values only change on stage transitions and answers, so most reruns
+    write nothing and the rest write a handful of keys, never the whole
+    session.
+    """
+    store = get_session_store()
+    if store is None or 'persisted_digests' not in st.session_state:
+        return
+    digests = dict(st.session_state.persisted_digests)
+    changes = changed_values(st.session_state, PERSISTED_SESSION_KEYS, digests)
+    if not changes:
+        return
     try:
-        with st.spinner(f"🌐 Researching interview questions for {company_name}..."):
-            prompt = f"""
-            Research and compile comprehensive interview questions for:
-            Company: {company_name}
-            Job Role: {job_role}
-            
-            Find and organize:
-            1. Company-specific interview questions
-            2. Technical questions for {job_role}
-            3. Behavioral questions
-            4. Culture and values-based questions
-            5. Recent candidate experiences
-            
-            Focus on authentic, recently reported questions from reliable sources.
-            """
-            response = agent.run(prompt)
-            return response.content.strip()
-    except Exception as e:
-        st.error(f"🚨 Error scraping interview questions: {e}")
-        return None
+        store.save(st.session_state.session_id, changes)
+    except Exception:
+        # Persistence is best effort; the interview carries on in memory
+        return
+    st.session_state.persisted_digests = digests
 
-def conduct_interview_session(resume_analysis, interview_questions, job_role, company_name, question_number, conversation_history):
-    """Conduct the interview session."""
-    agent = get_interview_agent()
-    if agent is None:
+def cache_metrics(name, stats):
+    """Describe cache hit/miss counters for the metrics endpoint."""
+    return [
+        ("interviewai_cache_hits_total", "counter", "Cache hits by cache.", [({"cache": name}, stats["hits"])]),
+        ("interviewai_cache_misses_total", "counter", "Cache misses by cache.", [({"cache": name}, stats["misses"])]),
+        ("interviewai_cache_errors_total", "counter", "Cache reads and writes that failed in storage.", [({"cache": name}, stats["errors"])]),
+        ("interviewai_cache_entries", "gauge", "Entries currently stored by cache.", [({"cache": name}, stats["entries"])]),
+    ]
+
+def resume_analysis_cache_key(resume_text, job_role):
+    """Build the resume analysis cache key from the normalized resume text, the role and the model id.
+
+    Only a digest of the resume is kept in the key, and case or whitespace
+    differences between extractions of the same resume still hit.
+    """
+    resume_digest = hashlib.sha256(normalize_key(resume_text).encode("utf-8")).hexdigest()
+    return normalize_key(resume_digest, job_role, GEMINI_MODEL_ID)
+
+def analyze_resume_into_cache(agent, resume_text, job_role, cache):
+    """Analyze a resume, storing the profile in the shared cache; returns the profile with elapsed seconds."""
+    profile, elapsed = run_resume_analysis(agent, build_resume_analysis_prompt(resume_text, job_role))
+    cache.set(resume_analysis_cache_key(resume_text, job_role), profile)
+    return profile, elapsed
+
+def get_cached_preparation(resume_text, job_role, company_name):
+    """Return the cached ``(resume_analysis, interview_questions)``, or None unless both are warm."""
+    if not (resume_text and job_role and company_name):
+        return None
+    resume_analysis = get_resume_analysis_cache().get(resume_analysis_cache_key(resume_text, job_role))
+    if not resume_analysis:
+        return None
+    interview_questions = get_research_cache().get(research_cache_key(company_name, job_role))
+    if not interview_questions:
         return None
+    return resume_analysis, interview_questions
 
-    try:
-        prompt = f"""
+def invalidate_cached_preparation(resume_text, job_role, company_name):
+    """Drop the cached resume analysis and research for a resume/role/company so the next preparation recomputes them."""
+    get_resume_analysis_cache().invalidate(resume_analysis_cache_key(resume_text, job_role))
+    get_research_cache().invalidate(research_cache_key(company_name, job_role))
+
+def get_cached_interview_questions(agent, company_name, job_role, cache):
+    """Return cached research for a company/role pair, refreshing it in the background when it is ageing."""
+    return cache.get(
+        research_cache_key(company_name, job_role),
+        refresh=lambda: run_research(agent, company_name, job_role)[0],
+    )
+
+def run_tracking_queue_wait(func, *args):
+    """Run ``func(*args)`` and return its result with the seconds it spent queued for model capacity."""
+    with track_queue_wait() as queued:
+        result = func(*args)
+    return result, queued["seconds"]
+
+@st.cache_resource
+def get_preparation_executor():
+    """Initialize and cache the thread pool shared by all preparation pipelines."""
+    return ThreadPoolExecutor(max_workers=PREPARATION_MAX_WORKERS, thread_name_prefix="preparation")
+
+def prepare_interview_materials(resume_text, job_role, company_name):
+    """Analyze the resume and research interview questions concurrently.
+
+    Both agent calls are submitted together and their progress is reported as
+    each finishes, so the wait is roughly the slower of the two calls rather
+    than their sum. The resume analysis and question research are each
+    served straight from their shared cache when it is warm. Returns a ``(resume_analysis, interview_questions)`` tuple,
+    the analysis being a ``ResumeAnalysis`` dict; an entry is None when its call failed.
+    """
+    resume_agent = get_resume_agent()
+    questions_agent = get_questions_agent()
+    if resume_agent is None or questions_agent is None:
+        return None, None
+
+    resume_cache = get_resume_analysis_cache()
+    research_cache = get_research_cache()
+    tasks = {
+        "resume_analysis": (
+            "🔍 Analyzing your resume",
+            analyze_resume_into_cache,
+            (resume_agent, resume_text, job_role, resume_cache),
+        ),
+        "interview_questions": (
+            f"🌐 Researching interview questions for {company_name}",
+            research_interview_questions,
+            (questions_agent, company_name, job_role, research_cache),
+        ),
+    }
+    results = {name: None for name in tasks}
+
+    with st.status("⚡ Preparing your interview...", expanded=True) as status:
+        progress = {name: st.empty() for name in tasks}
+        executor = get_preparation_executor()
+        futures = {}
+        cached = {
+            "resume_analysis": resume_cache.get(resume_analysis_cache_key(resume_text, job_role)),
+            "interview_questions": get_cached_interview_questions(questions_agent, company_name, job_role, research_cache),
+        }
+        for name, value in cached.items():
+            if value:
+                results[name] = value
+                progress[name].markdown(f"⚡ {tasks[name][0]} — loaded from cache")
+                del tasks[name]
+        for name, (label, func, args) in tasks.items():
+            futures[executor.submit(run_tracking_queue_wait, func, *args)] = name
+            progress[name].markdown(f"{label}...")
+
+        for future in as_completed(futures):
+            name = futures[future]
+            label = tasks[name][0]
+            try:
+                (content, elapsed, *tool_calls), queued = future.result()
+                results[name] = content
+                searches = f", {tool_calls[0]} web searches" if tool_calls else ""
+                waited = f", {queued:.1f}s queued for capacity" if queued >= 0.05 else ""
+                progress[name].markdown(f"✅ {label} — done in {elapsed:.1f}s{searches}{waited}")
+            except Exception as e:
+                progress[name].markdown(f"❌ {label} — failed")
+                st.error(model_error_message(f"preparing {name.replace('_', ' ')}", e))
+
+        for cache_name, cache in (("Resume cache", resume_cache), ("Research cache", research_cache)):
+            cache_stats = cache.stats()
+            st.caption(
+                f"{cache_name}: {cache_stats['hits']} hits / {cache_stats['misses']} misses, "
+                f"{cache_stats['entries']} entries"
+            )
+        if all(results.values()):
+            status.update(label="🎉 Preparation complete!", state="complete", expanded=False)
+        else:
+            status.update(label="🚨 Preparation failed", state="error", expanded=True)
+
+    return results["resume_analysis"], results["interview_questions"]
+
+def build_interview_question_prompt(resume_analysis, interview_questions, job_role, company_name, question_number, conversation_history, memory=None):
+    """Build the prompt asking the conductor for the next interview question.
+
+    The resume facts, the researched questions most relevant to the resume
+    gaps and latest answer, and the history are assembled within fixed token
+    budgets by ``build_context``; the running interview ``memory`` replaces
+    the raw history when there is one.
+    """
+    context = build_context(
+        "interview_question",
+        resume_analysis,
+        interview_questions,
+        conversation_history,
+        focus=f"{job_role} {company_name}",
+        memory=memory,
+        question_bank=bank
+    )
+    return f"""
         You are conducting a mock interview for a {job_role} position at {company_name}.
         
         Candidate Profile Summary:
-        {resume_analysis[:500]}...
+        {context['profile']}
         
         Available Interview Questions Research:
-        {interview_questions[:1000]}...
+        {context['questions']}
         
         Current Interview State:
         - Question Number: {question_number}
-        - Conversation History: {conversation_history}
+        - Answered So Far:
+        {context['history']}
         
         Based on the above information:
         1. If this is question 1, start with a warm welcome and brief company/role introduction
@@ -935,45 +570,551 @@ def conduct_interview_session(resume_analysis, interview_questions, job_role, co
         
         Only provide the question, not the expected answer.
         """
-        
-        response = agent.run(prompt)
-        return response.content.strip()
-    except Exception as e:
-        st.error(f"🚨 Error conducting interview: {e}")
-        return None
-
-def evaluate_answer(question, answer, resume_analysis, job_role):
-    """Evaluate candidate's answer and provide feedback."""
-    agent = get_interview_agent()
-    if agent is None:
-        return None
 
-    try:
-        prompt = f"""
+def build_evaluation_prompt(question, answer, resume_analysis, job_role, memory=None):
+    """Build the prompt asking for feedback on a single answer and the updated interview memory."""
+    memory = memory or {}
+    return f"""
         Evaluate this interview answer:
         
         Question: {question}
         Answer: {answer}
         Job Role: {job_role}
-        Candidate Background: {resume_analysis[:300]}...
+        Candidate Background:
+        {select_profile_facts(resume_analysis, f"{job_role} {question} {answer}")}
+        
+        Interview memory so far:
+        - Topics covered: {', '.join(memory.get('topics_covered') or []) or 'none yet'}
+        - Weaknesses probed: {', '.join(memory.get('weaknesses_probed') or []) or 'none yet'}
         
         Provide:
         1. Score out of 10
         2. Strengths in the answer
         3. Areas for improvement
         4. Specific suggestions
-        5. Whether to continue or dive deeper
+        5. The interview memory updated with this question's topic and any weakness the answer revealed,
+           keeping at most 8 short entries per list by merging or dropping the least important ones
         
         Be constructive and encouraging while being honest about areas for improvement.
         """
+
+def stream_agent_prompt(agent, prompt, timing, call_name):
+    """Yield response text chunks as the model generates them.
+
+    ``timing`` is filled in with the time spent queued for model capacity,
+    the time to first token and the total generation time, all in seconds.
+    A call that fails before its first token is retried with backoff under
+    the call's policy, and the first token must arrive within the policy's
+    deadline; after that, each chunk must follow the last within
+    ``STREAM_IDLE_TIMEOUT``. Once text is on screen a failure is final.
+    """
+    policy = CALL_POLICIES[call_name]
+    deadline = time.monotonic() + policy.deadline
+    timing["ttft"] = None
+    timing["queued"] = 0.0
+    attempt = 1
+    while True:
+        try:
+            with track_queue_wait() as queued:
+                started = time.perf_counter()
+                chunks = stream_with_deadline(
+                    call_name,
+                    lambda: tracer.stream(call_name, copy_agent(agent), prompt),
+                    deadline - time.monotonic(),
+                    STREAM_IDLE_TIMEOUT,
+                )
+                try:
+                    for chunk in chunks:
+                        if isinstance(chunk.content, str) and chunk.content:
+                            if timing["ttft"] is None:
+                                timing["ttft"] = time.perf_counter() - started
+                            yield chunk.content
+                finally:
+                    chunks.close()
+                    timing["queued"] += queued["seconds"]
+            timing["total"] = time.perf_counter() - started
+            return
+        except Exception as e:
+            if timing["ttft"] is not None or attempt >= policy.attempts or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, policy.base_delay, policy.max_delay)
+            if time.monotonic() + delay >= deadline:
+                raise
+            time.sleep(delay)
+            attempt += 1
+
+def run_interview_prompt(agent, prompt, call_name, stream):
+    """Run an interview-stage prompt, streaming tokens into the page when ``stream`` is set."""
+    if not stream:
+        content, _ = run_agent_prompt(agent, prompt, call_name)
+        return content
+
+    timing = {}
+    content = st.write_stream(stream_agent_prompt(agent, prompt, timing, call_name))
+    record_response_timing(call_name, timing)
+    return content.strip() if isinstance(content, str) else "".join(map(str, content)).strip()
+
+def record_response_timing(call_name, timing):
+    """Keep the time-to-first-token measurements of the current session."""
+    if 'response_timings' not in st.session_state:
+        st.session_state.response_timings = []
+    st.session_state.response_timings.append({
+        'call': call_name,
+        'question_num': st.session_state.get('current_question_num'),
+        'queued': timing.get("queued", 0.0),
+        'ttft': timing.get("ttft"),
+        'total': timing.get("total"),
+    })
+
+def show_last_response_timing(call_name):
+    """Show the time to first token of the most recent streamed call of the given kind."""
+    for timing in reversed(st.session_state.get('response_timings', [])):
+        if timing['call'] == call_name and timing['question_num'] == st.session_state.current_question_num:
+            if timing['ttft'] is not None:
+                queued = f"Queued {timing['queued']:.2f}s · " if timing['queued'] >= 0.05 else ""
+                st.caption(f"⏱️ {queued}First token in {timing['ttft']:.2f}s · full response in {timing['total']:.2f}s")
+            return
+
+def conduct_interview_session(resume_analysis, interview_questions, job_role, company_name, question_number, conversation_history, memory=None, stream=False):
+    """Conduct the interview session."""
+    agent = get_interview_agent()
+    if agent is None:
+        return None
+
+    try:
+        prompt = build_interview_question_prompt(
+            resume_analysis, interview_questions, job_role, company_name, question_number, conversation_history, memory
+        )
+        return run_interview_prompt(agent, prompt, "conduct_interview_session", stream)
+    except Exception as e:
+        st.error(model_error_message("conducting interview", e))
+        return None
+
+def run_answer_evaluation(agent, prompt):
+    """Score a single answer and return its ``TurnEvaluation``."""
+    return run_model_call(
+        "evaluate_answer", agent, prompt, parse=lambda response: parse_structured_response(response.content, TurnEvaluation)
+    )
+
+def updated_memory(memory, evaluation):
+    """Return the interview memory after ``evaluation``, keeping the previous one if the model left it out."""
+    return evaluation.memory.model_dump() if evaluation.memory else memory
+
+def evaluate_answer(question, answer, resume_analysis, job_role, memory=None):
+    """Evaluate candidate's answer and return a ``TurnEvaluation``, or None on failure."""
+    agent = get_answer_evaluation_agent()
+    if agent is None:
+        return None
+
+    try:
+        with st.spinner("📝 Evaluating your answer..."):
+            return run_answer_evaluation(agent, build_evaluation_prompt(question, answer, resume_analysis, job_role, memory))
+    except Exception as e:
+        st.error(model_error_message("evaluating answer", e))
+        return None
+
+@st.cache_resource
+def get_question_prefetcher():
+    """Initialize and cache the background pool that prefetches upcoming questions."""
+    return BackgroundJobs(max_workers=PREFETCH_WORKERS, max_pending=PREFETCH_MAX_PENDING, name="prefetch")
+
+def build_session_question_prompt(question_number):
+    """Build the question prompt for ``question_number`` from the current session state."""
+    return build_interview_question_prompt(
+        st.session_state.resume_analysis,
+        st.session_state.interview_questions,
+        st.session_state.selected_job,
+        st.session_state.company_name,
+        question_number,
+        st.session_state.conversation_history,
+        st.session_state.interview_memory
+    )
+
+def build_interview_plan_prompt(resume_analysis, interview_questions, job_role, company_name, conversation_history=None, start=1, memory=None):
+    """Build the prompt for an interview plan covering questions ``start`` to 10.
+
+    When re-planning, a summary of the answered questions and their scores is
+    included so the remaining questions can adapt to the candidate's
+    performance.
+    """
+    context = build_context(
+        "interview_plan",
+        resume_analysis,
+        interview_questions,
+        conversation_history,
+        focus=f"{job_role} {company_name}",
+        memory=memory,
+        questions_tokens=PLAN_QUESTIONS_TOKENS,
+        question_bank=bank,
+        questions_top_k=PLAN_QUESTIONS_TOP_K
+    )
+    progress = ""
+    if conversation_history:
+        progress = f"""
+        Questions already asked and how the candidate scored:
+        {context['history']}
+        
+        Adjust the difficulty of the remaining questions to the candidate's demonstrated level.
+        """
+    count = 10 - start + 1
+    return f"""
+        Plan a mock interview for a {job_role} position at {company_name}.
+        
+        Candidate Profile Summary:
+        {context['profile']}
         
-        response = agent.run(prompt)
-        return response.content.strip()
+        Available Interview Questions Research:
+        {context['questions']}
+        {progress}
+        Produce exactly {count} questions, numbered {start} to 10 in the order they will be asked:
+        1. If the plan starts at question 1, open it with a warm welcome and brief company/role introduction
+        2. Progress from easy to hard and mix technical, behavioral and company-specific questions
+        3. Tailor the questions to the candidate's background from the resume analysis
+        4. For each question, estimate the score out of 10 this candidate is expected to reach
+        
+        Only provide the questions, not the expected answers.
+        """
+
+def run_interview_plan(agent, prompt, priority=INTERACTIVE):
+    """Generate a plan and return its questions as plain dicts for session state."""
+    plan = run_model_call(
+        "plan_interview", agent, prompt, priority, parse=lambda response: parse_structured_response(response.content, InterviewPlan)
+    )
+    return [question.model_dump() for question in plan.questions]
+
+def generate_interview_plan():
+    """Plan all interview questions in one request and store them in session state."""
+    agent = get_interview_plan_agent()
+    if agent is None:
+        return None
+
+    try:
+        with st.spinner("🗂️ Planning your interview..."):
+            return run_interview_plan(agent, build_interview_plan_prompt(
+                st.session_state.resume_analysis,
+                st.session_state.interview_questions,
+                st.session_state.selected_job,
+                st.session_state.company_name
+            ))
     except Exception as e:
-        st.error(f"🚨 Error evaluating answer: {e}")
+        st.warning(f"⚠️ Could not plan the interview up front, questions will be generated one by one: {e}")
         return None
 
+def planned_question(question_number):
+    """Return the planned question for ``question_number``, or None when there is no plan for it."""
+    plan = st.session_state.get('interview_plan') or []
+    if question_number <= len(plan):
+        return plan[question_number - 1]
+    return None
+
+def schedule_replan_if_needed(score):
+    """Re-plan the remaining questions in the background when a score departs from the plan's expectation."""
+    question_number = st.session_state.current_question_num
+    planned = planned_question(question_number)
+    if not st.session_state.adaptive_replanning or planned is None or score is None or question_number >= 10:
+        return
+    if abs(score - planned['expected_score']) < REPLAN_SCORE_DELTA:
+        return
+
+    agent = get_interview_plan_agent()
+    if agent is None:
+        return
+    prompt = build_interview_plan_prompt(
+        st.session_state.resume_analysis,
+        st.session_state.interview_questions,
+        st.session_state.selected_job,
+        st.session_state.company_name,
+        conversation_history=st.session_state.conversation_history,
+        start=question_number + 1,
+        memory=st.session_state.interview_memory
+    )
+    get_question_prefetcher().submit(
+        (st.session_state.session_id, 'replan'),
+        run_interview_plan,
+        agent,
+        prompt,
+        BACKGROUND,
+        fingerprint=question_number
+    )
+
+def apply_replanned_questions():
+    """Swap in re-planned remaining questions once the background re-plan has finished."""
+    key = (st.session_state.session_id, 'replan')
+    prefetcher = get_question_prefetcher()
+    if prefetcher.status(key) == "missing":
+        return
+
+    replanned_after = st.session_state.current_question_num - 1
+    questions = prefetcher.take(key, fingerprint=replanned_after, timeout=PREFETCH_WAIT_SECONDS)
+    prefetcher.discard(key)
+    if questions:
+        st.session_state.interview_plan = st.session_state.interview_plan[:replanned_after] + questions
+
+def prompt_fingerprint(prompt):
+    """Hash a prompt so background results can be matched to the state they were built from."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+def submit_question_prefetch(prefetcher, agent, session_id, question_number, prompt):
+    """Queue background generation of a question, keyed by session and question number."""
+    if question_number > 10 or agent is None:
+        return False
+    return prefetcher.submit(
+        (session_id, question_number),
+        lambda: run_agent_prompt(agent, prompt, "conduct_interview_session", BACKGROUND)[0],
+        fingerprint=prompt_fingerprint(prompt)
+    )
+
+def prefetch_next_question():
+    """Start generating the next question in the background while feedback is being read.
+
+    The job is keyed by session and question number and fingerprinted by its
+    prompt, so it is only served if the interview state it was built from is
+    still current.
+    """
+    question_number = st.session_state.current_question_num + 1
+    if question_number > 10 or planned_question(question_number):
+        return
+    submit_question_prefetch(
+        get_question_prefetcher(),
+        get_interview_agent(),
+        st.session_state.session_id,
+        question_number,
+        build_session_question_prompt(question_number)
+    )
+
+def take_prefetched_question():
+    """Return the prefetched current question, or None when it is stale, failed or missing."""
+    key = (st.session_state.session_id, st.session_state.current_question_num)
+    prefetcher = get_question_prefetcher()
+    if prefetcher.status(key) == "missing":
+        return None
+
+    prompt = build_session_question_prompt(st.session_state.current_question_num)
+    question = prefetcher.take(
+        key,
+        fingerprint=prompt_fingerprint(prompt),
+        timeout=PREFETCH_WAIT_SECONDS
+    )
+    prefetcher.discard(key)
+    return question
+
+@st.cache_resource
+def get_evaluation_queue():
+    """Initialize and cache the bounded pool that evaluates submitted answers."""
+    return BackgroundJobs(max_workers=EVALUATION_WORKERS, max_pending=EVALUATION_MAX_PENDING, name="evaluation")
+
+def enqueue_answer_evaluation(answer):
+    """Queue evaluation of the current answer; returns False when the queue is full.
+
+    The job also prefetches the next question as soon as the feedback it
+    depends on is available, from a snapshot of the conversation history.
+    """
+    agent = get_answer_evaluation_agent()
+    if agent is None:
+        return False
+
+    question_number = st.session_state.current_question_num
+    entry = {
+        'question_num': question_number,
+        'question': st.session_state.current_question,
+        'answer': answer,
+        'feedback': None,
+        'score': None
+    }
+    history = list(st.session_state.conversation_history)
+    question_inputs = (
+        st.session_state.resume_analysis,
+        st.session_state.interview_questions,
+        st.session_state.selected_job,
+        st.session_state.company_name
+    )
+    memory = st.session_state.interview_memory
+    prompt = build_evaluation_prompt(
+        st.session_state.current_question, answer, st.session_state.resume_analysis, st.session_state.selected_job, memory
+    )
+    prefetcher = get_question_prefetcher()
+    interview_agent = get_interview_agent()
+    session_id = st.session_state.session_id
+    prefetch = planned_question(question_number + 1) is None
+
+    def evaluate_and_prefetch():
+        evaluation = run_answer_evaluation(agent, prompt)
+        if prefetch:
+            snapshot = history + [dict(entry, feedback=evaluation.to_markdown(), score=evaluation.score)]
+            submit_question_prefetch(
+                prefetcher,
+                interview_agent,
+                session_id,
+                question_number + 1,
+                build_interview_question_prompt(
+                    *question_inputs, question_number + 1, snapshot, updated_memory(memory, evaluation)
+                )
+            )
+        return evaluation
+
+    if not get_evaluation_queue().submit((session_id, question_number), evaluate_and_prefetch):
+        return False
+    st.session_state.conversation_history.append(entry)
+    return True
+
+@st.fragment(run_every=EVALUATION_POLL_SECONDS)
+def poll_answer_evaluation():
+    """Show the pending state of a queued evaluation and pick up its feedback once finished."""
+    key = (st.session_state.session_id, st.session_state.current_question_num)
+    evaluations = get_evaluation_queue()
+    status = evaluations.status(key)
+    if status == "pending":
+        st.info("⏳ Evaluating your answer...")
+        return
+
+    if status == "done":
+        evaluation = evaluations.take(key)
+    else:
+        # Drop the failed job so a resubmitted answer starts a fresh one
+        evaluations.discard(key)
+        evaluation = None
+    st.session_state.evaluation_pending = False
+    if evaluation:
+        st.session_state.current_feedback = evaluation.to_markdown()
+        for entry in st.session_state.conversation_history:
+            if entry['question_num'] == key[1]:
+                entry['feedback'] = st.session_state.current_feedback
+                entry['score'] = evaluation.score
+        st.session_state.interview_memory = updated_memory(st.session_state.interview_memory, evaluation)
+        schedule_replan_if_needed(evaluation.score)
+    else:
+        # Let the candidate resubmit the same answer
+        st.session_state.answer_submitted = False
+        st.session_state.conversation_history = [
+            entry for entry in st.session_state.conversation_history if entry['question_num'] != key[1]
+        ]
+        st.session_state.evaluation_error = "🚨 Error evaluating answer. Please submit it again."
+    st.rerun(scope="app")
+
+def chunk_transcript(conversation_history, max_chars):
+    """Split answered questions into chunks whose combined text stays within ``max_chars``."""
+    chunks = []
+    current = []
+    size = 0
+    for entry in conversation_history:
+        entry_size = len(entry['question']) + len(entry['answer'])
+        if current and size + entry_size > max_chars:
+            chunks.append(current)
+            current = []
+            size = 0
+        current.append(entry)
+        size += entry_size
+    if current:
+        chunks.append(current)
+    return chunks
+
+def build_transcript_evaluation_prompt(entries, resume_analysis, job_role):
+    """Build the prompt asking for an evaluation of every answer in a transcript chunk."""
+    transcript = "\n\n".join(
+        f"Question {entry['question_num']}: {entry['question']}\nAnswer {entry['question_num']}: {entry['answer']}"
+        for entry in entries
+    )
+    return f"""
+        Evaluate every answer in this mock interview transcript:
+        
+        Job Role: {job_role}
+        Candidate Background:
+        {select_profile_facts(resume_analysis, f"{job_role} {transcript}")}
+        
+        Transcript:
+        {transcript}
+        
+        For each question number, provide:
+        1. Score out of 10
+        2. Strengths in the answer
+        3. Areas for improvement
+        4. Specific suggestions
+        
+        Be constructive and encouraging while being honest about areas for improvement.
+        """
+
+def parse_structured_response(content, response_model):
+    """Return ``content`` as ``response_model``, parsing it if the agent fell back to raw JSON text."""
+    if isinstance(content, response_model):
+        return content
+    return response_model.model_validate_json(str(content).strip().removeprefix("```json").removesuffix("```"))
+
+def run_transcript_evaluation(agent, prompt):
+    """Score a transcript chunk and return the evaluations keyed by question number."""
+    result = run_model_call(
+        "evaluate_interview_transcript",
+        agent,
+        prompt,
+        parse=lambda response: parse_structured_response(response.content, TranscriptEvaluation)
+    )
+    return {evaluation.question_num: evaluation for evaluation in result.evaluations}
+
+def evaluate_interview_transcript(conversation_history, resume_analysis, job_role):
+    """Evaluate all collected answers in one batched request per transcript chunk.
+
+    Long transcripts are split so each request stays within
+    ``BATCH_EVALUATION_MAX_CHARS``; chunks are scored concurrently. Answers
+    the batched response left out are evaluated individually. Feedback and
+    scores are written into the ``conversation_history`` entries in place.
+    """
+    agent = get_transcript_evaluation_agent()
+    if agent is None:
+        return False
+
+    evaluations = {}
+    with st.status("📝 Reviewing your interview...", expanded=True) as status:
+        chunks = chunk_transcript(conversation_history, BATCH_EVALUATION_MAX_CHARS)
+        executor = get_preparation_executor()
+        futures = [
+            executor.submit(run_transcript_evaluation, agent, build_transcript_evaluation_prompt(chunk, resume_analysis, job_role))
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            try:
+                evaluations.update(future.result())
+            except Exception as e:
+                st.warning(f"⚠️ Part of the batched review failed, evaluating those answers individually: {e}")
+
+        for entry in conversation_history:
+            evaluation = evaluations.get(entry['question_num'])
+            if evaluation is None:
+                evaluation = evaluate_answer(entry['question'], entry['answer'], resume_analysis, job_role)
+            entry['feedback'] = evaluation.to_markdown() if evaluation else None
+            entry['score'] = evaluation.score if evaluation else None
+
+        if all(entry['feedback'] for entry in conversation_history):
+            status.update(label="🎉 Review complete!", state="complete", expanded=False)
+            return True
+        status.update(label="🚨 Some answers could not be reviewed", state="error", expanded=True)
+        return False
+
+@st.cache_data(max_entries=REPORT_CACHE_ENTRIES, show_spinner=False)
+def render_interview_report(fingerprint, _report):
+    """Render the PDF report, memoized by a hash of its contents.
+
+    The report inputs are excluded from Streamlit's argument hashing; the
+    ``fingerprint`` identifies them, so reruns and repeat downloads of an
+    unchanged transcript reuse the rendered bytes. reportlab is only
+    imported once a report is first needed.
+    """
+    return build_interview_report(**_report)
+
 def main():
+    if METRICS_PORT:
+        start_metrics_server(int(METRICS_PORT))
+
+    # Pick up a saved interview before filling in defaults
+    if 'session_id' not in st.session_state:
+        restore_session()
+
+    try:
+        render_stage()
+    finally:
+        # Also runs when a stage ends with st.rerun(), which is how stages hand over
+        checkpoint_session()
+
+def render_stage():
+    """Render the current stage of the interview flow."""
     # Initialize session state
     if 'stage' not in st.session_state:
         st.session_state.stage = 'job_selection'
@@ -999,6 +1140,16 @@ def main():
         st.session_state.current_answer = ""
     if 'current_feedback' not in st.session_state:
         st.session_state.current_feedback = ""
+    if 'evaluation_pending' not in st.session_state:
+        st.session_state.evaluation_pending = False
+    if 'feedback_mode' not in st.session_state:
+        st.session_state.feedback_mode = 'per_answer'
+    if 'interview_plan' not in st.session_state:
+        st.session_state.interview_plan = None
+    if 'adaptive_replanning' not in st.session_state:
+        st.session_state.adaptive_replanning = False
+    if 'interview_memory' not in st.session_state:
+        st.session_state.interview_memory = None
 
     # Custom Header
     st.markdown("""
@@ -1080,13 +1231,17 @@ def main():
             if uploaded_file:
                 st.success(f"✅ Uploaded: {uploaded_file.name}")
                 
-                # Extract text based on file type
-                if uploaded_file.type == "application/pdf":
-                    resume_text = extract_text_from_pdf(uploaded_file)
-                elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                    resume_text = extract_text_from_docx(uploaded_file)
-                else:
-                    resume_text = extract_text_from_txt(uploaded_file)
+                # Extract text based on file type, reusing earlier extractions of identical bytes
+                file_bytes = uploaded_file.getvalue()
+                try:
+                    resume_text = extract_resume_text(
+                        hashlib.sha256(file_bytes).hexdigest(),
+                        uploaded_file.type,
+                        file_bytes
+                    )
+                except Exception as e:
+                    st.error(f"Error reading {RESUME_EXTRACTORS.get(uploaded_file.type, TEXT_EXTRACTOR)[0]}: {e}")
+                    resume_text = None
                 
                 if resume_text:
                     st.session_state.resume_text = resume_text
@@ -1100,18 +1255,18 @@ def main():
                 st.write("Your resume has been successfully uploaded and is ready for AI analysis.")
                 
                 if st.button("🚀 Analyze Resume & Research Interview Questions", use_container_width=True):
-                    # Analyze resume
-                    resume_analysis = analyze_resume(st.session_state.resume_text, st.session_state.selected_job)
-                    if resume_analysis:
+                    # Analyze resume and research interview questions concurrently
+                    resume_analysis, interview_questions = prepare_interview_materials(
+                        st.session_state.resume_text,
+                        st.session_state.selected_job,
+                        st.session_state.company_name
+                    )
+                    if resume_analysis and interview_questions:
                         st.session_state.resume_analysis = resume_analysis
-                        
-                        # Research interview questions
-                        interview_questions = scrape_interview_questions(st.session_state.company_name, st.session_state.selected_job)
-                        if interview_questions:
-                            st.session_state.interview_questions = interview_questions
-                            st.session_state.stage = 'preparation_complete'
-                            st.success("🎉 Analysis complete! Ready to start your mock interview.")
-                            st.rerun()
+                        st.session_state.interview_questions = interview_questions
+                        st.session_state.stage = 'preparation_complete'
+                        st.success("🎉 Analysis complete! Ready to start your mock interview.")
+                        st.rerun()
             else:
                 st.info("👆 Please upload your resume to proceed")
 
@@ -1125,18 +1280,57 @@ def main():
         with col1:
             st.subheader("📋 Resume Analysis")
             with st.expander("View Detailed Resume Analysis", expanded=True):
-                st.write(st.session_state.resume_analysis)
+                st.markdown(ResumeAnalysis.model_validate(st.session_state.resume_analysis).to_markdown())
         
         with col2:
             st.subheader("❓ Researched Interview Questions")
             with st.expander("View Company Interview Intelligence", expanded=True):
                 st.write(st.session_state.interview_questions)
         
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            if st.button("⬅️ Change Role or Company", use_container_width=True):
+                st.session_state.stage = 'job_selection'
+                st.rerun()
+        with col2:
+            if st.button("♻️ Refresh Analysis", use_container_width=True, help="Discard the cached analysis and research and run them again"):
+                invalidate_cached_preparation(
+                    st.session_state.resume_text,
+                    st.session_state.selected_job,
+                    st.session_state.company_name
+                )
+                resume_analysis, interview_questions = prepare_interview_materials(
+                    st.session_state.resume_text,
+                    st.session_state.selected_job,
+                    st.session_state.company_name
+                )
+                if resume_analysis and interview_questions:
+                    st.session_state.resume_analysis = resume_analysis
+                    st.session_state.interview_questions = interview_questions
+                    st.rerun()
+        
         st.markdown('<h2 class="section-header">🎤 Ready to Start Mock Interview</h2>', unsafe_allow_html=True)
         
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
+            feedback_mode = st.radio(
+                "How would you like your feedback?",
+                ['per_answer', 'review_at_end'],
+                format_func=lambda mode: {
+                    'per_answer': "After each answer",
+                    'review_at_end': "Answer all, review at end"
+                }[mode],
+                horizontal=True,
+                help="Reviewing at the end scores the whole interview in one pass, so you never wait between questions"
+            )
+            adaptive_replanning = st.checkbox(
+                "Adapt upcoming questions to how I'm doing",
+                disabled=not INTERVIEW_PLAN_ENABLED or feedback_mode == 'review_at_end',
+                help="Re-plans the remaining questions when an answer scores well above or below expectations"
+            )
             if st.button("🎯 Start Mock Interview", use_container_width=True):
+                st.session_state.feedback_mode = feedback_mode
+                st.session_state.adaptive_replanning = adaptive_replanning and feedback_mode == 'per_answer'
                 st.session_state.stage = 'interview'
                 st.rerun()
 
@@ -1149,22 +1343,48 @@ def main():
         progress = min(st.session_state.current_question_num / 10, 1.0)
         st.progress(progress, text=f"Question {st.session_state.current_question_num} of 10")
         
+        # Plan the whole interview in one request when it starts
+        if INTERVIEW_PLAN_ENABLED and st.session_state.interview_plan is None:
+            st.session_state.interview_plan = generate_interview_plan() or []
+        
+        # Serve the next planned question, picking up any re-plan of the remaining questions first
+        if not st.session_state.current_question and st.session_state.interview_plan:
+            apply_replanned_questions()
+            planned = planned_question(st.session_state.current_question_num)
+            if planned:
+                st.session_state.current_question = planned['question']
+        
+        # Serve a question prefetched while the previous feedback was being read
+        if not st.session_state.current_question:
+            st.session_state.current_question = take_prefetched_question()
+        
         # Get current question if not available
         if not st.session_state.current_question:
+            if STREAM_RESPONSES:
+                st.subheader(f"Question {st.session_state.current_question_num}:")
             question = conduct_interview_session(
                 st.session_state.resume_analysis,
                 st.session_state.interview_questions,
                 st.session_state.selected_job,
                 st.session_state.company_name,
                 st.session_state.current_question_num,
-                str(st.session_state.conversation_history[-3:])  # Last 3 exchanges
+                st.session_state.conversation_history,
+                st.session_state.interview_memory,
+                stream=STREAM_RESPONSES
             )
             st.session_state.current_question = question
+            if question and STREAM_RESPONSES:
+                # The streamed question is already on screen; rerun to render the answer form
+                st.rerun()
         
         # Display current question
         if st.session_state.current_question:
             st.subheader(f"Question {st.session_state.current_question_num}:")
             st.write(st.session_state.current_question)
+            planned = planned_question(st.session_state.current_question_num)
+            if planned and planned['question'] == st.session_state.current_question:
+                st.caption(f"🗂️ {planned['category'].title()} · difficulty {planned['difficulty']}/5")
+            show_last_response_timing("conduct_interview_session")
             
             # Show answer input only if answer hasn't been submitted
             if not st.session_state.answer_submitted:
@@ -1179,29 +1399,76 @@ def main():
                 col1, col2, col3 = st.columns([1, 1, 1])
                 
                 with col2:
-                    if st.button("Submit Answer", use_container_width=True, disabled=not answer.strip()):
-                        # Evaluate answer
-                        feedback = evaluate_answer(
-                            st.session_state.current_question,
-                            answer,
-                            st.session_state.resume_analysis,
-                            st.session_state.selected_job
-                        )
-                        
-                        # Store the answer and feedback
+                    submitted = st.button("Submit Answer", use_container_width=True, disabled=not answer.strip())
+                
+                if st.session_state.get('evaluation_error'):
+                    st.error(st.session_state.pop('evaluation_error'))
+                
+                if submitted and st.session_state.feedback_mode == 'review_at_end':
+                    # Collect the answer now; every answer is scored together after the last question
+                    st.session_state.conversation_history = [
+                        entry for entry in st.session_state.conversation_history
+                        if entry['question_num'] != st.session_state.current_question_num
+                    ] + [{
+                        'question_num': st.session_state.current_question_num,
+                        'question': st.session_state.current_question,
+                        'answer': answer,
+                        'feedback': None,
+                        'score': None
+                    }]
+                    if st.session_state.current_question_num < 10:
+                        st.session_state.current_question_num += 1
+                        st.session_state.current_question = None
+                        st.rerun()
+                    elif evaluate_interview_transcript(
+                        st.session_state.conversation_history,
+                        st.session_state.resume_analysis,
+                        st.session_state.selected_job
+                    ):
+                        st.session_state.stage = 'interview_complete'
+                        st.rerun()
+                elif submitted and ASYNC_EVALUATION:
+                    # Queue the evaluation and return immediately; feedback is picked up by the poller
+                    if enqueue_answer_evaluation(answer):
                         st.session_state.current_answer = answer
-                        st.session_state.current_feedback = feedback
+                        st.session_state.current_feedback = ""
                         st.session_state.answer_submitted = True
-                        
-                        # Store conversation
-                        st.session_state.conversation_history.append({
-                            'question_num': st.session_state.current_question_num,
-                            'question': st.session_state.current_question,
-                            'answer': answer,
-                            'feedback': feedback
-                        })
-                        
+                        st.session_state.evaluation_pending = True
                         st.rerun()
+                    else:
+                        st.warning("⏳ We're handling a lot of answers right now. Please submit again in a moment.")
+                elif submitted:
+                    # Evaluate answer
+                    evaluation = evaluate_answer(
+                        st.session_state.current_question,
+                        answer,
+                        st.session_state.resume_analysis,
+                        st.session_state.selected_job,
+                        st.session_state.interview_memory
+                    )
+                    feedback = evaluation.to_markdown() if evaluation else None
+                    
+                    # Store the answer and feedback
+                    st.session_state.current_answer = answer
+                    st.session_state.current_feedback = feedback
+                    st.session_state.answer_submitted = True
+                    
+                    # Store conversation
+                    st.session_state.conversation_history.append({
+                        'question_num': st.session_state.current_question_num,
+                        'question': st.session_state.current_question,
+                        'answer': answer,
+                        'feedback': feedback,
+                        'score': evaluation.score if evaluation else None
+                    })
+                    
+                    # Start on the next question while the feedback is being read
+                    if evaluation:
+                        st.session_state.interview_memory = updated_memory(st.session_state.interview_memory, evaluation)
+                        schedule_replan_if_needed(evaluation.score)
+                        prefetch_next_question()
+                    
+                    st.rerun()
             
             # Show feedback and next question button if answer has been submitted
             if st.session_state.answer_submitted:
@@ -1213,7 +1480,10 @@ def main():
                 
                 # Display feedback
                 with st.expander("📝 Feedback on Your Answer", expanded=True):
-                    st.write(st.session_state.current_feedback)
+                    if st.session_state.evaluation_pending:
+                        poll_answer_evaluation()
+                    else:
+                        st.markdown(st.session_state.current_feedback)
                 
                 # Navigation buttons
                 col1, col2, col3 = st.columns([1, 1, 1])
@@ -1221,7 +1491,7 @@ def main():
                 with col2:
                     # Move to next question or finish interview
                     if st.session_state.current_question_num < 10:
-                        if st.button("➡️ Next Question", use_container_width=True):
+                        if st.button("➡️ Next Question", use_container_width=True, disabled=st.session_state.evaluation_pending):
                             # Reset for next question
                             st.session_state.current_question_num += 1
                             st.session_state.current_question = None
@@ -1230,7 +1500,7 @@ def main():
                             st.session_state.current_feedback = ""
                             st.rerun()
                     else:
-                        if st.button("🏁 Finish Interview", use_container_width=True):
+                        if st.button("🏁 Finish Interview", use_container_width=True, disabled=st.session_state.evaluation_pending):
                             st.session_state.stage = 'interview_complete'
                             st.rerun()
         
@@ -1241,7 +1511,10 @@ def main():
                 with st.expander(f"Question {entry['question_num']}", expanded=False):
                     st.write(f"**Q:** {entry['question']}")
                     st.write(f"**A:** {entry['answer']}")
-                    st.write(f"**Feedback:** {entry['feedback']}")
+                    if st.session_state.feedback_mode == 'review_at_end':
+                        st.caption("📝 Feedback will be shared once you finish the interview.")
+                    else:
+                        st.write(f"**Feedback:** {entry['feedback'] or '⏳ Evaluating...'}")
 
     # Stage 5: Interview Complete
     elif st.session_state.stage == 'interview_complete':
@@ -1251,9 +1524,22 @@ def main():
         
         st.markdown('<h2 class="section-header">📊 Interview Summary</h2>', unsafe_allow_html=True)
         
+        # Aggregate the structured scores; no extra model call needed
+        scored = [entry for entry in st.session_state.conversation_history if entry.get('score') is not None]
+        if scored:
+            best = max(scored, key=lambda entry: entry['score'])
+            weakest = min(scored, key=lambda entry: entry['score'])
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Average Score", f"{sum(entry['score'] for entry in scored) / len(scored):.1f}/10")
+            col2.metric("Strongest Answer", f"Q{best['question_num']}", f"{best['score']}/10", delta_color="off")
+            col3.metric("Needs Most Work", f"Q{weakest['question_num']}", f"{weakest['score']}/10", delta_color="off")
+        
         # Display all Q&A with feedback
         for entry in st.session_state.conversation_history:
-            with st.expander(f"Question {entry['question_num']}", expanded=False):
+            title = f"Question {entry['question_num']}"
+            if entry.get('score') is not None:
+                title += f" · {entry['score']}/10"
+            with st.expander(title, expanded=False):
                 st.write(f"**Question:** {entry['question']}")
                 st.write(f"**Your Answer:** {entry['answer']}")
                 st.write(f"**Feedback:** {entry['feedback']}")
@@ -1261,20 +1547,48 @@ def main():
         col1, col2 = st.columns([1, 1])
         with col1:
             if st.button("🔄 Start New Interview", use_container_width=True):
-                # Reset for new interview
-                st.session_state.stage = 'job_selection'
+                # Reset for new interview, skipping straight to the analysis when it is still cached
+                cached = get_cached_preparation(
+                    st.session_state.resume_text,
+                    st.session_state.selected_job,
+                    st.session_state.company_name
+                )
+                if cached:
+                    st.session_state.resume_analysis, st.session_state.interview_questions = cached
+                    st.session_state.stage = 'preparation_complete'
+                else:
+                    st.session_state.stage = 'job_selection'
                 st.session_state.current_question_num = 1
                 st.session_state.conversation_history = []
                 st.session_state.current_question = None
                 st.session_state.answer_submitted = False
                 st.session_state.current_answer = ""
                 st.session_state.current_feedback = ""
+                st.session_state.interview_plan = None
+                st.session_state.interview_memory = None
                 st.rerun()
         
         with col2:
-            if st.button("📄 Download Interview Report", use_container_width=True):
-                # Create and download report
-                st.info("📄 Report generation feature coming soon!")
+            report = {
+                'job_role': st.session_state.selected_job,
+                'company_name': st.session_state.company_name,
+                'resume_analysis': st.session_state.resume_analysis,
+                'conversation_history': st.session_state.conversation_history,
+                'generated_at': datetime.now().strftime("%B %d, %Y"),
+            }
+            try:
+                report_pdf = render_interview_report(report_fingerprint(report), report)
+            except Exception as e:
+                st.error(f"🚨 Error generating report: {e}")
+            else:
+                company_slug = re.sub(r'[^a-z0-9]+', '_', st.session_state.company_name.lower()).strip('_')
+                st.download_button(
+                    "📄 Download Interview Report",
+                    data=report_pdf,
+                    file_name=f"interview_report_{company_slug or 'company'}.pdf",
+                    mime="application/pdf",
+                    use_container_width=True
+                )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+
+class BackgroundJobs:
+    """Run keyed jobs on a bounded thread pool and hand their results back later.
+
+    Streamlit reruns cannot keep a reference to a running call, so jobs are
+    stored under a caller-chosen key (typically session id plus question
+    number) and collected with :meth:`take` on a later rerun. Each job can
+    carry a fingerprint of its inputs; taking it with a different fingerprint
+    treats the result as stale. Results that are never collected are dropped
+    after ``result_ttl`` seconds.
+    """
+
+    def __init__(self, max_workers, max_pending, name, result_ttl=900):
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def _purge(self, now):
+        expired = [key for key, job in self._jobs.items() if now - job["submitted_at"] > self.result_ttl]
+        for key in expired:
+            self._jobs.pop(key)["future"].cancel()
+
+    def _pending(self):
+        return sum(1 for job in self._jobs.values() if not job["future"].done())
+
+    def submit(self, key, func, *args, fingerprint=None):
+        """Start ``func(*args)`` under ``key``; returns False when the queue is full.
+
+        A still-running job with the same fingerprint is reused; a finished
+        one is replaced, so a failed job can be resubmitted.
+        """
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            existing = self._jobs.get(key)
+            if existing and existing["fingerprint"] == fingerprint and not existing["future"].done():
+                return True
+            if self._pending() >= self.max_pending:
+                return False
+            self._jobs[key] = {
+                "future": self._executor.submit(func, *args),
+                "fingerprint": fingerprint,
+                "submitted_at": now,
+            }
+            return True
+
+    def status(self, key):
+        """Return "missing", "pending", "failed" or "done" for the job under ``key``."""
+        with self._lock:
+            job = self._jobs.get(key)
+        if job is None:
+            return "missing"
+        future = job["future"]
+        if not future.done():
+            return "pending"
+        if future.cancelled() or future.exception() is not None:
+            return "failed"
+        return "done"
+
+    def take(self, key, fingerprint=None, timeout=0):
+        """Remove and return the result stored under ``key``.
+
+        Waits up to ``timeout`` seconds for a job that is still running.
+        Returns None when there is no job, its fingerprint does not match,
+        it has not finished in time, or it failed.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return None
+            if job["fingerprint"] != fingerprint:
+                self._jobs.pop(key)
+                return None
+
+        try:
+            result = job["future"].result(timeout=timeout)
+        except TimeoutError:
+            return None
+        except Exception:
+            result = None
+
+        with self._lock:
+            if self._jobs.get(key) is job:
+                self._jobs.pop(key)
+        return result
+
+    def discard(self, key):
+        """Forget the job under ``key``, cancelling it if it has not started."""
+        with self._lock:
+            job = self._jobs.pop(key, None)
+        if job is not None:
+            job["future"].cancel()
+
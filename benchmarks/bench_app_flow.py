@@ -0,0 +1,286 @@
+"""Drive the full interview flow headlessly against fake Gemini/Tavily backends.
+
+Each simulated user runs job_selection -> interview_complete through
+Streamlit's AppTest, with all users of a level running concurrently in one
+process (sharing caches and worker pools like sessions on one server).
+Reports per-stage latency, reruns per stage and traced memory per session.
+
+Run from the repository root:
+
+    python benchmarks/bench_app_flow.py --users 1 10 100
+    python benchmarks/bench_app_flow.py --json bench.json
+    python benchmarks/bench_app_flow.py --baseline bench.json --tolerance 0.25
+
+AppTest cannot drive ``st.file_uploader``, so the extracted resume text is
+placed in session state directly; extraction has its own benchmark.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakes  # noqa: E402
+
+STAGES = ("job_selection", "resume_upload", "preparation_complete", "interview", "interview_complete")
+
+RESUME_TEXT = (
+    "Jane Doe - Software Engineer\n"
+    "5 years building Python and Go services, PostgreSQL, Kafka and Kubernetes on AWS.\n"
+    "Led a migration to event-driven services; mentored three engineers.\n"
+)
+
+
+def share_app_test_runtime():
+    """Let AppTest instances run concurrently in one process, like sessions on one server.
+
+    AppTest installs a mock runtime, secrets and config around every single
+    run and tears them down afterwards, so overlapping runs from different
+    threads clobber each other. Install them once for the whole benchmark
+    and point AppTest's per-run swaps at a stand-in instead.
+    """
+    from contextlib import nullcontext
+    from unittest.mock import MagicMock
+
+    import streamlit as st
+    import streamlit.testing.v1.app_test as app_test
+    import streamlit.testing.v1.local_script_runner as local_script_runner
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.secrets import Secrets
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    app_test.Runtime = type("Runtime", (), {"_instance": None})
+
+    secrets = Secrets()
+    secrets._secrets = {"GOOGLE_API_KEY": "fake-google-key", "TAVILY_API_KEY": "fake-tavily-key"}
+    st.secrets = secrets
+
+    config.set_option("global.appTest", True)
+    app_test.patch_config_options = lambda options: nullcontext()
+
+    # Compile the script once; concurrent ast.parse calls can fail on CPython 3.11
+    script_cache = app_test.ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+
+
+class SessionDriver:
+    """One simulated user clicking through the app, timing every rerun by stage."""
+
+    def __init__(self, company, feedback_mode, poll_interval, timeout):
+        from streamlit.testing.v1 import AppTest
+
+        self.app = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+        self.company = company
+        self.feedback_mode = feedback_mode
+        self.poll_interval = poll_interval
+        self.seconds = {stage: 0.0 for stage in STAGES}
+        self.reruns = {stage: 0 for stage in STAGES}
+
+    @property
+    def stage(self):
+        state = self.app.session_state
+        return state["stage"] if "stage" in state else "job_selection"
+
+    def step(self, element=None):
+        """Rerun the app (through ``element`` if given), attributing the time to the current stage."""
+        stage = self.stage
+        started = time.perf_counter()
+        (element or self.app).run()
+        self.seconds[stage] += time.perf_counter() - started
+        self.reruns[stage] += 1
+        if self.app.exception:
+            raise RuntimeError(f"app raised during {stage}: {self.app.exception[0].value}")
+
+    def button(self, *labels):
+        for button in self.app.button:
+            if button.label in labels:
+                return button
+        raise RuntimeError(f"no button among {labels} in stage {self.stage}")
+
+    def run(self):
+        app = self.app
+        self.step()
+        self.step(app.text_input[0].input(self.company))
+        self.step(self.button("Continue to Resume Upload").click())
+
+        app.session_state["resume_text"] = RESUME_TEXT
+        self.step()
+        self.step(self.button("🚀 Analyze Resume & Research Interview Questions").click())
+        if self.stage != "preparation_complete":
+            raise RuntimeError("preparation did not complete")
+
+        app.radio[0].set_value(self.feedback_mode)
+        self.step(self.button("🎯 Start Mock Interview").click())
+
+        while self.stage == "interview":
+            number = app.session_state["current_question_num"]
+            self.step(app.text_area(key=f"answer_{number}").input(f"My answer to question {number}."))
+            self.step(self.button("Submit Answer").click())
+            if self.feedback_mode == "review_at_end":
+                continue
+            while app.session_state["evaluation_pending"]:
+                time.sleep(self.poll_interval)
+                self.step()
+            self.step(self.button("➡️ Next Question", "🏁 Finish Interview").click())
+
+        self.step()
+        if self.stage != "interview_complete":
+            raise RuntimeError(f"flow ended in stage {self.stage}")
+
+
+def run_level(users, args):
+    """Run ``users`` concurrent sessions and summarise their stage timings."""
+    import streamlit as st
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    # A fresh cache per level; get_storage() reads the path again once its resource is cleared
+    os.environ["INTERVIEWAI_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="interviewai-bench-"), "cache.sqlite3")
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    drivers = [
+        SessionDriver(f"Company {index % (args.companies or users)}", args.feedback_mode, args.poll_interval, args.timeout)
+        for index in range(users)
+    ]
+    started = time.perf_counter()
+    failures = []
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        for driver, future in zip(drivers, [pool.submit(driver.run) for driver in drivers]):
+            try:
+                future.result()
+            except Exception as e:
+                failures.append(str(e))
+    wall = time.perf_counter() - started
+    memory = (tracemalloc.get_traced_memory()[0] - baseline) / users
+    tracemalloc.stop()
+
+    completed = [driver for driver in drivers if driver.stage == "interview_complete"]
+    stages = {}
+    for stage in STAGES:
+        seconds = [driver.seconds[stage] for driver in completed]
+        reruns = [driver.reruns[stage] for driver in completed]
+        stages[stage] = {
+            "p50_s": statistics.median(seconds) if seconds else None,
+            "p95_s": sorted(seconds)[max(0, int(round(0.95 * len(seconds))) - 1)] if seconds else None,
+            "reruns": statistics.mean(reruns) if reruns else None,
+        }
+    return {
+        "users": users,
+        "completed": len(completed),
+        "failures": failures[:5],
+        "wall_s": wall,
+        "memory_per_session_mb": memory / 2 ** 20,
+        "stages": stages,
+    }
+
+
+def print_level(result):
+    print(
+        f"\n== {result['users']} concurrent user(s): {result['completed']} completed in {result['wall_s']:.1f}s, "
+        f"{result['memory_per_session_mb']:.2f} MB traced per session"
+    )
+    print(f"{'stage':<22}{'p50 s':>10}{'p95 s':>10}{'reruns':>10}")
+    for stage, values in result["stages"].items():
+        if values["p50_s"] is None:
+            continue
+        print(f"{stage:<22}{values['p50_s']:>10.2f}{values['p95_s']:>10.2f}{values['reruns']:>10.1f}")
+    for failure in result["failures"]:
+        print(f"  failure: {failure}")
+
+
+def compare(results, baseline_path, tolerance):
+    """Return regressions where a stage's p95 grew beyond ``tolerance`` of the baseline."""
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = {level["users"]: level for level in json.load(baseline_file)["levels"]}
+    regressions = []
+    for result in results:
+        previous = baseline.get(result["users"])
+        if previous is None:
+            continue
+        if result["completed"] < previous["completed"]:
+            regressions.append(f"{result['users']} users: only {result['completed']} sessions completed")
+        for stage, values in result["stages"].items():
+            before = previous["stages"].get(stage, {}).get("p95_s")
+            after = values["p95_s"]
+            if before and after and after > before * (1 + tolerance):
+                regressions.append(f"{result['users']} users, {stage}: p95 {before:.2f}s -> {after:.2f}s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 10, 100], help="concurrency levels to run")
+    parser.add_argument("--feedback-mode", choices=["per_answer", "review_at_end"], default="per_answer")
+    parser.add_argument("--companies", type=int, default=0, help="distinct companies across users (0 = one per user)")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake model seconds per response")
+    parser.add_argument("--ttft", type=float, default=0.05, help="fake model seconds to first streamed token")
+    parser.add_argument("--response-chars", type=int, default=1500, help="size of fake free-form responses")
+    parser.add_argument("--tool-calls", type=int, default=2, help="fake web searches per research request")
+    parser.add_argument("--tool-latency", type=float, default=0.3, help="fake seconds per web search")
+    parser.add_argument("--poll-interval", type=float, default=0.1, help="seconds between reruns while feedback is pending")
+    parser.add_argument("--timeout", type=float, default=120, help="AppTest timeout per rerun")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against a previous --json result and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 growth over the baseline")
+    args = parser.parse_args()
+
+    # Keep the benchmark out of the app's own cache and question index; both paths must be set
+    # before the warm-up run below first imports the app modules
+    scratch = tempfile.mkdtemp(prefix="interviewai-bench-")
+    os.environ["INTERVIEWAI_STORAGE"] = "sqlite"
+    os.environ["INTERVIEWAI_CACHE_PATH"] = os.path.join(scratch, "cache.sqlite3")
+    os.environ["INTERVIEWAI_QUESTION_INDEX_PATH"] = os.path.join(scratch, "question_index")
+
+    fakes.install(
+        latency=args.latency,
+        time_to_first_token=args.ttft,
+        response_chars=args.response_chars,
+        tool_calls=args.tool_calls,
+        tool_latency=args.tool_latency,
+    )
+    os.chdir(ROOT)
+    share_app_test_runtime()
+
+    # Import the app's dependencies before any measurement so they don't count as session memory
+    from streamlit.testing.v1 import AppTest
+
+    AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=args.timeout).run()
+
+    results = []
+    for users in args.users:
+        result = run_level(users, args)
+        print_level(result)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump({"settings": vars(args), "levels": results}, output, indent=2)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            sys.exit(1)
+    if any(result["completed"] < result["users"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Measure the app's cold-start import time with ``python -X importtime``.
+
+Runs ``app.py`` in Streamlit's bare mode (first render of the job selection
+stage) in a fresh interpreter, with placeholder API keys. It reports the
+total import time and the heaviest top-level imports, and fails if:
+
+- the median total exceeds the budget, or
+- a module that should only load at a later stage (model client, report or
+  document libraries) is imported at cold start.
+
+Run from the repository root:
+
+    python benchmarks/bench_import_time.py [--repeat 5] [--budget-ms 1000]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on demand by later stages; importing any of them on cold start is a regression
+DEFERRED_MODULES = (
+    "phi", "google.generativeai", "tavily", "reportlab", "PyPDF2", "docx", "pymupdf", "fitz", "pandas", "PIL", "numpy",
+)
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+def run_importtime(workdir):
+    """Run the app once and return ``(top_level, modules)`` from its importtime trace.
+
+    ``top_level`` maps each top-level import to its cumulative microseconds;
+    ``modules`` is the set of every module imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(ROOT, "app.py")],
+        cwd=workdir,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    top_level = {}
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules.add(name)
+        if len(indent) == 1:
+            top_level[name] = top_level.get(name, 0) + int(cumulative)
+    if result.returncode != 0 or not top_level:
+        raise RuntimeError(f"app.py failed to run in bare mode:\n{result.stderr[-2000:]}")
+    return top_level, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="interpreter runs (median is reported)")
+    parser.add_argument("--budget-ms", type=float, default=1000, help="fail when the median total import time exceeds this")
+    parser.add_argument("--top", type=int, default=10, help="number of heaviest top-level imports to list")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="interviewai-importtime-") as workdir:
+        os.makedirs(os.path.join(workdir, ".streamlit"))
+        with open(os.path.join(workdir, ".streamlit", "secrets.toml"), "w", encoding="utf-8") as secrets:
+            secrets.write('GOOGLE_API_KEY = "placeholder"\nTAVILY_API_KEY = "placeholder"\n')
+        runs = [run_importtime(workdir) for _ in range(args.repeat)]
+
+    totals = [sum(top_level.values()) / 1000 for top_level, _ in runs]
+    median_total = statistics.median(totals)
+    print(f"Cold-start import time: median {median_total:.0f} ms over {args.repeat} runs (budget {args.budget_ms:.0f} ms)")
+
+    print(f"\n{'top-level import':<40}{'median ms':>12}")
+    names = set().union(*(top_level for top_level, _ in runs))
+    medians = {name: statistics.median(top_level.get(name, 0) for top_level, _ in runs) / 1000 for name in names}
+    for name, value in sorted(medians.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{name:<40}{value:>12.1f}")
+
+    imported = set().union(*(modules for _, modules in runs))
+    deferred = sorted(
+        name for name in imported if any(name == module or name.startswith(module + ".") for module in DEFERRED_MODULES)
+    )
+    failures = []
+    if median_total > args.budget_ms:
+        failures.append(f"median import time {median_total:.0f} ms exceeds the {args.budget_ms:.0f} ms budget")
+    if deferred:
+        roots = sorted({name.split(".")[0] for name in deferred})
+        failures.append(f"deferred modules imported at cold start: {', '.join(roots)}")
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare PDF extraction backends on synthetic 1-, 10- and 100-page resumes.
+
+Run from the repository root:
+
+    python benchmarks/bench_pdf_extraction.py [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import extraction  # noqa: E402
+
+PAGE_COUNTS = (1, 10, 100)
+
+RESUME_LINES = [
+    "Senior Software Engineer - Example Corp (2019 - present)",
+    "Led the migration of a monolith to event-driven services handling 40k requests per second.",
+    "Designed a feature store in Python and PostgreSQL used by twelve data science teams.",
+    "Mentored five engineers and ran the backend interview loop.",
+    "Skills: Python, Go, Kubernetes, Kafka, PostgreSQL, Terraform, AWS, GCP",
+    "Education: B.Sc. Computer Science, Example University",
+]
+
+
+def build_resume_pdf(pages):
+    """Render a resume-like PDF with the given number of text-filled pages."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    for page in range(pages):
+        y = 750
+        pdf.drawString(72, y, f"Jane Doe - Resume page {page + 1}")
+        while y > 72:
+            for line in RESUME_LINES:
+                y -= 14
+                if y <= 72:
+                    break
+                pdf.drawString(72, y, line)
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def time_call(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (median is reported)")
+    args = parser.parse_args()
+
+    variants = []
+    for backend in extraction.PDF_BACKENDS:
+        variants.append((f"{backend} sequential", backend, False))
+        variants.append((f"{backend} page-parallel", backend, True))
+
+    print(f"{'backend':<26}" + "".join(f"{pages:>12} pg" for pages in PAGE_COUNTS))
+    documents = {pages: build_resume_pdf(pages) for pages in PAGE_COUNTS}
+    for label, backend, parallel in variants:
+        row = f"{label:<26}"
+        for pages in PAGE_COUNTS:
+            data = documents[pages]
+            try:
+                # Warm up imports and the process pool outside the timed runs
+                extraction.extract_pdf_text_with(backend, data, max_pages=pages, max_chars=10**9, parallel=parallel)
+                median = time_call(
+                    lambda: extraction.extract_pdf_text_with(
+                        backend, data, max_pages=pages, max_chars=10**9, parallel=parallel
+                    ),
+                    args.repeat,
+                )
+                row += f"{median * 1000:>12.1f} ms"
+            except ImportError:
+                row += f"{'n/a':>15}"
+        print(row)
+
+    print(
+        f"\nLimits in production: max_pages={extraction.MAX_PAGES}, max_chars={extraction.MAX_CHARS}, "
+        f"parallel from {extraction.PARALLEL_PAGE_THRESHOLD} pages on {extraction.PARALLEL_WORKERS} workers"
+    )
+
+
+if __name__ == "__main__":
+    main()
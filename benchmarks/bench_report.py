@@ -0,0 +1,93 @@
+"""Time PDF interview report rendering for 10- and 50-question transcripts.
+
+Reports the render time and size of each report next to the cost of a
+cache hit (hashing the transcript), which is what repeat downloads pay.
+
+Run from the repository root:
+
+    python benchmarks/bench_report.py [--repeat 5]
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import report  # noqa: E402
+
+QUESTION_COUNTS = (10, 50)
+
+RESUME_ANALYSIS = {
+    "skills": ["Python", "Go", "PostgreSQL", "Kafka", "Kubernetes", "AWS"],
+    "seniority": "senior",
+    "strengths": ["Led a migration to event-driven services", "Mentored five engineers"],
+    "gaps": ["Limited frontend experience", "No cloud certifications"],
+    "role_fit": "Strong backend fit for the role; would need support on frontend-heavy work.",
+}
+
+ANSWER = (
+    "In my last role I owned the ingestion pipeline. We were dropping events during deploys, so I "
+    "introduced consumer-side idempotency keys and a replay job, and cut the loss rate to zero while "
+    "keeping p99 latency under 200 ms. I worked with the SRE team to add alerting on consumer lag. "
+) * 3
+
+FEEDBACK = (
+    "**Score:** {score}/10\n\n"
+    "**Strengths:**\n- Clear structure and ownership of the outcome\n- Quantified the impact\n\n"
+    "**Areas for improvement:**\n- Explain the trade-offs you considered\n\n"
+    "**Suggestions:**\n- Use the STAR format and close with what you learned"
+)
+
+
+def build_payload(questions):
+    history = [
+        {
+            "question_num": number,
+            "question": f"Tell me about a time you improved the reliability of a system you owned (#{number}).",
+            "answer": ANSWER,
+            "feedback": FEEDBACK.format(score=5 + number % 5),
+            "score": 5 + number % 5,
+        }
+        for number in range(1, questions + 1)
+    ]
+    return {
+        "job_role": "Software Engineer",
+        "company_name": "Example Corp",
+        "resume_analysis": RESUME_ANALYSIS,
+        "conversation_history": history,
+        "generated_at": "January 01, 2025",
+    }
+
+
+def time_call(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (median is reported)")
+    args = parser.parse_args()
+
+    # Warm up reportlab's imports and font metrics outside the timed runs
+    report.build_interview_report(**build_payload(1))
+
+    print(f"{'questions':<12}{'render ms':>12}{'cache hit ms':>15}{'pages':>8}{'size KB':>10}")
+    for questions in QUESTION_COUNTS:
+        payload = build_payload(questions)
+        pdf = report.build_interview_report(**payload)
+        render = time_call(lambda: report.build_interview_report(**payload), args.repeat)
+        cache_hit = time_call(lambda: report.report_fingerprint(payload), args.repeat)
+        pages = len(re.findall(rb"/Type\s*/Page(?!s)", pdf))
+        print(f"{questions:<12}{render * 1000:>12.1f}{cache_hit * 1000:>15.2f}{pages:>8}{len(pdf) / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
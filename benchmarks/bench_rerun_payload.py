@@ -0,0 +1,69 @@
+"""Measure the bytes the app sends to the browser on each rerun.
+
+Drives the first reruns of the job selection stage through Streamlit's
+AppTest and sums the serialized size of the forward messages every rerun
+produces, which is what goes over the websocket. Pass ``--rev`` to measure
+``app.py`` as of another git revision for a before/after comparison:
+
+    python benchmarks/bench_rerun_payload.py
+    python benchmarks/bench_rerun_payload.py --rev HEAD~1
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def measure(script_path, timeout):
+    """Return ``(label, bytes)`` for each rerun of the job selection stage."""
+    import streamlit.testing.v1.local_script_runner as local_script_runner
+    from streamlit.testing.v1 import AppTest
+
+    sizes = []
+    parse_tree = local_script_runner.parse_tree_from_messages
+
+    def record(messages):
+        sizes.append(sum(message.ByteSize() for message in messages))
+        return parse_tree(messages)
+
+    local_script_runner.parse_tree_from_messages = record
+    try:
+        app = AppTest.from_file(script_path, default_timeout=timeout)
+        app.secrets["GOOGLE_API_KEY"] = "placeholder"
+        app.secrets["TAVILY_API_KEY"] = "placeholder"
+        app.run()
+        app.text_input[0].input("Example Corp").run()
+        app.selectbox[0].select_index(1).run()
+    finally:
+        local_script_runner.parse_tree_from_messages = parse_tree
+    return list(zip(("first render", "company typed", "category changed"), sizes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rev", help="measure app.py as of this git revision instead of the working tree")
+    parser.add_argument("--timeout", type=float, default=30, help="AppTest timeout per rerun")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    if not args.rev:
+        results = measure(os.path.join(ROOT, "app.py"), args.timeout)
+    else:
+        source = subprocess.run(["git", "show", f"{args.rev}:app.py"], check=True, capture_output=True, text=True).stdout
+        with tempfile.TemporaryDirectory(prefix="interviewai-payload-") as workdir:
+            script_path = os.path.join(workdir, "app.py")
+            with open(script_path, "w", encoding="utf-8") as script:
+                script.write(source)
+            results = measure(script_path, args.timeout)
+
+    print(f"{'rerun':<20}{'payload KB':>12}")
+    for label, size in results:
+        print(f"{label:<20}{size / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
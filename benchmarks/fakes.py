@@ -0,0 +1,199 @@
+"""Deterministic local stand-ins for the Gemini model and Tavily search tools.
+
+``install()`` swaps them into ``phi.model.google`` and ``phi.tools.tavily``
+before ``app.py`` is executed, so benchmarks never touch the network and
+produce the same responses on every run.
+"""
+import json
+import re
+import time
+import uuid
+from typing import Iterator, List, Optional
+
+import phi.model.google
+import phi.tools.tavily
+from phi.model.base import Model
+from phi.model.message import Message
+from phi.model.response import ModelResponse
+from phi.tools import Toolkit
+from phi.tools.function import FunctionCall
+
+# Tunables shared by every fake instance; the benchmark sets them from its CLI flags
+SETTINGS = {
+    "latency": 0.2,          # seconds per model response
+    "time_to_first_token": 0.05,
+    "response_chars": 1500,  # size of free-form responses
+    "tool_calls": 2,         # searches per research request
+    "tool_latency": 0.3,     # seconds per search
+}
+
+FILLER = (
+    "Candidates are expected to explain trade-offs clearly, quantify impact and relate answers "
+    "to the role's day-to-day responsibilities. "
+)
+
+
+def _pad(text):
+    missing = SETTINGS["response_chars"] - len(text)
+    if missing <= 0:
+        return text
+    return text + "\n\n" + (FILLER * (missing // len(FILLER) + 1))[:missing]
+
+
+def _numbers(pattern, prompt):
+    return [int(number) for number in re.findall(pattern, prompt)]
+
+
+def canned_response(prompt):
+    """Return a deterministic response shaped like what the app expects for ``prompt``."""
+    if "Plan a mock interview" in prompt:
+        count = int(re.search(r"Produce exactly (\d+)", prompt).group(1))
+        start = 10 - count + 1
+        return json.dumps({"questions": [
+            {
+                "question": f"Question {number}: walk me through a project where you applied this skill.",
+                "category": ("warm-up", "technical", "behavioral", "company-specific")[number % 4],
+                "difficulty": min(5, 1 + number // 2),
+                "expected_score": 7,
+            }
+            for number in range(start, 11)
+        ]})
+    if "Evaluate every answer" in prompt:
+        return json.dumps({"evaluations": [
+            {
+                "question_num": number,
+                "score": 6 + number % 3,
+                "strengths": ["Clear structure"],
+                "improvements": ["Quantify the impact"],
+                "suggestions": ["Use the STAR format"],
+            }
+            for number in sorted(set(_numbers(r"Question (\d+):", prompt)))
+        ]})
+    if "Evaluate this interview answer" in prompt:
+        return json.dumps({
+            "score": 7,
+            "strengths": ["Clear structure"],
+            "improvements": ["Quantify the impact"],
+            "suggestions": ["Use the STAR format"],
+            "memory": {
+                "topics_covered": [f"Topic {number}" for number in range(1, min(9, prompt.count("Topic ") + 2))],
+                "weaknesses_probed": ["Quantifying impact"],
+            },
+        })
+    if "Research and compile" in prompt:
+        return _pad(
+            "## Technical\n- How would you design a rate limiter?\n"
+            "## Behavioral\n- Tell me about a conflict with a teammate.\n"
+            "## Company-specific\n- Why do you want to work here?"
+        )
+    if "Analyze this resume" in prompt:
+        return json.dumps({
+            "skills": ["Python", "Go", "PostgreSQL", "Kafka", "Kubernetes"],
+            "seniority": "mid",
+            "strengths": ["Led an event-driven migration", "Mentoring"],
+            "gaps": ["Cloud certifications"],
+            "role_fit": "Strong backend fit; limited frontend exposure.",
+        })
+    return _pad("Can you describe a recent technical challenge and how you solved it?")
+
+
+class FakeGemini(Model):
+    """Model stand-in with configurable latency, response size and simulated web searches."""
+
+    id: str = "fake-gemini"
+    name: str = "FakeGemini"
+    provider: str = "Fake"
+    api_key: Optional[str] = None
+
+    def _prompt(self, messages):
+        for message in reversed(messages):
+            if message.role == "user":
+                return str(message.content)
+        return ""
+
+    def _search(self, messages, prompt):
+        """Run the fake search tool the way a tool-calling model would, honouring tool_call_limit."""
+        function = (self.functions or {}).get("web_search_using_tavily")
+        if function is None:
+            return
+        tool_calls = []
+        calls = []
+        for index in range(SETTINGS["tool_calls"]):
+            call_id = uuid.uuid4().hex
+            arguments = {"query": f"{prompt[:60]} #{index}"}
+            tool_calls.append({
+                "id": call_id,
+                "type": "function",
+                "function": {"name": function.name, "arguments": json.dumps(arguments)},
+            })
+            calls.append(FunctionCall(function=function, arguments=arguments, call_id=call_id))
+        if self.tool_call_limit:
+            tool_calls = tool_calls[: self.tool_call_limit]
+            calls = calls[: self.tool_call_limit]
+        messages.append(Message(role="assistant", content="", tool_calls=tool_calls))
+        results: List[Message] = []
+        for _ in self.run_function_calls(calls, results):
+            pass
+        messages.extend(results)
+
+    def _respond(self, messages):
+        content = canned_response(self._prompt(messages))
+        input_tokens = sum(len(str(message.content or "")) for message in messages) // 4
+        messages.append(Message(
+            role="assistant",
+            content=content,
+            metrics={"input_tokens": input_tokens, "output_tokens": len(content) // 4},
+        ))
+        return content
+
+    # Searches run between requests, as with a real tool-calling model, so the
+    # app's per-request limiter wrapped around invoke/invoke_stream sees the same load
+    def invoke(self, messages: List[Message]) -> str:
+        time.sleep(SETTINGS["latency"])
+        return self._respond(messages)
+
+    def invoke_stream(self, messages: List[Message]) -> Iterator[str]:
+        time.sleep(SETTINGS["time_to_first_token"])
+        content = self._respond(messages)
+        chunks = [content[i:i + 40] for i in range(0, len(content), 40)] or [""]
+        delay = max(0.0, SETTINGS["latency"] - SETTINGS["time_to_first_token"]) / len(chunks)
+        for chunk in chunks:
+            yield chunk
+            time.sleep(delay)
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        self._search(messages, self._prompt(messages))
+        return ModelResponse(content=self.invoke(messages))
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        self._search(messages, self._prompt(messages))
+        for chunk in self.invoke_stream(messages):
+            yield ModelResponse(content=chunk)
+
+
+class FakeTavilyTools(Toolkit):
+    """Search toolkit stand-in that sleeps instead of calling Tavily."""
+
+    def __init__(self, api_key=None, **kwargs):
+        super().__init__(name="tavily_tools")
+        self.register(self.web_search_using_tavily)
+
+    def web_search_using_tavily(self, query: str, max_results: int = 5) -> str:
+        """Use this function to search the web for a given query.
+
+        Args:
+            query (str): Query to search for.
+            max_results (int): Maximum number of results to return. Defaults to 5.
+
+        Returns:
+            str: The search results in markdown.
+        """
+        time.sleep(SETTINGS["tool_latency"])
+        return f"# {query}\n- Result about interview questions for {query}"
+
+
+def install(**settings):
+    """Patch phidata so ``app.py`` builds its agents from the fakes."""
+    SETTINGS.update(settings)
+    phi.model.google.Gemini = FakeGemini
+    phi.tools.tavily.TavilyTools = FakeTavilyTools
@@ -0,0 +1,135 @@
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_key(*parts):
+    """Build a cache key from free-text parts, ignoring case and extra whitespace."""
+    return "|".join(re.sub(r"\s+", " ", str(part)).strip().lower() for part in parts)
+
+
+class PersistentCache:
+    """Key/value cache with TTL expiry and LRU eviction over a :class:`storage.Storage`.
+
+    With SQLite or Redis storage, entries survive server restarts and are
+    shared by every session and process (or replica) using the same
+    storage. Entries older than ``refresh_after`` (a fraction of the TTL)
+    are still served, but a background refresh is scheduled when the caller
+    supplies a refresh function, so popular keys rarely expire in front of a
+    user.
+
+    The cache is an optimization, so storage failures (a locked or corrupt
+    SQLite file, an unreachable Redis) are logged and counted rather than
+    raised: a failed read is a miss and a failed write is skipped, and
+    callers fall back to computing the value.
+    """
+
+    def __init__(self, storage, namespace, ttl_seconds, max_entries, refresh_after=0.8, refresh_workers=2):
+        self.storage = storage
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.refresh_after = refresh_after
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix=f"cache-{namespace}")
+        self._counters = {"hits": 0, "misses": 0, "refreshes": 0, "evictions": 0, "errors": 0}
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def get(self, key, refresh=None):
+        """Return the cached value for ``key`` or None on a miss.
+
+        ``refresh`` is an optional zero-argument callable producing a fresh
+        value; it is run in the background when the entry is close to expiry.
+        """
+        value = None
+        try:
+            entry = self.storage.get(self.namespace, key)
+            if entry is not None:
+                age = time.time() - entry[1]
+                if age >= self.ttl_seconds:
+                    self.storage.delete(self.namespace, key)
+                else:
+                    value = json.loads(entry[0])
+        except Exception as e:
+            logger.warning("Reading %r from the %s cache failed, treating it as a miss: %s", key, self.namespace, e)
+            self._count("errors")
+            value = None
+        if value is None:
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        if refresh is not None and age >= self.ttl_seconds * self.refresh_after:
+            self.refresh_in_background(key, refresh)
+        return value
+
+    def age(self, key):
+        """Return the seconds since ``key`` was written, or None when it is missing or expired.
+
+        Unlike ``get`` this leaves the hit/miss counters and the LRU order
+        alone, so batch jobs can inspect the cache without skewing its metrics
+        or keeping stale entries from being evicted.
+        """
+        entry = self.storage.peek(self.namespace, key)
+        if entry is None:
+            return None
+        age = time.time() - entry[1]
+        return age if age < self.ttl_seconds else None
+
+    def set(self, key, value):
+        """Store ``value`` under ``key`` and evict least recently used entries over the size bound."""
+        try:
+            evicted = self.storage.set(self.namespace, key, json.dumps(value), max_entries=self.max_entries)
+        except Exception as e:
+            logger.warning("Writing %r to the %s cache failed: %s", key, self.namespace, e)
+            self._count("errors")
+            return
+        if evicted > 0:
+            self._count("evictions", evicted)
+
+    def refresh_in_background(self, key, compute):
+        """Recompute ``key`` on the refresh pool unless a refresh is already in flight."""
+        with self._lock:
+            if key in self._refreshing:
+                return None
+            self._refreshing.add(key)
+
+        def _refresh():
+            try:
+                value = compute()
+                if value:
+                    self.set(key, value)
+                    self._count("refreshes")
+                return value
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        return self._refresh_executor.submit(_refresh)
+
+    def invalidate(self, key):
+        """Remove a single entry."""
+        self.storage.delete(self.namespace, key)
+
+    def stats(self):
+        """Return hit/miss counters for this process along with the current entry count (0 if storage fails)."""
+        try:
+            entries = self.storage.count(self.namespace)
+        except Exception as e:
+            logger.warning("Counting the %s cache failed: %s", self.namespace, e)
+            entries = 0
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["entries"] = entries
+        counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+        return counters
@@ -0,0 +1,302 @@
+import math
+import os
+import re
+import threading
+from collections import defaultdict
+
+from telemetry import tracer
+
+# Token budget per prompt source; prompt templates add a fixed overhead on top
+RESUME_TOKENS = int(os.environ.get("INTERVIEWAI_CONTEXT_RESUME_TOKENS", "150"))
+QUESTIONS_TOKENS = int(os.environ.get("INTERVIEWAI_CONTEXT_QUESTIONS_TOKENS", "400"))
+HISTORY_TOKENS = int(os.environ.get("INTERVIEWAI_CONTEXT_HISTORY_TOKENS", "300"))
+
+# Interview plans cover every remaining question, so they see more of the research
+PLAN_QUESTIONS_TOKENS = int(os.environ.get("INTERVIEWAI_CONTEXT_PLAN_QUESTIONS_TOKENS", "800"))
+
+# Researched questions retrieved from the question bank per prompt
+QUESTIONS_TOP_K = int(os.environ.get("INTERVIEWAI_CONTEXT_QUESTIONS_TOP_K", "8"))
+PLAN_QUESTIONS_TOP_K = int(os.environ.get("INTERVIEWAI_CONTEXT_PLAN_QUESTIONS_TOP_K", "20"))
+
+# Most recent turns kept with their answer; older turns shrink to one line each
+RECENT_TURNS = int(os.environ.get("INTERVIEWAI_CONTEXT_RECENT_TURNS", "2"))
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_HEADING_PATTERN = re.compile(r"^\s*(#{1,6}\s+\S|\*\*[^*]+\*\*:?\s*$|\d+[.)]\s+\*\*)")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to was what when where which who why "
+    "with you your do did does have has can will would about describe tell me".split()
+)
+
+PROFILE_FIELDS = ("skills", "strengths", "gaps")
+
+
+def count_tokens(text):
+    """Estimate the model token count of ``text``.
+
+    Words and punctuation count as one token each, with long words split
+    every four characters, which tracks SentencePiece-style tokenizers
+    closely enough for budgeting without a network round trip.
+    """
+    return sum(max(1, math.ceil(len(token) / 4)) for token in _TOKEN_PATTERN.findall(text or ""))
+
+
+def truncate_to_tokens(text, budget):
+    """Cut ``text`` at a word boundary so it fits ``budget`` tokens, marking the cut with an ellipsis."""
+    text = (text or "").strip()
+    if count_tokens(text) <= budget:
+        return text
+    if budget <= 1:
+        return ""
+    used = 0
+    end = 0
+    for match in re.finditer(r"\S+", text):
+        cost = count_tokens(match.group())
+        if used + cost > budget - 1:
+            break
+        used += cost
+        end = match.end()
+    return text[:end].rstrip(" ,;:") + "…"
+
+
+def terms(text):
+    """Lower-cased content words of ``text`` used for relevance scoring."""
+    return {word for word in re.findall(r"[a-z0-9+#]+", (text or "").lower()) if word not in _STOPWORDS and len(word) > 1}
+
+
+def split_sections(markdown):
+    """Split researched questions into sections at headings, or at blank lines when there are none."""
+    lines = (markdown or "").strip().splitlines()
+    if not any(_HEADING_PATTERN.match(line) for line in lines):
+        return [block.strip() for block in re.split(r"\n\s*\n", markdown or "") if block.strip()]
+
+    sections = []
+    current = []
+    for line in lines:
+        if _HEADING_PATTERN.match(line) and current:
+            sections.append("\n".join(current).strip())
+            current = []
+        current.append(line)
+    if current:
+        sections.append("\n".join(current).strip())
+    return [section for section in sections if section]
+
+
+def select_sections(sections, query, avoid, budget):
+    """Pick the sections most relevant to ``query`` that fit ``budget``, in their original order.
+
+    Sections that repeat ``avoid`` (questions already asked) rank lower, so the
+    conductor is steered towards material it has not covered yet. The last
+    section that does not fit whole is truncated into the remaining budget.
+    """
+    query_terms = terms(query)
+    avoid_terms = terms(avoid)
+
+    def relevance(section):
+        section_terms = terms(section)
+        if not section_terms:
+            return 0.0
+        return (len(section_terms & query_terms) - 0.5 * len(section_terms & avoid_terms)) / math.sqrt(len(section_terms))
+
+    ranked = sorted(range(len(sections)), key=lambda index: (-relevance(sections[index]), index))
+    chosen = {}
+    remaining = budget
+    for index in ranked:
+        cost = count_tokens(sections[index])
+        if cost <= remaining:
+            chosen[index] = sections[index]
+            remaining -= cost
+        elif remaining >= 30:
+            chosen[index] = truncate_to_tokens(sections[index], remaining)
+            remaining -= count_tokens(chosen[index])
+        if remaining < 30:
+            break
+    return [chosen[index] for index in sorted(chosen)]
+
+
+def select_profile_facts(resume_analysis, query, budget=RESUME_TOKENS):
+    """Render seniority plus the resume facts most relevant to ``query`` within ``budget`` tokens."""
+    resume_analysis = resume_analysis or {}
+    query_terms = terms(query)
+    lines = []
+    if resume_analysis.get("seniority"):
+        lines.append(f"- Seniority: {resume_analysis['seniority']}")
+    remaining = budget - count_tokens("\n".join(lines))
+
+    for field in PROFILE_FIELDS:
+        items = list(resume_analysis.get(field) or [])
+        # Stable sort keeps the analyst's own ordering among equally relevant facts
+        items.sort(key=lambda item: -len(terms(item) & query_terms))
+        kept = []
+        for item in items:
+            cost = count_tokens(item) + 1
+            if cost > remaining:
+                continue
+            kept.append(item)
+            remaining -= cost
+        if kept:
+            label = f"- {field.capitalize()}: "
+            remaining -= count_tokens(label)
+            lines.append(label + ", ".join(kept))
+    return "\n".join(lines)
+
+
+def format_turn(entry, question_tokens, answer_tokens=0):
+    """Render one answered question as a single compact line."""
+    score = entry.get("score")
+    line = f"Q{entry['question_num']}"
+    if score is not None:
+        line += f" ({score}/10)"
+    line += f": {truncate_to_tokens(entry['question'], question_tokens)}"
+    if answer_tokens:
+        line += f" | Answer: {truncate_to_tokens(entry['answer'], answer_tokens)}"
+    return line
+
+
+def summarize_history(conversation_history, budget, recent_turns=RECENT_TURNS):
+    """Summarize answered questions within ``budget`` tokens.
+
+    The most recent turns keep an excerpt of the answer; older turns shrink to
+    their number, score and the start of the question. When even that does not
+    fit, the oldest turns are dropped and counted instead.
+    """
+    entries = [entry for entry in conversation_history or [] if entry.get("answer")]
+    if not entries:
+        return "None yet"
+
+    recent = entries[-recent_turns:] if recent_turns else []
+    older = entries[: len(entries) - len(recent)]
+    lines = [format_turn(entry, 15) for entry in older]
+    lines += [format_turn(entry, 40, 60) for entry in recent]
+
+    dropped = 0
+    while lines and count_tokens("\n".join(lines)) > budget:
+        if len(lines) > len(recent):
+            lines.pop(0)
+            dropped += 1
+        else:
+            # Only recent turns left; fall back to their one-line form before dropping them too
+            lines = [format_turn(entry, 15) for entry in recent]
+            recent = []
+    if dropped:
+        lines.insert(0, f"({dropped} earlier questions omitted)")
+    return "\n".join(lines)
+
+
+def score_trend(conversation_history):
+    """Describe the scores so far in answer order, e.g. "6 → 8 → 7 (average 7.0)"."""
+    scores = [entry["score"] for entry in conversation_history or [] if entry.get("score") is not None]
+    if not scores:
+        return ""
+    return f"{' → '.join(str(score) for score in scores)} (average {sum(scores) / len(scores):.1f})"
+
+
+def format_memory(memory, conversation_history, budget):
+    """Render the running interview memory plus the latest turn within ``budget`` tokens.
+
+    The score trend is computed from the recorded scores rather than asked of
+    the model. When the memory is too long, the oldest topics and weaknesses
+    are left out first.
+    """
+    topics = list(memory.get("topics_covered") or [])
+    weaknesses = list(memory.get("weaknesses_probed") or [])
+    answered = [entry for entry in conversation_history or [] if entry.get("answer")]
+    trend = score_trend(answered)
+    latest = f"Last question: {format_turn(answered[-1], 40, 60)}" if answered else ""
+
+    while True:
+        lines = []
+        if topics:
+            lines.append(f"Topics covered: {', '.join(topics)}")
+        if weaknesses:
+            lines.append(f"Weaknesses probed: {', '.join(weaknesses)}")
+        if trend:
+            lines.append(f"Score trend: {trend}")
+        if latest:
+            lines.append(latest)
+        text = "\n".join(lines) or "None yet"
+        if count_tokens(text) <= budget or not (topics or weaknesses):
+            return truncate_to_tokens(text, budget)
+        if len(topics) >= len(weaknesses):
+            topics.pop(0)
+        else:
+            weaknesses.pop(0)
+
+
+class ContextStats:
+    """Thread-safe totals of the context assembled per prompt, exported as metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._builds = defaultdict(int)
+        self._tokens = defaultdict(int)
+        self._max_tokens = defaultdict(int)
+
+    def record(self, purpose, tokens):
+        with self._lock:
+            self._builds[purpose] += 1
+            for source, count in tokens.items():
+                self._tokens[(purpose, source)] += count
+            total = sum(tokens.values())
+            self._max_tokens[purpose] = max(self._max_tokens[purpose], total)
+
+    def metrics(self):
+        """Return the totals in the ``(name, type, help, samples)`` shape tracer collectors use."""
+        with self._lock:
+            builds = dict(self._builds)
+            tokens = dict(self._tokens)
+            max_tokens = dict(self._max_tokens)
+        return [
+            ("interviewai_context_builds_total", "counter", "Prompt contexts assembled by purpose.",
+             [({"purpose": purpose}, count) for purpose, count in sorted(builds.items())]),
+            ("interviewai_context_tokens_total", "counter", "Estimated context tokens by purpose and source.",
+             [({"purpose": purpose, "source": source}, count) for (purpose, source), count in sorted(tokens.items())]),
+            ("interviewai_context_tokens_max", "gauge", "Largest estimated context assembled by purpose.",
+             [({"purpose": purpose}, count) for purpose, count in sorted(max_tokens.items())]),
+        ]
+
+
+stats = ContextStats()
+tracer.add_collector(stats.metrics)
+
+
+def build_context(purpose, resume_analysis, interview_questions, conversation_history, focus="", memory=None,
+                  resume_tokens=RESUME_TOKENS, questions_tokens=QUESTIONS_TOKENS, history_tokens=HISTORY_TOKENS,
+                  question_bank=None, questions_top_k=QUESTIONS_TOP_K):
+    """Assemble the budgeted prompt context for the interview conductor.
+
+    ``focus`` describes what the next prompt is about (role, company, planned
+    topic) and, together with the latest answer, drives which resume facts and
+    researched question sections are kept. With a ``question_bank``
+    (see ``question_bank.QuestionBank``) the research is narrowed to the
+    ``questions_top_k`` individual questions closest to that and the resume
+    gaps instead, falling back to sections when no questions parse. The
+    running interview ``memory`` stands in for the raw history when there is
+    one. Returns a dict with the rendered ``profile``, ``questions`` and
+    ``history`` text plus the estimated ``tokens`` per source; totals are
+    recorded under ``purpose``.
+    """
+    answered = [entry for entry in conversation_history or [] if entry.get("answer")]
+    latest = answered[-1] if answered else {}
+    query = " ".join([focus, latest.get("question", ""), latest.get("answer", "")])
+    asked = " ".join(entry["question"] for entry in answered)
+
+    questions = ""
+    if question_bank is not None and interview_questions:
+        gaps = " ".join((resume_analysis or {}).get("gaps") or [])
+        questions = question_bank.render(
+            interview_questions, f"{query} {gaps}", [entry["question"] for entry in answered], questions_tokens,
+            questions_top_k
+        )
+    context = {
+        "profile": select_profile_facts(resume_analysis, query, resume_tokens),
+        "questions": questions or "\n\n".join(
+            select_sections(split_sections(interview_questions), query, asked, questions_tokens)
+        ),
+        "history": (
+            format_memory(memory, answered, history_tokens) if memory else summarize_history(answered, history_tokens)
+        ),
+    }
+    context["tokens"] = {source: count_tokens(text) for source, text in context.items()}
+    stats.record(purpose, context["tokens"])
+    return context
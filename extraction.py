@@ -0,0 +1,164 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+# Preferred PDF backend; the remaining registered backends are tried in order if it fails
+PDF_BACKEND = os.environ.get("INTERVIEWAI_PDF_BACKEND", "pymupdf")
+
+# Early-stop limits applied to every extraction
+MAX_PAGES = int(os.environ.get("INTERVIEWAI_EXTRACTION_MAX_PAGES", "50"))
+MAX_CHARS = int(os.environ.get("INTERVIEWAI_EXTRACTION_MAX_CHARS", "60000"))
+
+# Documents with at least this many pages are split across worker processes
+PARALLEL_PAGE_THRESHOLD = int(os.environ.get("INTERVIEWAI_EXTRACTION_PARALLEL_PAGES", "20"))
+PARALLEL_WORKERS = int(os.environ.get("INTERVIEWAI_EXTRACTION_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _import_pymupdf():
+    try:
+        import pymupdf
+    except ImportError:
+        # PyMuPDF releases before 1.24.3 only ship the legacy module name
+        import fitz as pymupdf
+    return pymupdf
+
+
+def _pymupdf_page_count(data):
+    pymupdf = _import_pymupdf()
+
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        return doc.page_count
+
+
+def _pymupdf_pages(data, start, stop, max_chars):
+    pymupdf = _import_pymupdf()
+
+    pages = []
+    total = 0
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        for number in range(start, stop):
+            text = doc.load_page(number).get_text()
+            pages.append(text)
+            total += len(text)
+            if total >= max_chars:
+                break
+    return pages
+
+
+def _pypdf2_page_count(data):
+    import PyPDF2
+
+    return len(PyPDF2.PdfReader(BytesIO(data)).pages)
+
+
+def _pypdf2_pages(data, start, stop, max_chars):
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(BytesIO(data))
+    pages = []
+    total = 0
+    for number in range(start, stop):
+        text = reader.pages[number].extract_text() or ""
+        pages.append(text)
+        total += len(text)
+        if total >= max_chars:
+            break
+    return pages
+
+
+# name -> (page counter, page range extractor), in fallback order
+PDF_BACKENDS = {
+    "pymupdf": (_pymupdf_page_count, _pymupdf_pages),
+    "pypdf2": (_pypdf2_page_count, _pypdf2_pages),
+}
+
+
+def _extract_page_range(backend, data, start, stop, max_chars):
+    return PDF_BACKENDS[backend][1](data, start, stop, max_chars)
+
+
+def _get_pool():
+    """Return the shared process pool used for page-parallel extraction."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned workers avoid inheriting the server's threads and locks
+            _pool = ProcessPoolExecutor(
+                max_workers=PARALLEL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _join_limited(pages, max_chars):
+    return "\n".join(pages)[:max_chars].strip()
+
+
+def extract_pdf_text_with(backend, data, max_pages=MAX_PAGES, max_chars=MAX_CHARS, parallel=True):
+    """Extract text from PDF bytes with a single named backend.
+
+    Extraction stops after ``max_pages`` pages or once ``max_chars``
+    characters have been read. Documents of at least
+    ``PARALLEL_PAGE_THRESHOLD`` pages are split into page ranges that are
+    extracted in separate processes.
+    """
+    count_pages, extract_pages = PDF_BACKENDS[backend]
+    page_count = min(count_pages(data), max_pages)
+
+    if not parallel or PARALLEL_WORKERS < 2 or page_count < PARALLEL_PAGE_THRESHOLD:
+        return _join_limited(extract_pages(data, 0, page_count, max_chars), max_chars)
+
+    chunk = -(-page_count // PARALLEL_WORKERS)
+    ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    pool = _get_pool()
+    futures = [pool.submit(_extract_page_range, backend, data, start, stop, max_chars) for start, stop in ranges]
+
+    pages = []
+    total = 0
+    for index, future in enumerate(futures):
+        chunk_pages = future.result()
+        pages.extend(chunk_pages)
+        total += sum(len(text) for text in chunk_pages)
+        if total >= max_chars:
+            for pending in futures[index + 1:]:
+                pending.cancel()
+            break
+    return _join_limited(pages, max_chars)
+
+
+def extract_pdf_text(data, backend=None, max_pages=MAX_PAGES, max_chars=MAX_CHARS):
+    """Extract text from PDF bytes, falling back through the registered backends on failure."""
+    preferred = backend or PDF_BACKEND
+    order = [preferred] + [name for name in PDF_BACKENDS if name != preferred]
+    last_error = None
+    for name in order:
+        try:
+            return extract_pdf_text_with(name, data, max_pages=max_pages, max_chars=max_chars)
+        except Exception as e:
+            last_error = e
+    raise last_error
+
+
+def extract_docx_text(data, max_chars=MAX_CHARS):
+    """Extract paragraph text from DOCX bytes."""
+    import docx
+
+    document = docx.Document(BytesIO(data))
+    paragraphs = []
+    total = 0
+    for paragraph in document.paragraphs:
+        paragraphs.append(paragraph.text)
+        total += len(paragraph.text)
+        if total >= max_chars:
+            break
+    return _join_limited(paragraphs, max_chars)
+
+
+def extract_txt_text(data, max_chars=MAX_CHARS):
+    """Decode UTF-8 text bytes."""
+    return str(data, "utf-8")[:max_chars]
@@ -0,0 +1,327 @@
+import functools
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from telemetry import tracer
+
+# Request budgets per provider; each model gets its own budget of this size
+GEMINI_REQUESTS_PER_MINUTE = float(os.environ.get("INTERVIEWAI_GEMINI_RPM", "600"))
+GEMINI_MAX_CONCURRENCY = int(os.environ.get("INTERVIEWAI_GEMINI_CONCURRENCY", "16"))
+TAVILY_REQUESTS_PER_MINUTE = float(os.environ.get("INTERVIEWAI_TAVILY_RPM", "120"))
+TAVILY_MAX_CONCURRENCY = int(os.environ.get("INTERVIEWAI_TAVILY_CONCURRENCY", "8"))
+
+# Lower values are served first
+INTERACTIVE = 0
+BACKGROUND = 1
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+_OVERLOAD_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_OVERLOAD_ERROR_NAMES = (
+    "ResourceExhausted", "TooManyRequests", "RateLimit", "ServiceUnavailable", "InternalServerError", "BadGateway",
+    "GatewayTimeout",
+)
+
+_local = threading.local()
+
+
+def status_code(error):
+    """Best-effort HTTP status of a provider error (google-api-core, requests, httpx), or None."""
+    for candidate in (getattr(error, "code", None), getattr(error, "status_code", None),
+                      getattr(getattr(error, "response", None), "status_code", None)):
+        if callable(candidate):
+            try:
+                candidate = candidate()
+            except Exception:
+                continue
+        candidate = getattr(candidate, "value", candidate)
+        if isinstance(candidate, int):
+            return candidate
+    return None
+
+
+def is_overload(error):
+    """Whether ``error`` means the provider is rate limiting or overloaded (429/5xx)."""
+    while error is not None:
+        if status_code(error) in _OVERLOAD_STATUS_CODES:
+            return True
+        if any(name in type(error).__name__ for name in _OVERLOAD_ERROR_NAMES) or "429" in str(error):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+@contextmanager
+def track_queue_wait():
+    """Add up the seconds this thread spends queued for capacity inside the block.
+
+    Yields a dict whose ``seconds`` grow as limited calls in the block wait,
+    so callers can report queue time without threading it through return
+    values.
+    """
+    tracker = {"seconds": 0.0}
+    previous = getattr(_local, "tracker", None)
+    _local.tracker = tracker
+    try:
+        yield tracker
+    finally:
+        _local.tracker = previous
+        if previous is not None:
+            previous["seconds"] += tracker["seconds"]
+
+
+def carry_queue_wait(func):
+    """Wrap ``func`` so queue waits inside it count towards the calling thread's ``track_queue_wait``."""
+    tracker = getattr(_local, "tracker", None)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_local, "tracker", None)
+        _local.tracker = tracker
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.tracker = previous
+
+    return wrapper
+
+
+class AttemptCancelled(Exception):
+    """Raised instead of running a slot's block when the caller gave up on the attempt while it queued."""
+
+
+class Admission:
+    """Tracks one model-call attempt through the limiter, and whether it is still wanted.
+
+    While a function wrapped with :func:`with_admission` runs, its first
+    limiter slot marks the admission ``queued`` until capacity frees up, then
+    records ``admitted_at`` and the ``limiter`` that admitted it. Once
+    cancelled, slots raise :class:`AttemptCancelled` rather than start a
+    request, so an abandoned attempt does not reach the provider after
+    waiting its turn. ``settled`` is set when the attempt is admitted or
+    finishes, whichever happens first.
+    """
+
+    def __init__(self):
+        self.queued = False
+        self.admitted_at = None
+        self.limiter = None
+        self.cancelled = False
+        self.settled = threading.Event()
+
+    def queue(self):
+        if self.admitted_at is None:
+            self.queued = True
+
+    def admit(self, limiter):
+        if self.admitted_at is None:
+            self.limiter = limiter
+            self.admitted_at = time.monotonic()
+            self.queued = False
+            self.settled.set()
+
+    def finish(self):
+        self.queued = False
+        self.settled.set()
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def with_admission(func, admission):
+    """Wrap ``func`` so limiter slots opened inside it report to ``admission``."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_local, "admission", None)
+        _local.admission = admission
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.admission = previous
+
+    return wrapper
+
+
+class AdaptiveLimiter:
+    """Token bucket plus AIMD concurrency limit, admitting waiters in priority order.
+
+    Requests are admitted when a token is available (``requests_per_minute``,
+    bursting up to ``burst``) and fewer than the current concurrency limit
+    are in flight. The limit grows by one per limit's worth of successful
+    calls and halves whenever a call fails with a 429 or 5xx, so a
+    throttling provider sees the load back off instead of a retry storm.
+    Waiters with a lower priority value are always admitted first; equal
+    priorities are first come, first served.
+    """
+
+    def __init__(self, requests_per_minute, max_concurrency, burst=None, min_concurrency=1):
+        self.rate = requests_per_minute / 60
+        self.burst = max(1, burst or max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.limit = float(max_concurrency)
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._in_flight = 0
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._wait_seconds = defaultdict(float)
+        self._acquired = defaultdict(int)
+        self._throttled = 0
+
+    def _refill(self, now):
+        if self.rate > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        else:
+            self._tokens = float(self.burst)
+        self._refilled_at = now
+
+    def acquire(self, priority=INTERACTIVE):
+        """Block until this caller may start a request; returns the seconds spent waiting."""
+        started = time.monotonic()
+        ticket = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    self._refill(time.monotonic())
+                    timeout = None
+                    if self._waiters[0] == ticket and self._in_flight < int(self.limit):
+                        if self._tokens >= 1:
+                            break
+                        timeout = (1 - self._tokens) / self.rate
+                    self._condition.wait(timeout)
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiters)
+            self._tokens -= 1
+            self._in_flight += 1
+            waited = time.monotonic() - started
+            self._wait_seconds[priority] += waited
+            self._acquired[priority] += 1
+            # The next waiter in line may be admissible too
+            self._condition.notify_all()
+        return waited
+
+    def release(self, succeeded=True, overloaded=False):
+        """Finish a request, growing the concurrency limit on success and halving it if the provider pushed back."""
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self.limit = max(float(self.min_concurrency), self.limit / 2)
+                self._throttled += 1
+            elif succeeded:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, priority=INTERACTIVE):
+        """Hold capacity for the duration of the block; yields the seconds spent queued.
+
+        Raises :class:`AttemptCancelled` without running the block when the
+        attempt this thread is working on was cancelled (see :class:`Admission`).
+        """
+        admission = getattr(_local, "admission", None)
+        if admission is not None:
+            if admission.cancelled:
+                raise AttemptCancelled("attempt was abandoned before it was admitted")
+            admission.queue()
+        waited = self.acquire(priority)
+        tracker = getattr(_local, "tracker", None)
+        if tracker is not None:
+            tracker["seconds"] += waited
+        if admission is not None:
+            if admission.cancelled:
+                self.release(succeeded=False)
+                raise AttemptCancelled("attempt was abandoned while it queued")
+            admission.admit(self)
+        succeeded = overloaded = False
+        try:
+            yield waited
+            succeeded = True
+        except Exception as e:
+            overloaded = is_overload(e)
+            raise
+        finally:
+            self.release(succeeded, overloaded)
+
+    def snapshot(self):
+        """Return the limiter's counters and current state."""
+        with self._condition:
+            return {
+                "wait_seconds": dict(self._wait_seconds),
+                "acquired": dict(self._acquired),
+                "throttled": self._throttled,
+                "queued": len(self._waiters),
+                "in_flight": self._in_flight,
+                "limit": self.limit,
+            }
+
+
+class RateLimiters:
+    """Process-wide limiters, one per provider and model, created on first use."""
+
+    def __init__(self, budgets):
+        self.budgets = budgets
+        self._lock = threading.Lock()
+        self._limiters = {}
+
+    def get(self, provider, model=""):
+        with self._lock:
+            key = (provider, model)
+            if key not in self._limiters:
+                requests_per_minute, max_concurrency = self.budgets[provider]
+                self._limiters[key] = AdaptiveLimiter(requests_per_minute, max_concurrency)
+            return self._limiters[key]
+
+    def slot(self, provider, model="", priority=INTERACTIVE):
+        """Hold capacity on the ``provider``/``model`` budget for the duration of a ``with`` block."""
+        return self.get(provider, model).slot(priority)
+
+    def throttled(self, provider, model, func, priority=INTERACTIVE):
+        """Wrap ``func`` so every call holds capacity on the ``provider``/``model`` budget."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.slot(provider, model, priority):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def metrics(self):
+        """Return limiter state in the ``(name, type, help, samples)`` shape tracer collectors use."""
+        with self._lock:
+            limiters = dict(self._limiters)
+        waits, acquired, throttled, queued, in_flight, limits = [], [], [], [], [], []
+        for (provider, model), limiter in sorted(limiters.items()):
+            state = limiter.snapshot()
+            labels = {"provider": provider, "model": model}
+            for priority, name in PRIORITY_NAMES.items():
+                waits.append((dict(labels, priority=name), state["wait_seconds"].get(priority, 0.0)))
+                acquired.append((dict(labels, priority=name), state["acquired"].get(priority, 0)))
+            throttled.append((labels, state["throttled"]))
+            queued.append((labels, state["queued"]))
+            in_flight.append((labels, state["in_flight"]))
+            limits.append((labels, round(state["limit"], 3)))
+        return [
+            ("interviewai_limiter_queue_wait_seconds_total", "counter", "Seconds requests spent queued for capacity.", waits),
+            ("interviewai_limiter_admitted_total", "counter", "Requests admitted by the limiter.", acquired),
+            ("interviewai_limiter_throttled_total", "counter", "Requests that failed with 429/5xx, halving concurrency.", throttled),
+            ("interviewai_limiter_queued", "gauge", "Requests currently waiting for capacity.", queued),
+            ("interviewai_limiter_in_flight", "gauge", "Requests currently running.", in_flight),
+            ("interviewai_limiter_concurrency_limit", "gauge", "Current adaptive concurrency limit.", limits),
+        ]
+
+
+limiters = RateLimiters({
+    "gemini": (GEMINI_REQUESTS_PER_MINUTE, GEMINI_MAX_CONCURRENCY),
+    "tavily": (TAVILY_REQUESTS_PER_MINUTE, TAVILY_MAX_CONCURRENCY),
+})
+tracer.add_collector(limiters.metrics)
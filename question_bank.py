@@ -0,0 +1,365 @@
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from context import count_tokens, terms, truncate_to_tokens
+from telemetry import tracer
+
+logger = logging.getLogger(__name__)
+
+# Directory holding one vector index file per distinct research text
+QUESTION_INDEX_PATH = os.environ.get("INTERVIEWAI_QUESTION_INDEX_PATH", os.path.join(".cache", "question_index"))
+# Index files kept on disk and loaded indices kept in memory
+QUESTION_INDEX_MAX_FILES = int(os.environ.get("INTERVIEWAI_QUESTION_INDEX_MAX_FILES", "5000"))
+QUESTION_INDEX_MEMORY_ENTRIES = int(os.environ.get("INTERVIEWAI_QUESTION_INDEX_MEMORY_ENTRIES", "256"))
+
+# "hashing" embeds on the CPU with no extra dependencies; any other value names a
+# sentence-transformers model (e.g. all-MiniLM-L6-v2), which needs that package installed
+EMBEDDING_MODEL = os.environ.get("INTERVIEWAI_EMBEDDING_MODEL", "hashing")
+
+CATEGORIES = ("technical", "behavioral", "culture")
+
+_LIST_ITEM_PATTERN = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+")
+_HEADING_PATTERN = re.compile(
+    r"^\s*(?:#{1,6}\s+(.+)|(?:\d+[.)]\s+)?\*\*([^*]+)\*\*:?\s*|([A-Z][^.?!]{2,60}):)\s*$"
+)
+_LABEL_PATTERN = re.compile(r"^\s*(?:\*\*)?(?:q(?:uestion)?\s*\d*|example)\s*[:.)-]\s*(?:\*\*)?\s*", re.IGNORECASE)
+_PROMPT_START_PATTERN = re.compile(
+    r"^(?:how|what|why|when|where|which|who|can|could|would|do|does|did|have|has|is|are|tell|describe|explain|walk|"
+    r"give|design|share|discuss|implement|write|compare|imagine|suppose)\b",
+    re.IGNORECASE,
+)
+_CATEGORY_KEYWORDS = {
+    "behavioral": (
+        "behavioral", "behavioural", "situational", "a time", "conflict", "challenge you", "mistake", "failure",
+        "disagree", "leadership", "teamwork", "difficult", "pressure", "deadline", "feedback", "star method",
+    ),
+    "culture": (
+        "culture", "values", "mission", "company", "why do you want", "why us", "motivat", "fit in",
+        "diversity", "where do you see", "passion",
+    ),
+    "technical": (
+        "technical", "coding", "system design", "design a", "algorithm", "architecture", "implement", "complexity",
+        "database", "scale", "debug", "model", "case study", "estimate", "calculate", "sql", "api",
+    ),
+}
+_CATEGORY_PATTERNS = {
+    category: re.compile(r"\b(?:" + "|".join(re.escape(keyword) for keyword in keywords) + ")")
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+
+
+def classify(text, default="technical"):
+    """Tag a question or heading with the category whose keywords it mentions most, or ``default``."""
+    lowered = (text or "").lower()
+    scores = {category: len(pattern.findall(lowered)) for category, pattern in _CATEGORY_PATTERNS.items()}
+    best = max(CATEGORIES, key=lambda category: scores[category])
+    return best if scores[best] else default
+
+
+def parse_questions(markdown):
+    """Split researched interview questions into ``(category, question)`` pairs.
+
+    List items and lines ending in a question mark count as questions when
+    they read like one; list markers, bold and "Q1:" labels are stripped.
+    Each question takes the category of the heading it sits under when the
+    heading names one, and is classified on its own words otherwise.
+    Duplicates are dropped.
+    """
+    questions = []
+    seen = set()
+    section = None
+    for line in (markdown or "").splitlines():
+        heading = _HEADING_PATTERN.match(line)
+        if heading and not line.rstrip().endswith("?"):
+            title = next(group for group in heading.groups() if group)
+            section = classify(title, default=None)
+            continue
+        is_item = bool(_LIST_ITEM_PATTERN.match(line))
+        text = _LABEL_PATTERN.sub("", _LIST_ITEM_PATTERN.sub("", line)).replace("**", "").strip(" \"'“”")
+        if not 15 <= len(text) <= 400:
+            continue
+        if not (text.endswith("?") or (is_item and _PROMPT_START_PATTERN.match(text))):
+            continue
+        key = " ".join(sorted(terms(text)))
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        questions.append((section or classify(text), text))
+    return questions
+
+
+class HashingEmbedder:
+    """Embed text as a signed, hashed bag of words and word pairs, L2-normalized.
+
+    Runs on the CPU in microseconds per question with nothing beyond NumPy,
+    and puts questions that share vocabulary close together, which is what
+    matching research against resume gaps and answers needs.
+    """
+
+    def __init__(self, dimensions=512):
+        self.dimensions = dimensions
+        self.name = f"hashing-{dimensions}"
+
+    def _features(self, text):
+        words = sorted(terms(text))
+        return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+    def embed(self, texts):
+        import numpy as np
+
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+                vectors[row, bucket] += 1.0 if digest[4] & 1 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+
+class SentenceTransformerEmbedder:
+    """Embed text with a sentence-transformers model on the CPU; requires the ``sentence-transformers`` package."""
+
+    def __init__(self, model_name):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise RuntimeError(
+                f"Embedding model {model_name!r} needs the sentence-transformers package: pip install sentence-transformers"
+            ) from e
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.name = f"st-{model_name.replace('/', '-')}"
+
+    def embed(self, texts):
+        import numpy as np
+
+        return np.asarray(self.model.encode(list(texts), normalize_embeddings=True), dtype=np.float32)
+
+
+def create_embedder(model):
+    """Create the embedder named by ``model``: "hashing" or a sentence-transformers model name."""
+    if model == "hashing":
+        return HashingEmbedder()
+    return SentenceTransformerEmbedder(model)
+
+
+class QuestionIndex:
+    """Parsed questions with their categories and unit-length embedding vectors, one row per question."""
+
+    def __init__(self, questions, categories, vectors):
+        self.questions = questions
+        self.categories = categories
+        self.vectors = vectors
+
+    def __len__(self):
+        return len(self.questions)
+
+    @classmethod
+    def build(cls, markdown, embedder):
+        import numpy as np
+
+        parsed = parse_questions(markdown)
+        vectors = embedder.embed([text for _, text in parsed]) if parsed else np.zeros((0, 0), dtype=np.float32)
+        return cls([text for _, text in parsed], [category for category, _ in parsed], vectors)
+
+    @classmethod
+    def load(cls, path):
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["questions"].tolist(), data["categories"].tolist(), data["vectors"])
+
+    def save(self, path):
+        """Write the index to ``path`` atomically, so concurrent readers never see a partial file."""
+        import numpy as np
+
+        directory = os.path.dirname(path) or "."
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as handle:
+            np.savez(
+                handle,
+                questions=np.array(self.questions, dtype=str),
+                categories=np.array(self.categories, dtype=str),
+                vectors=self.vectors,
+            )
+        os.replace(handle.name, path)
+
+    def search(self, query_vector, k, avoid_vectors=None):
+        """Return the indices of the ``k`` questions closest to ``query_vector``, best first.
+
+        Questions close to ``avoid_vectors`` (questions already asked) are
+        pushed down the ranking rather than excluded, so a short bank still
+        fills the prompt.
+        """
+        import numpy as np
+
+        if not len(self) or k <= 0:
+            return []
+        scores = self.vectors @ query_vector
+        if avoid_vectors is not None and len(avoid_vectors):
+            scores = scores - 0.5 * (self.vectors @ avoid_vectors.T).max(axis=1)
+        k = min(k, len(self))
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top], kind="stable")].tolist()
+
+
+class QuestionBank:
+    """Question indices stored on disk, one per distinct research text, with the hottest kept in memory.
+
+    Files are named after a digest of the research and the embedder, so
+    every session and process on the host reuses an index once it has been
+    built, and switching embedding models never mixes vectors. The embedder
+    is created on first use.
+    """
+
+    def __init__(self, directory, model=EMBEDDING_MODEL, max_files=QUESTION_INDEX_MAX_FILES,
+                 memory_entries=QUESTION_INDEX_MEMORY_ENTRIES):
+        self.directory = directory
+        self.model = model
+        self.max_files = max_files
+        self.memory_entries = memory_entries
+        self._embedder = None
+        self._lock = threading.Lock()
+        self._indices = OrderedDict()
+        self._counters = defaultdict(int)
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    @property
+    def embedder(self):
+        with self._lock:
+            if self._embedder is None:
+                self._embedder = create_embedder(self.model)
+            return self._embedder
+
+    def path_for(self, markdown):
+        digest = hashlib.sha256(f"{self.embedder.name}\n{markdown}".encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{digest}.npz")
+
+    def index_for(self, markdown):
+        """Return the index of ``markdown``, loading it from disk or building and saving it on first use.
+
+        A file that cannot be read back (truncated, or not an index at all) is
+        deleted and the index rebuilt in its place.
+        """
+        path = self.path_for(markdown)
+        with self._lock:
+            if path in self._indices:
+                self._indices.move_to_end(path)
+                return self._indices[path]
+
+        index = None
+        if os.path.exists(path):
+            try:
+                index = QuestionIndex.load(path)
+                self._count("loads")
+            except Exception as e:
+                logger.warning("Discarding unreadable question index %s: %s", path, e)
+                self._count("corrupt")
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        if index is None:
+            index = QuestionIndex.build(markdown, self.embedder)
+            self._count("builds")
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                index.save(path)
+                self._prune()
+            except OSError:
+                # The index still serves this process from memory
+                pass
+
+        with self._lock:
+            self._indices[path] = index
+            self._indices.move_to_end(path)
+            while len(self._indices) > self.memory_entries:
+                self._indices.popitem(last=False)
+        return index
+
+    def _prune(self):
+        """Delete the least recently written index files beyond ``max_files``."""
+        files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".npz")]
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:len(files) - self.max_files]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def retrieve(self, markdown, query, avoid=(), k=8):
+        """Return up to ``k`` ``(category, question)`` pairs from ``markdown`` most relevant to ``query``.
+
+        ``avoid`` lists questions already asked; questions close to them rank
+        lower.
+        """
+        started = time.perf_counter()
+        index = self.index_for(markdown)
+        if not len(index):
+            return []
+        texts = [query, *avoid]
+        vectors = self.embedder.embed(texts)
+        ranked = index.search(vectors[0], k, vectors[1:] if avoid else None)
+        self._count("retrievals")
+        self._count("retrieval_seconds", time.perf_counter() - started)
+        return [(index.categories[row], index.questions[row]) for row in ranked]
+
+    def render(self, markdown, query, avoid, budget, k):
+        """Render the most relevant questions as a tagged list within ``budget`` tokens.
+
+        Questions are kept in relevance order until the budget runs out; a
+        question that does not fit whole is shortened when enough budget is
+        left. Returns "" when no questions parse or retrieval fails, e.g.
+        the embedder is unavailable, so callers can fall back to whole
+        sections.
+        """
+        try:
+            retrieved = self.retrieve(markdown, query, avoid, k)
+        except Exception as e:
+            logger.warning("Question retrieval failed, falling back to research sections: %s", e)
+            self._count("errors")
+            return ""
+        lines = []
+        remaining = budget
+        for category, question in retrieved:
+            line = f"- [{category}] {question}"
+            cost = count_tokens(line) + 1
+            if cost > remaining:
+                if remaining >= 20:
+                    lines.append(truncate_to_tokens(line, remaining - 1))
+                break
+            lines.append(line)
+            remaining -= cost
+        return "\n".join(lines)
+
+    def metrics(self):
+        """Return index counters in the ``(name, type, help, samples)`` shape tracer collectors use."""
+        with self._lock:
+            counters = dict(self._counters)
+            in_memory = len(self._indices)
+        return [
+            ("interviewai_question_index_builds_total", "counter", "Question indices parsed and embedded.", [({}, counters.get("builds", 0))]),
+            ("interviewai_question_index_loads_total", "counter", "Question indices loaded from disk.", [({}, counters.get("loads", 0))]),
+            ("interviewai_question_index_corrupt_total", "counter", "Unreadable question index files deleted and rebuilt.",
+             [({}, counters.get("corrupt", 0))]),
+            ("interviewai_question_index_in_memory", "gauge", "Question indices held in memory.", [({}, in_memory)]),
+            ("interviewai_question_retrievals_total", "counter", "Relevant-question lookups.", [({}, counters.get("retrievals", 0))]),
+            ("interviewai_question_retrieval_seconds_total", "counter", "Seconds spent on relevant-question lookups.",
+             [({}, round(counters.get("retrieval_seconds", 0.0), 6))]),
+            ("interviewai_question_retrieval_errors_total", "counter", "Lookups that fell back to research sections.",
+             [({}, counters.get("errors", 0))]),
+        ]
+
+
+bank = QuestionBank(QUESTION_INDEX_PATH)
+tracer.add_collector(bank.metrics)
@@ -0,0 +1,208 @@
+"""PDF interview report.
+
+reportlab is imported inside the rendering functions, so importing this
+module (for :func:`report_fingerprint`) stays cheap on a cold start.
+"""
+import hashlib
+import json
+import re
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+ACCENT = "#1E40AF"
+MUTED = "#404040"
+BORDER = "#D1D5DB"
+
+# Answers are printed in full up to this many characters
+MAX_ANSWER_CHARS = 4000
+
+
+def report_fingerprint(report):
+    """Hash the report contents so identical transcripts map to the same cached PDF."""
+    return hashlib.sha256(json.dumps(report, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _styles():
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle("ReportTitle", parent=styles["Title"], textColor=HexColor(ACCENT), spaceAfter=4),
+        "subtitle": ParagraphStyle("ReportSubtitle", parent=styles["Normal"], textColor=HexColor(MUTED), alignment=1, spaceAfter=14),
+        "heading": ParagraphStyle("ReportHeading", parent=styles["Heading2"], textColor=HexColor(ACCENT), spaceBefore=12),
+        "question": ParagraphStyle("ReportQuestion", parent=styles["Heading4"], spaceBefore=10, spaceAfter=2),
+        "body": ParagraphStyle("ReportBody", parent=styles["BodyText"], leading=14),
+        "label": ParagraphStyle("ReportLabel", parent=styles["BodyText"], textColor=HexColor(MUTED), spaceBefore=4),
+        "bullet": ParagraphStyle("ReportBullet", parent=styles["BodyText"], leftIndent=14, bulletIndent=4, leading=14),
+    }
+
+
+def _inline(text):
+    """Escape text for a reportlab paragraph, keeping markdown bold as <b>."""
+    return re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", escape(text))
+
+
+def markdown_flowables(text, styles):
+    """Render the small markdown subset used in feedback (bold, bullets, paragraphs)."""
+    from reportlab.platypus import Paragraph
+
+    flowables = []
+    paragraph = []
+
+    def flush():
+        if paragraph:
+            flowables.append(Paragraph(_inline(" ".join(paragraph)), styles["body"]))
+            paragraph.clear()
+
+    for line in (text or "").splitlines():
+        stripped = line.strip()
+        bullet = re.match(r"^(?:[-*•]|\d+[.)])\s+(.*)", stripped)
+        if not stripped:
+            flush()
+        elif bullet:
+            flush()
+            flowables.append(Paragraph(_inline(bullet.group(1)), styles["bullet"], bulletText="•"))
+        else:
+            paragraph.append(stripped.lstrip("#").strip())
+    flush()
+    return flowables
+
+
+def score_chart(entries, width):
+    """Bar chart of the score per question, or None when nothing was scored."""
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.units import inch
+
+    scored = [entry for entry in entries if entry.get("score") is not None]
+    if not scored:
+        return None
+
+    height = 2.2 * inch
+    drawing = Drawing(width, height)
+    chart = VerticalBarChart()
+    chart.x, chart.y = 30, 30
+    chart.width, chart.height = width - 40, height - 50
+    chart.data = [[entry["score"] for entry in scored]]
+    chart.categoryAxis.categoryNames = [f"Q{entry['question_num']}" for entry in scored]
+    chart.categoryAxis.labels.fontName = chart.valueAxis.labels.fontName = "Helvetica"
+    if len(scored) > 20:
+        # Rotate labels so long interviews stay readable
+        chart.categoryAxis.labels.angle = 90
+        chart.categoryAxis.labels.boxAnchor = "e"
+        chart.categoryAxis.labels.fontSize = 6
+        chart.categoryAxis.labels.dy = -2
+    chart.valueAxis.valueMin, chart.valueAxis.valueMax, chart.valueAxis.valueStep = 0, 10, 2
+    chart.bars[0].fillColor = HexColor(ACCENT)
+    chart.bars[0].strokeColor = None
+    drawing.add(chart)
+    drawing.add(String(0, height - 12, "Score per question (out of 10)", fontName="Helvetica", fontSize=9, fillColor=HexColor(MUTED)))
+    return drawing
+
+
+def summary_table(entries):
+    """Key figures of the interview: answers given, average, strongest and weakest answer."""
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Table, TableStyle
+
+    scored = [entry for entry in entries if entry.get("score") is not None]
+    rows = [["Questions answered", str(len(entries))]]
+    if scored:
+        best = max(scored, key=lambda entry: entry["score"])
+        weakest = min(scored, key=lambda entry: entry["score"])
+        rows += [
+            ["Average score", f"{sum(entry['score'] for entry in scored) / len(scored):.1f}/10"],
+            ["Strongest answer", f"Q{best['question_num']} ({best['score']}/10)"],
+            ["Needs most work", f"Q{weakest['question_num']} ({weakest['score']}/10)"],
+        ]
+    table = Table(rows, colWidths=[2.2 * inch, 2.5 * inch], hAlign="LEFT")
+    table.setStyle(TableStyle([
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("TEXTCOLOR", (0, 0), (0, -1), HexColor(MUTED)),
+        ("LINEBELOW", (0, 0), (-1, -1), 0.5, HexColor(BORDER)),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    ]))
+    return table
+
+
+def resume_flowables(resume_analysis, styles):
+    """Render the structured resume analysis."""
+    from reportlab.platypus import Paragraph
+
+    if not resume_analysis:
+        return []
+
+    flowables = [Paragraph(f"<b>Seniority:</b> {escape(str(resume_analysis.get('seniority', '')).title())}", styles["body"])]
+    if resume_analysis.get("role_fit"):
+        flowables.append(Paragraph(f"<b>Fit for the role:</b> {escape(resume_analysis['role_fit'])}", styles["body"]))
+    for title, field in (("Key skills", "skills"), ("Strengths", "strengths"), ("Gaps", "gaps")):
+        items = resume_analysis.get(field) or []
+        if items:
+            flowables.append(Paragraph(title, styles["label"]))
+            flowables += [Paragraph(escape(item), styles["bullet"], bulletText="•") for item in items]
+    return flowables
+
+
+def build_interview_report(job_role, company_name, resume_analysis, conversation_history, generated_at):
+    """Render the interview report as PDF bytes.
+
+    The report holds a score summary and chart, the resume analysis and every
+    question with its answer and feedback. It is built in memory; nothing is
+    written to disk.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import KeepTogether, Paragraph, SimpleDocTemplate, Spacer
+
+    styles = _styles()
+    buffer = BytesIO()
+    document = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        leftMargin=0.8 * inch,
+        rightMargin=0.8 * inch,
+        topMargin=0.7 * inch,
+        bottomMargin=0.7 * inch,
+        title=f"Interview Report - {job_role} at {company_name}",
+        author="InterviewAI",
+    )
+    entries = sorted(conversation_history, key=lambda entry: entry["question_num"])
+
+    story = [
+        Paragraph("InterviewAI Interview Report", styles["title"]),
+        Paragraph(f"{escape(job_role)} at {escape(company_name)} · {escape(generated_at)}", styles["subtitle"]),
+        Paragraph("Summary", styles["heading"]),
+        summary_table(entries),
+        Spacer(1, 10),
+    ]
+    chart = score_chart(entries, document.width)
+    if chart is not None:
+        story.append(chart)
+
+    resume = resume_flowables(resume_analysis, styles)
+    if resume:
+        story += [Paragraph("Resume Analysis", styles["heading"])] + resume
+
+    story.append(Paragraph("Interview Transcript", styles["heading"]))
+    for entry in entries:
+        title = f"Question {entry['question_num']}"
+        if entry.get("score") is not None:
+            title += f" · {entry['score']}/10"
+        answer = entry.get("answer") or ""
+        if len(answer) > MAX_ANSWER_CHARS:
+            answer = answer[:MAX_ANSWER_CHARS] + "…"
+        story.append(KeepTogether([
+            Paragraph(escape(title), styles["question"]),
+            Paragraph(_inline(entry.get("question") or ""), styles["body"]),
+            Paragraph("Your answer", styles["label"]),
+            Paragraph(escape(answer).replace("\n", "<br/>"), styles["body"]),
+        ]))
+        if entry.get("feedback"):
+            story.append(Paragraph("Feedback", styles["label"]))
+            story += markdown_flowables(entry["feedback"], styles)
+
+    document.build(story)
+    return buffer.getvalue()
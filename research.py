@@ -0,0 +1,141 @@
+import os
+import time
+
+from agents import copy_agent, create_agent, create_search_tools
+from cache import PersistentCache, normalize_key
+from limits import BACKGROUND
+from resilience import CallPolicy, call_with_policy
+from telemetry import count_tool_calls, tracer
+
+# Research agent budget: web searches per request and wall-clock limit in seconds
+RESEARCH_TOOL_CALL_LIMIT = int(os.environ.get("INTERVIEWAI_RESEARCH_TOOL_CALL_LIMIT", "3"))
+RESEARCH_TIMEOUT_SECONDS = float(os.environ.get("INTERVIEWAI_RESEARCH_TIMEOUT", "60"))
+RESEARCH_CALL_POLICY = CallPolicy(deadline=RESEARCH_TIMEOUT_SECONDS, attempts=2)
+
+# Shared cache for company/role interview question research
+RESEARCH_CACHE_TTL_SECONDS = int(os.environ.get("INTERVIEWAI_RESEARCH_CACHE_TTL", str(7 * 24 * 3600)))
+RESEARCH_CACHE_MAX_ENTRIES = int(os.environ.get("INTERVIEWAI_RESEARCH_CACHE_MAX_ENTRIES", "5000"))
+
+# Job categories and roles
+JOB_CATEGORIES = {
+    "Technology": [
+        "Software Engineer", "Data Scientist", "Machine Learning Engineer", 
+        "DevOps Engineer", "Cybersecurity Analyst", "Product Manager",
+        "UI/UX Designer", "Full Stack Developer", "Backend Developer",
+        "Frontend Developer", "Cloud Architect", "AI Engineer"
+    ],
+    "Finance": [
+        "Financial Analyst", "Investment Banker", "Risk Manager",
+        "Portfolio Manager", "Accountant", "Financial Planner",
+        "Quantitative Analyst", "Treasury Analyst"
+    ],
+    "Marketing": [
+        "Digital Marketing Manager", "Content Marketing Specialist",
+        "Social Media Manager", "Brand Manager", "SEO Specialist",
+        "Marketing Analyst", "Growth Hacker"
+    ],
+    "Healthcare": [
+        "Nurse", "Doctor", "Healthcare Administrator", "Medical Technician",
+        "Pharmacist", "Physical Therapist", "Healthcare Analyst"
+    ],
+    "Consulting": [
+        "Management Consultant", "Strategy Consultant", "Business Analyst",
+        "Operations Consultant", "IT Consultant"
+    ],
+    "Sales": [
+        "Sales Representative", "Account Manager", "Business Development Manager",
+        "Sales Engineer", "Customer Success Manager"
+    ]
+}
+
+INTERVIEW_QUESTIONS_SCRAPER_PROMPT = """
+You are an expert interview preparation specialist with deep knowledge of recruitment processes across industries.
+Your role is to research and compile comprehensive interview questions for specific companies and job roles.
+
+When given a company name and job role, use web search to find:
+1. Company-specific interview questions and experiences
+2. Technical questions relevant to the role
+3. Behavioral questions commonly asked
+4. Company culture and value-based questions
+5. Role-specific scenarios and case studies
+6. Recent interview experiences shared by candidates
+7. Questions about company products, services, and challenges
+
+Compile this information into a structured format categorized by question type (technical, behavioral, company-specific, etc.).
+Focus on authentic, recently reported interview questions rather than generic ones.
+"""
+
+
+def create_research_agent(google_api_key, tavily_api_key):
+    """Create the research agent, the only profile with web search tools.
+
+    Requests run on a copy of this agent (see ``run_research``) so the
+    tool-call limit applies per request.
+    """
+    return create_agent(
+        google_api_key,
+        system_prompt=INTERVIEW_QUESTIONS_SCRAPER_PROMPT,
+        tools=[create_search_tools(tavily_api_key)],
+        tool_call_limit=RESEARCH_TOOL_CALL_LIMIT,
+        markdown=True,
+    )
+
+
+def open_research_cache(storage):
+    """Open the shared interview question research cache on ``storage``."""
+    return PersistentCache(
+        storage,
+        namespace="interview_questions",
+        ttl_seconds=RESEARCH_CACHE_TTL_SECONDS,
+        max_entries=RESEARCH_CACHE_MAX_ENTRIES,
+    )
+
+
+def build_interview_questions_prompt(company_name, job_role):
+    """Build the interview questions research prompt."""
+    return f"""
+            Research and compile comprehensive interview questions for:
+            Company: {company_name}
+            Job Role: {job_role}
+            
+            Find and organize:
+            1. Company-specific interview questions
+            2. Technical questions for {job_role}
+            3. Behavioral questions
+            4. Culture and values-based questions
+            5. Recent candidate experiences
+            
+            Focus on authentic, recently reported questions from reliable sources.
+            """
+
+
+def research_cache_key(company_name, job_role):
+    """Build the research cache key for a company/role pair."""
+    return normalize_key(company_name, job_role)
+
+
+def run_research(agent, company_name, job_role, priority=BACKGROUND):
+    """Research interview questions for a company/role pair on a per-request copy of the research agent.
+
+    Phidata's tool-call counter lives on the model and is not reset between
+    runs, so each attempt gets a fresh copy for ``RESEARCH_TOOL_CALL_LIMIT``
+    to apply to it alone. The call is abandoned after
+    ``RESEARCH_TIMEOUT_SECONDS``. Returns the response text, the elapsed
+    seconds and the number of tool calls the request made.
+    """
+    prompt = build_interview_questions_prompt(company_name, job_role)
+
+    def attempt():
+        return tracer.run("scrape_interview_questions", copy_agent(agent, priority), prompt)
+
+    started = time.perf_counter()
+    response = call_with_policy("scrape_interview_questions", attempt, RESEARCH_CALL_POLICY)
+    return response.content.strip(), time.perf_counter() - started, count_tool_calls(response)
+
+
+def research_interview_questions(agent, company_name, job_role, cache, priority=BACKGROUND):
+    """Research interview questions, storing the result in the shared cache."""
+    content, elapsed, tool_calls = run_research(agent, company_name, job_role, priority)
+    if content:
+        cache.set(research_cache_key(company_name, job_role), content)
+    return content, elapsed, tool_calls
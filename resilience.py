@@ -0,0 +1,245 @@
+import json
+import queue
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from limits import Admission, carry_queue_wait, is_overload, with_admission
+from telemetry import tracer
+
+
+class CallPolicy:
+    """Deadline, retry and hedging settings for one kind of model call.
+
+    ``deadline`` bounds the whole call, retries included, in seconds.
+    Failed attempts are retried up to ``attempts`` in total after a
+    jittered exponential backoff starting at ``base_delay``. With ``hedge``
+    set, an attempt still running past the call's recent p95 latency, counted
+    from when the limiter admitted it, gets a duplicate, and whichever
+    finishes first wins.
+    """
+
+    def __init__(self, deadline, attempts=3, base_delay=0.5, max_delay=8.0, hedge=False):
+        self.deadline = deadline
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+
+
+def backoff_delay(attempt, base_delay, max_delay):
+    """Full-jitter exponential backoff before retry number ``attempt`` (1-based)."""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+def is_retryable(error):
+    """Whether a failed attempt is worth repeating: throttling, 5xx, timeouts, dropped connections or malformed output."""
+    if is_overload(error) or isinstance(error, (TimeoutError, ConnectionError, json.JSONDecodeError)):
+        return True
+    # Structured responses that fail validation are usually fixed by asking again
+    return type(error).__name__ == "ValidationError"
+
+
+class ResilienceStats:
+    """Thread-safe counts of retries, hedges and deadline misses per call, exported as metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(int)
+
+    def record(self, function, event):
+        with self._lock:
+            self._counts[(function, event)] += 1
+
+    def metrics(self):
+        """Return the counts in the ``(name, type, help, samples)`` shape tracer collectors use."""
+        with self._lock:
+            counts = dict(self._counts)
+        descriptions = {
+            "retry": ("interviewai_llm_retries_total", "Attempts repeated after a retryable failure."),
+            "hedge": ("interviewai_llm_hedges_total", "Duplicate attempts started past the p95 latency."),
+            "hedge_won": ("interviewai_llm_hedge_wins_total", "Calls answered by the hedged duplicate."),
+            "deadline": ("interviewai_llm_deadline_exceeded_total", "Calls that ran out of time."),
+            "stall": ("interviewai_llm_stream_stalls_total", "Streams abandoned after going quiet mid-response."),
+        }
+        return [
+            (name, "counter", help_text,
+             [({"function": function}, count) for (function, kind), count in sorted(counts.items()) if kind == event])
+            for event, (name, help_text) in descriptions.items()
+        ]
+
+
+stats = ResilienceStats()
+tracer.add_collector(stats.metrics)
+
+
+def _start(func):
+    """Run ``func`` on a daemon thread; returns a Future for its result and the attempt's :class:`Admission`.
+
+    Daemon threads let an abandoned attempt (past the deadline, or beaten by
+    its hedge) finish in the background without holding up the caller or
+    shutdown; one still queued for capacity gives up once admitted.
+    """
+    future = Future()
+    admission = Admission()
+    func = with_admission(carry_queue_wait(func), admission)
+
+    def _target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            admission.finish()
+
+    threading.Thread(target=_target, daemon=True, name="model-call").start()
+    return future, admission
+
+
+def _should_hedge(future, admission, started, hedge_after, deadline):
+    """Wait until ``future`` has run ``hedge_after`` seconds since admission; returns whether to start a duplicate.
+
+    Time spent queued for capacity is not latency, and a duplicate would
+    only queue behind it, so the clock starts once the limiter admits the
+    attempt (or when it started, if it holds no limiter slot). No duplicate
+    is started while other requests queue on the same limiter.
+    """
+    while True:
+        if admission.queued:
+            admission.settled.wait(max(0.0, deadline - time.monotonic()))
+        hedge_at = (admission.admitted_at or started) + hedge_after
+        now = time.monotonic()
+        if future.done() or hedge_at >= deadline or now >= deadline:
+            return False
+        if now < hedge_at or admission.queued:
+            wait({future}, timeout=max(0.0, hedge_at - now))
+            continue
+        limiter = admission.limiter
+        return limiter is None or limiter.snapshot()["queued"] == 0
+
+
+def _attempt(func, function, timeout, hedge_after):
+    """Run one attempt, plus a hedged duplicate if it outlives ``hedge_after``; returns the first success.
+
+    Attempts still running when this returns or times out are cancelled.
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    primary, admission = _start(func)
+    admissions = {primary: admission}
+    try:
+        if hedge_after is not None and _should_hedge(primary, admission, started, hedge_after, deadline):
+            stats.record(function, "hedge")
+            hedge, hedge_admission = _start(func)
+            admissions[hedge] = hedge_admission
+
+        error = None
+        pending = set(admissions)
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    if future is not primary:
+                        stats.record(function, "hedge_won")
+                    return future.result()
+                error = future.exception()
+        if error is not None and not pending:
+            raise error
+        raise TimeoutError(f"{function} attempt did not finish within {timeout:.1f}s")
+    finally:
+        for future, attempt_admission in admissions.items():
+            if not future.done():
+                attempt_admission.cancel()
+
+
+_STREAM_END = object()
+
+
+def stream_with_deadline(function, func, timeout, idle_timeout):
+    """Yield the items of the iterator ``func()`` returns, consumed on a daemon thread.
+
+    Raises TimeoutError if the first item has not arrived within ``timeout``
+    seconds, queueing for capacity included, or if a later item takes longer
+    than ``idle_timeout`` after the one before. However the caller stops, the
+    stream is cancelled: still queued, it never sends its request; already
+    streaming, it is closed, releasing its limiter slot, as soon as its next
+    chunk arrives.
+    """
+    items = queue.Queue()
+    admission = Admission()
+    stopped = threading.Event()
+
+    def _produce():
+        try:
+            stream = func()
+            try:
+                for item in stream:
+                    if stopped.is_set():
+                        break
+                    items.put((item, None))
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+            items.put((_STREAM_END, None))
+        except BaseException as e:
+            items.put((_STREAM_END, e))
+        finally:
+            admission.finish()
+
+    produce = with_admission(carry_queue_wait(_produce), admission)
+    threading.Thread(target=produce, daemon=True, name="model-stream").start()
+    deadline = time.monotonic() + timeout
+    started = False
+    try:
+        while True:
+            try:
+                item, error = items.get(timeout=idle_timeout if started else max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                if started:
+                    stats.record(function, "stall")
+                    raise TimeoutError(f"{function} stream stalled for {idle_timeout:g}s") from None
+                stats.record(function, "deadline")
+                raise TimeoutError(f"{function} did not start streaming within {timeout:.1f}s") from None
+            if item is _STREAM_END:
+                if error is not None:
+                    raise error
+                return
+            started = True
+            yield item
+    finally:
+        stopped.set()
+        admission.cancel()
+
+
+def call_with_policy(function, func, policy, hedge_after=None):
+    """Call ``func()`` under ``policy``: retry retryable failures with backoff, within the deadline.
+
+    ``hedge_after`` is the latency in seconds past which an attempt gets a
+    duplicate; it is ignored unless the policy allows hedging. The last
+    error is raised when attempts or time run out.
+    """
+    started = time.monotonic()
+    attempt = 1
+    while True:
+        remaining = policy.deadline - (time.monotonic() - started)
+        try:
+            return _attempt(func, function, remaining, hedge_after if policy.hedge else None)
+        except Exception as e:
+            if isinstance(e, TimeoutError) and time.monotonic() - started >= policy.deadline:
+                stats.record(function, "deadline")
+                raise TimeoutError(f"{function} did not finish within {policy.deadline:g}s") from e
+            if attempt >= policy.attempts or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, policy.base_delay, policy.max_delay)
+            if time.monotonic() - started + delay >= policy.deadline:
+                raise
+            stats.record(function, "retry")
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,88 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ResumeAnalysis(BaseModel):
+    """Structured profile of a candidate extracted from their resume."""
+
+    skills: List[str] = Field(default_factory=list, description="Key technical and domain skills, most relevant first")
+    seniority: str = Field(..., description="Overall career level: entry, mid, senior or lead")
+    strengths: List[str] = Field(default_factory=list, description="Notable strengths, achievements and expertise")
+    gaps: List[str] = Field(default_factory=list, description="Weaknesses or gaps relative to the target role")
+    role_fit: str = Field("", description="One or two sentences on the candidate's fit for the target role")
+
+    def to_markdown(self):
+        """Render the profile for display in the app."""
+        sections = [f"**Seniority:** {self.seniority.title()}"]
+        if self.role_fit:
+            sections.append(f"**Fit for the role:** {self.role_fit}")
+        for title, items in (
+            ("Key skills", self.skills),
+            ("Strengths", self.strengths),
+            ("Gaps", self.gaps),
+        ):
+            if items:
+                sections.append(f"**{title}:**\n" + "\n".join(f"- {item}" for item in items))
+        return "\n\n".join(sections)
+
+
+class AnswerEvaluation(BaseModel):
+    """Structured feedback on a single interview answer."""
+
+    score: int = Field(..., ge=0, le=10, description="Score for the answer out of 10")
+    strengths: List[str] = Field(default_factory=list, description="Strengths in the answer")
+    improvements: List[str] = Field(default_factory=list, description="Areas for improvement")
+    suggestions: List[str] = Field(default_factory=list, description="Specific, actionable suggestions")
+
+    def to_markdown(self):
+        """Render the evaluation the way free-form feedback is shown in the app."""
+        sections = [f"**Score:** {self.score}/10"]
+        for title, items in (
+            ("Strengths", self.strengths),
+            ("Areas for improvement", self.improvements),
+            ("Suggestions", self.suggestions),
+        ):
+            if items:
+                sections.append(f"**{title}:**\n" + "\n".join(f"- {item}" for item in items))
+        return "\n\n".join(sections)
+
+
+class InterviewMemory(BaseModel):
+    """Running summary of the interview so far, updated after every answer."""
+
+    topics_covered: List[str] = Field(default_factory=list, description="Topics the questions so far have covered, at most 8")
+    weaknesses_probed: List[str] = Field(default_factory=list, description="Weaknesses the answers so far have revealed, at most 8")
+
+
+class TurnEvaluation(AnswerEvaluation):
+    """Evaluation of one answer together with the updated interview memory."""
+
+    memory: Optional[InterviewMemory] = Field(None, description="Interview memory updated with this question and answer")
+
+
+class QuestionEvaluation(AnswerEvaluation):
+    """Evaluation of one answer inside a batched transcript review."""
+
+    question_num: int = Field(..., description="Number of the question being evaluated")
+
+
+class TranscriptEvaluation(BaseModel):
+    """Evaluations for every answer of an interview transcript."""
+
+    evaluations: List[QuestionEvaluation] = Field(..., description="One evaluation per answered question")
+
+
+class PlannedQuestion(BaseModel):
+    """One question of a pre-generated interview plan."""
+
+    question: str = Field(..., description="The question exactly as it should be asked")
+    category: str = Field(..., description="Question type, e.g. warm-up, technical, behavioral, company-specific")
+    difficulty: int = Field(..., ge=1, le=5, description="Difficulty from 1 (easy) to 5 (hard)")
+    expected_score: int = Field(..., ge=0, le=10, description="Score out of 10 this candidate is expected to reach")
+
+
+class InterviewPlan(BaseModel):
+    """Ordered, difficulty-graded interview questions."""
+
+    questions: List[PlannedQuestion] = Field(..., description="Questions in the order they should be asked")
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import re
+import threading
+
+_TOKEN_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+def valid_token(token):
+    """Whether ``token`` looks like a session token this app issued (32 hex characters)."""
+    return isinstance(token, str) and bool(_TOKEN_PATTERN.fullmatch(token))
+
+
+def value_digest(value):
+    """Stable digest of a JSON-serializable value, used to detect changed state keys."""
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def changed_values(state, keys, digests):
+    """Return the ``keys`` of ``state`` whose value changed since their digest was last recorded.
+
+    ``digests`` maps key to the digest of the value last persisted and is
+    updated in place, so a caller that saves the returned values keeps it in
+    step with the store. Keys missing from ``state`` are skipped.
+    """
+    changes = {}
+    for key in keys:
+        if key not in state:
+            continue
+        digest = value_digest(state[key])
+        if digests.get(key) != digest:
+            changes[key] = state[key]
+            digests[key] = digest
+    return changes
+
+
+class SessionStore:
+    """Interview sessions kept in a :class:`storage.Storage`, one entry per state key.
+
+    Sessions are identified by an opaque token, so any replica sharing the
+    storage can pick a session up. A checkpoint only writes the keys that
+    changed rather than the whole session, and each write pushes the
+    session's expiry back by ``ttl_seconds``.
+    """
+
+    def __init__(self, storage, ttl_seconds):
+        self.storage = storage
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._counters = {"restores": 0, "writes": 0, "keys_written": 0}
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    @staticmethod
+    def namespace(token):
+        return f"session:{token}"
+
+    def load(self, token):
+        """Return the stored ``{key: value}`` state for ``token`` (empty when unknown or expired)."""
+        values = self.storage.get_all(self.namespace(token))
+        if values:
+            self._count("restores")
+        return {key: json.loads(value) for key, value in values.items()}
+
+    def save(self, token, changes):
+        """Write the ``{key: value}`` pairs in ``changes`` for ``token``."""
+        if not changes:
+            return
+        namespace = self.namespace(token)
+        self.storage.set_many(namespace, {key: json.dumps(value, default=str) for key, value in changes.items()})
+        self.storage.expire(namespace, self.ttl_seconds)
+        self._count("writes")
+        self._count("keys_written", len(changes))
+
+    def stats(self):
+        """Return restore/write counters for this process."""
+        with self._lock:
+            return dict(self._counters)
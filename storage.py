@@ -0,0 +1,414 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# Storage behind the caches and saved sessions: "sqlite" (a local file, shared by processes on
+# one host), "memory" (this process only) or "redis" (shared by every replica). Set with
+# INTERVIEWAI_STORAGE, INTERVIEWAI_CACHE_PATH and INTERVIEWAI_REDIS_URL, read when storage is opened
+DEFAULT_STORAGE_BACKEND = "sqlite"
+DEFAULT_CACHE_PATH = os.path.join(".cache", "interviewai.sqlite3")
+DEFAULT_REDIS_URL = "redis://localhost:6379/0"
+
+
+class Storage:
+    """Key/value storage shared by the caches and the session store.
+
+    Entries are strings grouped in namespaces. ``get`` returns the value with
+    the time it was written and marks the entry as recently used, while
+    ``peek`` reads it without doing so; ``set`` can bound a namespace by evicting its least recently used entries. A whole
+    namespace can be given an expiry, which each call to ``expire`` pushes
+    back. Callers serialize their own values.
+    """
+
+    def get(self, namespace, key):
+        """Return ``(value, created_at)`` for ``key``, or None when it is missing."""
+        raise NotImplementedError
+
+    def peek(self, namespace, key):
+        """Like ``get``, but leave the entry's place in the LRU order alone."""
+        raise NotImplementedError
+
+    def set(self, namespace, key, value, max_entries=None):
+        """Store ``value`` under ``key``, evicting LRU entries beyond ``max_entries``; returns the number evicted."""
+        raise NotImplementedError
+
+    def get_all(self, namespace):
+        """Return every ``{key: value}`` in ``namespace``."""
+        raise NotImplementedError
+
+    def set_many(self, namespace, values):
+        """Store every ``{key: value}`` in ``values`` at once."""
+        raise NotImplementedError
+
+    def delete(self, namespace, key):
+        """Remove a single entry."""
+        raise NotImplementedError
+
+    def clear(self, namespace):
+        """Remove every entry in ``namespace``."""
+        raise NotImplementedError
+
+    def count(self, namespace):
+        """Return the number of entries in ``namespace``."""
+        raise NotImplementedError
+
+    def expire(self, namespace, ttl_seconds):
+        """Drop ``namespace`` once ``ttl_seconds`` pass without another call to ``expire``."""
+        raise NotImplementedError
+
+
+class MemoryStorage(Storage):
+    """Storage in this process's memory; fast, but neither persistent nor shared between replicas."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._namespaces = {}
+        self._expires_at = {}
+
+    def _entries(self, namespace):
+        expires_at = self._expires_at.get(namespace)
+        if expires_at is not None and expires_at <= time.time():
+            self._namespaces.pop(namespace, None)
+            self._expires_at.pop(namespace)
+        return self._namespaces.setdefault(namespace, OrderedDict())
+
+    def get(self, namespace, key):
+        with self._lock:
+            entries = self._entries(namespace)
+            if key not in entries:
+                return None
+            entries.move_to_end(key)
+            return entries[key]
+
+    def peek(self, namespace, key):
+        with self._lock:
+            return self._entries(namespace).get(key)
+
+    def set(self, namespace, key, value, max_entries=None):
+        with self._lock:
+            entries = self._entries(namespace)
+            entries[key] = (value, time.time())
+            entries.move_to_end(key)
+            evicted = 0
+            while max_entries is not None and len(entries) > max_entries:
+                entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def get_all(self, namespace):
+        with self._lock:
+            return {key: value for key, (value, _) in self._entries(namespace).items()}
+
+    def set_many(self, namespace, values):
+        now = time.time()
+        with self._lock:
+            entries = self._entries(namespace)
+            for key, value in values.items():
+                entries[key] = (value, now)
+                entries.move_to_end(key)
+
+    def delete(self, namespace, key):
+        with self._lock:
+            self._entries(namespace).pop(key, None)
+
+    def clear(self, namespace):
+        with self._lock:
+            self._namespaces.pop(namespace, None)
+            self._expires_at.pop(namespace, None)
+
+    def count(self, namespace):
+        with self._lock:
+            return len(self._entries(namespace))
+
+    def expire(self, namespace, ttl_seconds):
+        with self._lock:
+            self._expires_at[namespace] = time.time() + ttl_seconds
+
+
+class SQLiteStorage(Storage):
+    """Storage in a local SQLite database file.
+
+    Entries survive restarts and are shared by every process on the host
+    pointing at the same file, but not by replicas on other hosts. Reads
+    skip expired namespaces; writes purge them.
+
+    Connections run in autocommit mode and every write is its own short
+    ``BEGIN IMMEDIATE`` transaction, which takes the write lock up front. A
+    deferred transaction that reads and then writes has to upgrade its lock,
+    and in WAL mode that fails at once with "database is locked" when
+    another writer got in first, without waiting out the busy timeout.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_lru ON cache_entries (namespace, accessed_at)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS namespace_expiry (namespace TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_namespace_expiry ON namespace_expiry (expires_at)")
+            self._purge_expired(conn)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a connection inside a write transaction holding the write lock from the start."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _purge_expired(self, conn):
+        """Delete every expired namespace; call inside a write transaction."""
+        expired = conn.execute("SELECT namespace FROM namespace_expiry WHERE expires_at <= ?", (time.time(),)).fetchall()
+        conn.executemany("DELETE FROM cache_entries WHERE namespace = ?", expired)
+        conn.executemany("DELETE FROM namespace_expiry WHERE namespace = ?", expired)
+
+    def _expired(self, conn, namespace):
+        return conn.execute(
+            "SELECT 1 FROM namespace_expiry WHERE namespace = ? AND expires_at <= ?", (namespace, time.time())
+        ).fetchone() is not None
+
+    def get(self, namespace, key):
+        row = self.peek(namespace, key)
+        if row is not None:
+            with self._transaction() as conn:
+                conn.execute(
+                    "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (time.time(), namespace, key),
+                )
+        return row
+
+    def peek(self, namespace, key):
+        with self._connect() as conn:
+            if self._expired(conn, namespace):
+                return None
+            return conn.execute(
+                "SELECT value, created_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+
+    def set(self, namespace, key, value, max_entries=None):
+        with self._transaction() as conn:
+            self._purge_expired(conn)
+            self._upsert(conn, namespace, {key: value})
+            if max_entries is None:
+                return 0
+            return conn.execute(
+                """
+                DELETE FROM cache_entries WHERE namespace = ? AND key IN (
+                    SELECT key FROM cache_entries WHERE namespace = ?
+                    ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (namespace, namespace, max_entries),
+            ).rowcount
+
+    def _upsert(self, conn, namespace, values):
+        now = time.time()
+        conn.executemany(
+            """
+            INSERT INTO cache_entries (namespace, key, value, created_at, accessed_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (namespace, key) DO UPDATE SET
+                value = excluded.value,
+                created_at = excluded.created_at,
+                accessed_at = excluded.accessed_at
+            """,
+            [(namespace, key, value, now, now) for key, value in values.items()],
+        )
+
+    def get_all(self, namespace):
+        with self._connect() as conn:
+            if self._expired(conn, namespace):
+                return {}
+            rows = conn.execute("SELECT key, value FROM cache_entries WHERE namespace = ?", (namespace,)).fetchall()
+        return dict(rows)
+
+    def set_many(self, namespace, values):
+        with self._transaction() as conn:
+            self._purge_expired(conn)
+            self._upsert(conn, namespace, values)
+
+    def delete(self, namespace, key):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def clear(self, namespace):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+            conn.execute("DELETE FROM namespace_expiry WHERE namespace = ?", (namespace,))
+
+    def count(self, namespace):
+        with self._connect() as conn:
+            if self._expired(conn, namespace):
+                return 0
+            return conn.execute("SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (namespace,)).fetchone()[0]
+
+    def expire(self, namespace, ttl_seconds):
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO namespace_expiry (namespace, expires_at) VALUES (?, ?)
+                ON CONFLICT (namespace) DO UPDATE SET expires_at = excluded.expires_at
+                """,
+                (namespace, time.time() + ttl_seconds),
+            )
+
+
+class RedisStorage(Storage):
+    """Storage on a Redis server, shared by every replica pointing at it.
+
+    Each namespace is a hash of values, a hash of write times and a sorted
+    set of access times for LRU eviction; namespace expiry maps to Redis key
+    expiry. ``client`` is any redis-py compatible client created with
+    ``decode_responses=True``, so a local stand-in such as
+    ``fakeredis.FakeRedis`` can replace a server.
+    """
+
+    def __init__(self, client, prefix="interviewai"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, prefix="interviewai"):
+        """Connect to the Redis server at ``url``; requires the ``redis`` package."""
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("The redis storage backend needs the redis package: pip install redis") from e
+        return cls(redis.Redis.from_url(url, decode_responses=True), prefix)
+
+    def _keys(self, namespace):
+        base = f"{self.prefix}:{namespace}"
+        return base, f"{base}:created", f"{base}:lru"
+
+    def get(self, namespace, key):
+        values, created, lru = self._keys(namespace)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hget(values, key)
+        pipe.hget(created, key)
+        pipe.zadd(lru, {key: time.time()}, xx=True)
+        value, created_at, _ = pipe.execute()
+        if value is None:
+            return None
+        return value, float(created_at or 0)
+
+    def peek(self, namespace, key):
+        values, created, _ = self._keys(namespace)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hget(values, key)
+        pipe.hget(created, key)
+        value, created_at = pipe.execute()
+        if value is None:
+            return None
+        return value, float(created_at or 0)
+
+    def set(self, namespace, key, value, max_entries=None):
+        self.set_many(namespace, {key: value})
+        if max_entries is None:
+            return 0
+        values, created, lru = self._keys(namespace)
+        excess = self.client.zcard(lru) - max_entries
+        if excess <= 0:
+            return 0
+        victims = self.client.zrange(lru, 0, excess - 1)
+        if victims:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hdel(values, *victims)
+            pipe.hdel(created, *victims)
+            pipe.zrem(lru, *victims)
+            pipe.execute()
+        return len(victims)
+
+    def get_all(self, namespace):
+        return self.client.hgetall(self._keys(namespace)[0])
+
+    def set_many(self, namespace, values):
+        if not values:
+            return
+        values_key, created, lru = self._keys(namespace)
+        now = time.time()
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hset(values_key, mapping=values)
+        pipe.hset(created, mapping={key: now for key in values})
+        pipe.zadd(lru, {key: now for key in values})
+        pipe.execute()
+
+    def delete(self, namespace, key):
+        values, created, lru = self._keys(namespace)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hdel(values, key)
+        pipe.hdel(created, key)
+        pipe.zrem(lru, key)
+        pipe.execute()
+
+    def clear(self, namespace):
+        self.client.delete(*self._keys(namespace))
+
+    def count(self, namespace):
+        return self.client.hlen(self._keys(namespace)[0])
+
+    def expire(self, namespace, ttl_seconds):
+        pipe = self.client.pipeline(transaction=False)
+        for key in self._keys(namespace):
+            pipe.expire(key, int(ttl_seconds))
+        pipe.execute()
+
+
+def open_storage(backend, sqlite_path=None, redis_url=None):
+    """Open the storage named by ``backend``: "sqlite", "memory" or "redis"."""
+    if backend == "sqlite":
+        return SQLiteStorage(sqlite_path)
+    if backend == "memory":
+        return MemoryStorage()
+    if backend == "redis":
+        return RedisStorage.from_url(redis_url)
+    raise ValueError(f"Unknown storage backend {backend!r}; expected sqlite, memory or redis")
+
+
+def open_configured_storage():
+    """Open the storage selected by the ``INTERVIEWAI_STORAGE``/``_CACHE_PATH``/``_REDIS_URL`` environment.
+
+    The variables are read on every call rather than at import, so a process
+    can repoint them (a benchmark using a scratch cache, say) after this
+    module is first imported.
+    """
+    return open_storage(
+        os.environ.get("INTERVIEWAI_STORAGE", DEFAULT_STORAGE_BACKEND),
+        sqlite_path=os.environ.get("INTERVIEWAI_CACHE_PATH", DEFAULT_CACHE_PATH),
+        redis_url=os.environ.get("INTERVIEWAI_REDIS_URL", DEFAULT_REDIS_URL),
+    )
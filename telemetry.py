@@ -0,0 +1,310 @@
+import json
+import math
+import os
+import threading
+import time
+import warnings
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Latency samples kept per function for percentile estimates
+TRACE_WINDOW = int(os.environ.get("INTERVIEWAI_TRACE_WINDOW", "2048"))
+
+# Optional JSONL file receiving one line per traced call
+TRACE_JSONL_PATH = os.environ.get("INTERVIEWAI_TRACE_JSONL")
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _sum_metric(metrics, name):
+    """Sum a phidata run metric, which is a list with one value per model message."""
+    value = (metrics or {}).get(name)
+    if value is None:
+        return 0
+    if isinstance(value, (list, tuple)):
+        return sum(v for v in value if isinstance(v, (int, float)))
+    return value if isinstance(value, (int, float)) else 0
+
+
+def count_tool_calls(response):
+    """Count the tool calls made during a run.
+
+    Non-streamed phidata runs leave ``RunResponse.tools`` empty, so the tool
+    calls recorded on the run's assistant messages are counted instead.
+    """
+    if response is None:
+        return 0
+    if getattr(response, "tools", None):
+        return len(response.tools)
+    return sum(
+        len(message.tool_calls or [])
+        for message in getattr(response, "messages", None) or []
+        if message.role in ("assistant", "model")
+    )
+
+
+def percentile(samples, quantile):
+    """Nearest-rank percentile of ``samples``; 0.0 when there are none."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(quantile * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+class Trace:
+    """Mutable record of one traced call; set ``response`` to capture tokens and tool calls."""
+
+    def __init__(self, function, model):
+        self.function = function
+        self.model = model
+        self.response = None
+        self.input_tokens = None
+        self.extra = {}
+
+
+class LLMTracer:
+    """Process-wide latency, token and tool-call instrumentation for agent calls.
+
+    Every call is counted by function, model and error class; the most recent
+    ``window`` latencies per function back the p50/p95/p99 estimates. Records
+    can also be appended to a JSONL file, and the aggregates are exported in
+    the Prometheus text format.
+    """
+
+    def __init__(self, window=TRACE_WINDOW, jsonl_path=TRACE_JSONL_PATH):
+        self.window = window
+        self.jsonl_path = jsonl_path
+        self._lock = threading.Lock()
+        self._latencies = defaultdict(lambda: deque(maxlen=self.window))
+        self._latency_sums = defaultdict(float)
+        self._latency_counts = defaultdict(int)
+        self._calls = defaultdict(int)
+        self._input_tokens = defaultdict(int)
+        self._output_tokens = defaultdict(int)
+        self._tool_calls = defaultdict(int)
+        self._collectors = []
+
+    @contextmanager
+    def trace(self, function, agent=None, model=None):
+        """Time the wrapped block and record it under ``function``.
+
+        The model id is read from ``agent`` when given. Exceptions are recorded
+        by class name and re-raised.
+        """
+        if model is None and agent is not None:
+            model = getattr(getattr(agent, "model", None), "id", None)
+        trace = Trace(function, model or "")
+        started = time.perf_counter()
+        error = None
+        try:
+            yield trace
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.record_trace(trace, time.perf_counter() - started, error)
+
+    def run(self, function, agent, prompt, **kwargs):
+        """Call ``agent.run(prompt)`` and record it under ``function``."""
+        with self.trace(function, agent) as trace:
+            trace.response = agent.run(prompt, **kwargs)
+            return trace.response
+
+    def stream(self, function, agent, prompt):
+        """Stream ``agent.run(prompt, stream=True)`` chunks and record the whole call once it finishes."""
+        with self.trace(function, agent) as trace:
+            started = time.perf_counter()
+            for chunk in agent.run(prompt, stream=True):
+                if "time_to_first_token" not in trace.extra and chunk.content:
+                    trace.extra["time_to_first_token"] = time.perf_counter() - started
+                yield chunk
+            # Streamed chunks carry no metrics; the aggregated run response does
+            trace.response = getattr(agent, "run_response", None)
+
+    def record_trace(self, trace, latency, error=None):
+        response = trace.response
+        metrics = getattr(response, "metrics", None)
+        input_tokens = trace.input_tokens if trace.input_tokens is not None else _sum_metric(metrics, "input_tokens")
+        self.record(
+            trace.function,
+            latency,
+            model=trace.model,
+            input_tokens=input_tokens,
+            output_tokens=_sum_metric(metrics, "output_tokens"),
+            tool_calls=count_tool_calls(response),
+            error=error,
+            **trace.extra,
+        )
+
+    def record(self, function, latency, model="", input_tokens=0, output_tokens=0, tool_calls=0, error=None, **extra):
+        """Record one call; extra keyword fields only go to the JSONL sink."""
+        counter_key = (function, model, error or "")
+        token_key = (function, model)
+        with self._lock:
+            self._calls[counter_key] += 1
+            self._latencies[function].append(latency)
+            self._latency_sums[function] += latency
+            self._latency_counts[function] += 1
+            self._input_tokens[token_key] += input_tokens
+            self._output_tokens[token_key] += output_tokens
+            self._tool_calls[token_key] += tool_calls
+
+        if self.jsonl_path:
+            line = json.dumps({
+                "ts": time.time(),
+                "function": function,
+                "model": model,
+                "latency_s": round(latency, 6),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "tool_calls": tool_calls,
+                "error": error,
+                **extra,
+            })
+            with self._lock:
+                with open(self.jsonl_path, "a", encoding="utf-8") as sink:
+                    sink.write(line + "\n")
+
+    def add_collector(self, collector):
+        """Register a callable returning extra ``(name, type, help, [(labels, value), ...])`` metrics."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def latency_percentile(self, function, quantile, min_samples=1):
+        """Recent latency percentile of ``function`` in seconds, or None with fewer than ``min_samples`` calls."""
+        with self._lock:
+            samples = list(self._latencies.get(function, ()))
+        if len(samples) < min_samples:
+            return None
+        return percentile(samples, quantile)
+
+    def summary(self):
+        """Return call counts, error counts and latency percentiles per function."""
+        with self._lock:
+            latencies = {function: list(samples) for function, samples in self._latencies.items()}
+            calls = dict(self._calls)
+        result = {}
+        for function, samples in latencies.items():
+            total = sum(count for (name, _, _), count in calls.items() if name == function)
+            errors = sum(count for (name, _, error), count in calls.items() if name == function and error)
+            result[function] = {
+                "calls": total,
+                "errors": errors,
+                **{f"p{int(q * 100)}": percentile(samples, q) for q in QUANTILES},
+            }
+        return result
+
+    def prometheus(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            latencies = {function: list(samples) for function, samples in self._latencies.items()}
+            latency_sums = dict(self._latency_sums)
+            latency_counts = dict(self._latency_counts)
+            calls = dict(self._calls)
+            counters = {
+                "input_tokens": dict(self._input_tokens),
+                "output_tokens": dict(self._output_tokens),
+                "tool_calls": dict(self._tool_calls),
+            }
+            collectors = list(self._collectors)
+
+        lines = [
+            "# HELP interviewai_llm_calls_total LLM calls by function, model and error class.",
+            "# TYPE interviewai_llm_calls_total counter",
+        ]
+        for (function, model, error), count in sorted(calls.items()):
+            lines.append(f"interviewai_llm_calls_total{_labels(function=function, model=model, error=error)} {count}")
+
+        lines += [
+            "# HELP interviewai_llm_latency_seconds LLM call latency by function over the recent window.",
+            "# TYPE interviewai_llm_latency_seconds summary",
+        ]
+        for function, samples in sorted(latencies.items()):
+            for quantile in QUANTILES:
+                lines.append(
+                    f"interviewai_llm_latency_seconds{_labels(function=function, quantile=quantile)} "
+                    f"{percentile(samples, quantile):.6f}"
+                )
+            lines.append(f"interviewai_llm_latency_seconds_sum{_labels(function=function)} {latency_sums[function]:.6f}")
+            lines.append(f"interviewai_llm_latency_seconds_count{_labels(function=function)} {latency_counts[function]}")
+
+        for name, values in counters.items():
+            lines += [
+                f"# HELP interviewai_llm_{name}_total LLM {name.replace('_', ' ')} by function and model.",
+                f"# TYPE interviewai_llm_{name}_total counter",
+            ]
+            for (function, model), value in sorted(values.items()):
+                lines.append(f"interviewai_llm_{name}_total{_labels(function=function, model=model)} {value}")
+
+        # Several collectors may report the same metric (one per cache, say); each is described once
+        families = {}
+        for collector in collectors:
+            try:
+                metrics = collector()
+            except Exception:
+                continue
+            for name, metric_type, help_text, samples in metrics:
+                families.setdefault(name, (metric_type, help_text, []))[2].extend(samples)
+        for name, (metric_type, help_text, samples) in families.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            for labels, value in samples:
+                lines.append(f"{name}{_labels(**labels) if labels else ''} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+tracer = LLMTracer()
+
+_server = None
+_server_error = None
+_server_lock = threading.Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/metrics.json"):
+            body = json.dumps(tracer.summary(), indent=2).encode("utf-8")
+            content_type = "application/json"
+        elif self.path.startswith("/metrics"):
+            body = tracer.prometheus().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port, host="0.0.0.0"):
+    """Serve ``/metrics`` (Prometheus) and ``/metrics.json`` on a daemon thread; safe to call on every rerun.
+
+    Returns None when the port cannot be bound, for instance because another
+    process already holds it. The failure is warned about once and not retried.
+    """
+    global _server, _server_error
+    with _server_lock:
+        if _server is None and _server_error is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as e:
+                _server_error = e
+                warnings.warn(f"metrics server disabled, cannot listen on {host}:{port}: {e}", RuntimeWarning)
+                return None
+            threading.Thread(target=_server.serve_forever, daemon=True, name="metrics-server").start()
+        return _server
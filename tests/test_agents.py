@@ -0,0 +1,47 @@
+from phi.agent import Agent
+from phi.model.base import Model
+
+from agents import GEMINI_MODEL_ID, copy_agent, limited_model_class
+from limits import BACKGROUND, INTERACTIVE, limiters
+
+
+class RecordingModel(Model):
+    """Model stand-in whose requests record the Gemini limiter state they run under."""
+
+    id: str = "recording"
+    seen: list = []
+
+    def invoke(self, messages):
+        self.seen.append(limiters.get("gemini", GEMINI_MODEL_ID).snapshot()["in_flight"])
+        return "answer"
+
+    def invoke_stream(self, messages):
+        self.seen.append(limiters.get("gemini", GEMINI_MODEL_ID).snapshot()["in_flight"])
+        yield "answer"
+
+
+def gemini_admitted(priority):
+    return limiters.get("gemini", GEMINI_MODEL_ID).snapshot()["acquired"].get(priority, 0)
+
+
+def test_each_model_request_holds_its_own_slot():
+    model = limited_model_class(RecordingModel)(priority=BACKGROUND)
+    before = gemini_admitted(BACKGROUND)
+
+    assert model.invoke([]) == "answer"
+    # Between requests (while tools run) the slot is free again
+    assert limiters.get("gemini", GEMINI_MODEL_ID).snapshot()["in_flight"] == 0
+    assert list(model.invoke_stream([])) == ["answer"]
+
+    assert model.seen == [1, 1]
+    assert gemini_admitted(BACKGROUND) == before + 2
+
+
+def test_copy_agent_sets_the_priority_on_the_copy_only():
+    agent = Agent(model=limited_model_class(RecordingModel)())
+
+    run_agent = copy_agent(agent, BACKGROUND)
+
+    assert run_agent.model.priority == BACKGROUND
+    assert agent.model.priority == INTERACTIVE
+    assert limited_model_class(RecordingModel) is type(agent.model)
@@ -0,0 +1,69 @@
+import threading
+
+from background import BackgroundJobs
+
+
+def fail():
+    raise RuntimeError("model call failed")
+
+
+def test_take_returns_result_and_forgets_job():
+    jobs = BackgroundJobs(max_workers=1, max_pending=2, name="test-jobs")
+    jobs.submit("q1", lambda value: value * 2, 21, fingerprint="a")
+
+    assert jobs.take("q1", fingerprint="a", timeout=5) == 42
+    assert jobs.status("q1") == "missing"
+
+
+def test_take_with_other_fingerprint_drops_stale_result():
+    jobs = BackgroundJobs(max_workers=1, max_pending=2, name="test-jobs")
+    jobs.submit("q1", lambda: "old answer", fingerprint="a")
+
+    assert jobs.take("q1", fingerprint="b", timeout=5) is None
+    assert jobs.status("q1") == "missing"
+
+
+def test_failed_job_is_replaced_on_resubmit():
+    jobs = BackgroundJobs(max_workers=1, max_pending=2, name="test-jobs")
+    jobs.submit("q1", fail, fingerprint="a")
+    jobs._jobs["q1"]["future"].exception(timeout=5)
+    assert jobs.status("q1") == "failed"
+
+    assert jobs.submit("q1", lambda: "feedback", fingerprint="a")
+    assert jobs.take("q1", fingerprint="a", timeout=5) == "feedback"
+
+
+def test_discarded_failure_leaves_key_free():
+    jobs = BackgroundJobs(max_workers=1, max_pending=2, name="test-jobs")
+    jobs.submit("q1", fail)
+    jobs._jobs["q1"]["future"].exception(timeout=5)
+
+    jobs.discard("q1")
+    assert jobs.status("q1") == "missing"
+
+
+def test_running_job_with_same_fingerprint_is_reused():
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return len(calls)
+
+    jobs = BackgroundJobs(max_workers=1, max_pending=2, name="test-jobs")
+    assert jobs.submit("q1", slow, fingerprint="a")
+    assert jobs.submit("q1", slow, fingerprint="a")
+    release.set()
+
+    assert jobs.take("q1", fingerprint="a", timeout=5) == 1
+    assert calls == [1]
+
+
+def test_submit_refuses_when_queue_is_full():
+    release = threading.Event()
+    jobs = BackgroundJobs(max_workers=1, max_pending=1, name="test-jobs")
+    assert jobs.submit("q1", release.wait, 5)
+
+    assert not jobs.submit("q2", release.wait, 5)
+    release.set()
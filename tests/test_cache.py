@@ -0,0 +1,124 @@
+import threading
+import time
+
+from cache import PersistentCache, normalize_key
+from sessions import SessionStore, changed_values, valid_token
+from storage import MemoryStorage
+
+
+def test_normalize_key_ignores_case_and_whitespace():
+    assert normalize_key("  Google ", "Software   Engineer") == normalize_key("google", "software engineer")
+
+
+def test_cache_round_trip_and_stats():
+    cache = PersistentCache(MemoryStorage(), "research", ttl_seconds=60, max_entries=10)
+    cache.set("key", {"questions": ["Why us?"]})
+
+    assert cache.get("key") == {"questions": ["Why us?"]}
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"], stats["hit_rate"]) == (1, 1, 1, 0.5)
+
+
+def test_cache_entries_expire_after_ttl():
+    cache = PersistentCache(MemoryStorage(), "research", ttl_seconds=0.05, max_entries=10)
+    cache.set("key", "value")
+    assert cache.age("key") is not None
+    time.sleep(0.06)
+
+    assert cache.age("key") is None
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_counts_evictions():
+    cache = PersistentCache(MemoryStorage(), "research", ttl_seconds=60, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_age_does_not_keep_an_entry_from_eviction():
+    cache = PersistentCache(MemoryStorage(), "research", ttl_seconds=60, max_entries=2)
+    cache.set("a", "a")
+    cache.set("b", "b")
+
+    assert cache.age("a") is not None
+    cache.set("c", "c")
+    assert cache.age("a") is None
+    assert cache.get("b") == "b"
+
+
+class BrokenStorage(MemoryStorage):
+    def get(self, namespace, key):
+        raise OSError("database disk image is malformed")
+
+    def set(self, namespace, key, value, max_entries=None):
+        raise OSError("database disk image is malformed")
+
+    def count(self, namespace):
+        raise OSError("database disk image is malformed")
+
+
+def test_storage_failures_count_as_misses():
+    cache = PersistentCache(BrokenStorage(), "research", ttl_seconds=60, max_entries=10)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    stats = cache.stats()
+    assert (stats["misses"], stats["errors"], stats["entries"]) == (1, 2, 0)
+
+
+def test_corrupt_entry_counts_as_a_miss():
+    storage = MemoryStorage()
+    cache = PersistentCache(storage, "research", ttl_seconds=60, max_entries=10)
+    storage.set("research", "key", "{not json")
+
+    assert cache.get("key") is None
+    assert cache.stats()["errors"] == 1
+
+
+def test_stale_entry_is_served_and_refreshed_in_background():
+    cache = PersistentCache(MemoryStorage(), "research", ttl_seconds=0.2, max_entries=10, refresh_after=0.25)
+    cache.set("key", "old")
+    time.sleep(0.06)
+    refreshed = threading.Event()
+
+    def refresh():
+        refreshed.set()
+        return "new"
+
+    assert cache.get("key", refresh=refresh) == "old"
+    assert refreshed.wait(5)
+    cache._refresh_executor.shutdown(wait=True)
+    assert cache.get("key") == "new"
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_session_store_round_trip():
+    sessions = SessionStore(MemoryStorage(), ttl_seconds=60)
+    token = "0" * 32
+    sessions.save(token, {"company_name": "Stripe", "scores": [7, 8]})
+    sessions.save(token, {})
+
+    assert sessions.load(token) == {"company_name": "Stripe", "scores": [7, 8]}
+    assert sessions.load("f" * 32) == {}
+    assert sessions.stats() == {"restores": 1, "writes": 1, "keys_written": 2}
+
+
+def test_changed_values_only_returns_changed_keys():
+    digests = {}
+    state = {"company_name": "Stripe", "scores": [7]}
+    assert changed_values(state, ["company_name", "scores", "absent"], digests) == state
+
+    state["scores"].append(8)
+    assert changed_values(state, ["company_name", "scores"], digests) == {"scores": [7, 8]}
+    assert changed_values(state, ["company_name", "scores"], digests) == {}
+
+
+def test_valid_token():
+    assert valid_token("0123456789abcdef" * 2)
+    assert not valid_token("../../etc/passwd")
+    assert not valid_token(None)
@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+
+from limits import BACKGROUND, INTERACTIVE, AdaptiveLimiter, is_overload, track_queue_wait
+
+
+class QuotaError(Exception):
+    code = 429
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.001)
+
+
+def test_interactive_waiters_are_admitted_before_background():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=1)
+    admitted = []
+
+    def waiter(priority, name):
+        with limiter.slot(priority):
+            admitted.append(name)
+
+    limiter.acquire()
+    threads = []
+    for priority, name in ((BACKGROUND, "background-1"), (BACKGROUND, "background-2"), (INTERACTIVE, "interactive")):
+        thread = threading.Thread(target=waiter, args=(priority, name))
+        thread.start()
+        threads.append(thread)
+        wait_for(lambda: limiter.snapshot()["queued"] == len(threads))
+    limiter.release()
+    for thread in threads:
+        thread.join(5)
+
+    assert admitted == ["interactive", "background-1", "background-2"]
+    assert limiter.snapshot()["acquired"] == {INTERACTIVE: 2, BACKGROUND: 2}
+
+
+def test_token_bucket_delays_requests_past_the_burst():
+    limiter = AdaptiveLimiter(requests_per_minute=1200, max_concurrency=4, burst=1)
+    assert limiter.acquire() < 0.01
+    limiter.release()
+
+    # 20 requests per second leaves a 50 ms gap after the burst
+    assert limiter.acquire() >= 0.03
+
+
+def test_overload_halves_the_limit_and_success_grows_it_back():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=8)
+    with pytest.raises(QuotaError):
+        with limiter.slot():
+            raise QuotaError("quota exceeded")
+    assert limiter.limit == 4
+    assert limiter.snapshot()["throttled"] == 1
+
+    # Roughly one step per limit's worth of successful calls
+    for _ in range(4):
+        with limiter.slot():
+            pass
+    assert 4.9 < limiter.limit < 5
+
+
+def test_limit_stays_within_bounds():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=2)
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(succeeded=False, overloaded=True)
+    assert limiter.limit == 1
+
+    for _ in range(50):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 2
+
+
+def test_other_failures_leave_the_limit_alone():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=8)
+    with pytest.raises(ValueError):
+        with limiter.slot():
+            raise ValueError("bad prompt")
+
+    assert limiter.limit == 8
+    assert limiter.snapshot()["in_flight"] == 0
+
+
+def test_is_overload():
+    assert is_overload(QuotaError())
+    assert is_overload(RuntimeError("HTTP 429 Too Many Requests"))
+    try:
+        try:
+            raise QuotaError()
+        except QuotaError as e:
+            raise RuntimeError("model call failed") from e
+    except RuntimeError as wrapped:
+        assert is_overload(wrapped)
+    assert not is_overload(ValueError("bad prompt"))
+
+
+def test_track_queue_wait_adds_up_slot_waits():
+    limiter = AdaptiveLimiter(requests_per_minute=1200, max_concurrency=4, burst=1)
+    with track_queue_wait() as tracker:
+        for _ in range(2):
+            with limiter.slot():
+                pass
+
+    assert tracker["seconds"] >= 0.03
@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+
+from question_bank import QuestionBank, QuestionIndex, parse_questions
+
+RESEARCH = """# Interview Questions for Backend Engineer at Acme
+
+## Technical Questions
+1. **Design a URL shortener** that handles billions of requests per day.
+2. How would you design a distributed rate limiter?
+3. Explain consistent hashing and where you would use it.
+4. What are the trade-offs between SQL and NoSQL databases?
+
+## Behavioral Questions
+* Tell me about a time you disagreed with a teammate.
+* Describe a project that failed. What did you learn?
+
+**Culture and Values**
+- **Q1:** Why do you want to work at Acme?
+- Why do you want to work at Acme?
+
+Acme interviews usually last about an hour.
+"""
+
+
+def test_parse_questions_tags_questions_with_their_section():
+    assert parse_questions(RESEARCH) == [
+        ("technical", "Design a URL shortener that handles billions of requests per day."),
+        ("technical", "How would you design a distributed rate limiter?"),
+        ("technical", "Explain consistent hashing and where you would use it."),
+        ("technical", "What are the trade-offs between SQL and NoSQL databases?"),
+        ("behavioral", "Tell me about a time you disagreed with a teammate."),
+        ("behavioral", "Describe a project that failed. What did you learn?"),
+        ("culture", "Why do you want to work at Acme?"),
+    ]
+
+
+def test_parse_questions_classifies_questions_outside_a_section():
+    assert parse_questions("How do you handle pressure when a deadline slips?") == [
+        ("behavioral", "How do you handle pressure when a deadline slips?"),
+    ]
+    assert parse_questions("") == []
+    assert parse_questions(None) == []
+
+
+def test_retrieve_returns_the_closest_questions_first(tmp_path):
+    bank = QuestionBank(str(tmp_path))
+
+    retrieved = bank.retrieve(RESEARCH, "distributed rate limiter design", k=2)
+    assert len(retrieved) == 2
+    assert retrieved[0] == ("technical", "How would you design a distributed rate limiter?")
+    assert len(bank.retrieve(RESEARCH, "anything", k=50)) == 7
+
+
+def test_search_pushes_questions_close_to_avoided_ones_down():
+    vectors = np.array([[1.0, 0.0], [0.6, 0.8], [0.0, 1.0]], dtype=np.float32)
+    index = QuestionIndex(["a", "b", "c"], ["technical"] * 3, vectors)
+    query = np.array([0.8, 0.6], dtype=np.float32)
+
+    assert index.search(query, 2) == [1, 0]
+    assert index.search(query, 3, avoid_vectors=vectors[1:2]) == [0, 1, 2]
+    assert index.search(query, 0) == []
+
+
+def test_index_is_reused_from_disk(tmp_path):
+    QuestionBank(str(tmp_path)).retrieve(RESEARCH, "rate limiter")
+    bank = QuestionBank(str(tmp_path))
+
+    assert bank.retrieve(RESEARCH, "rate limiter")
+    counters = {name: samples[0][1] for name, _, _, samples in bank.metrics()}
+    assert counters["interviewai_question_index_loads_total"] == 1
+    assert counters["interviewai_question_index_builds_total"] == 0
+
+
+def test_corrupt_index_file_is_deleted_and_rebuilt(tmp_path):
+    bank = QuestionBank(str(tmp_path))
+    path = bank.path_for(RESEARCH)
+    os.makedirs(tmp_path, exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(b"PK\x03\x04 truncated")
+
+    assert bank.render(RESEARCH, "rate limiter", avoid=(), budget=200, k=3)
+    counters = {name: samples[0][1] for name, _, _, samples in bank.metrics()}
+    assert counters["interviewai_question_index_corrupt_total"] == 1
+    assert counters["interviewai_question_index_builds_total"] == 1
+    assert counters["interviewai_question_retrieval_errors_total"] == 0
+    assert len(QuestionBank(str(tmp_path)).index_for(RESEARCH)) == 7
+
+
+def test_render_fits_the_budget(tmp_path):
+    bank = QuestionBank(str(tmp_path))
+
+    rendered = bank.render(RESEARCH, "distributed systems design", avoid=(), budget=30, k=8)
+    assert rendered.startswith("- [technical] ")
+    assert len(rendered.splitlines()) < 7
+    assert bank.render("No questions here.", "anything", avoid=(), budget=200, k=8) == ""
@@ -0,0 +1,275 @@
+import threading
+import time
+
+import pytest
+
+from limits import AdaptiveLimiter
+from resilience import CallPolicy, call_with_policy, is_retryable, stats, stream_with_deadline
+
+
+class QuotaError(Exception):
+    code = 429
+
+
+def flaky(failures, error=QuotaError, result="ok"):
+    """Return a callable failing ``failures`` times with ``error`` before returning ``result``."""
+    calls = []
+
+    def func():
+        calls.append(time.monotonic())
+        if len(calls) <= failures:
+            raise error("try again")
+        return result
+
+    func.calls = calls
+    return func
+
+
+def counts(function):
+    return {
+        name: sum(count for labels, count in samples if labels["function"] == function)
+        for name, _, _, samples in stats.metrics()
+    }
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.001)
+
+
+def test_retryable_failures_are_retried():
+    func = flaky(2)
+
+    assert call_with_policy("test_retry", func, CallPolicy(deadline=5, attempts=3, base_delay=0.01)) == "ok"
+    assert len(func.calls) == 3
+    assert counts("test_retry")["interviewai_llm_retries_total"] == 2
+
+
+def test_last_error_is_raised_when_attempts_run_out():
+    func = flaky(5)
+
+    with pytest.raises(QuotaError):
+        call_with_policy("test_exhausted", func, CallPolicy(deadline=5, attempts=2, base_delay=0.01))
+    assert len(func.calls) == 2
+
+
+def test_other_errors_are_not_retried():
+    func = flaky(1, error=ValueError)
+
+    with pytest.raises(ValueError):
+        call_with_policy("test_fatal", func, CallPolicy(deadline=5, attempts=3, base_delay=0.01))
+    assert len(func.calls) == 1
+
+
+def test_deadline_bounds_a_hung_call():
+    release = threading.Event()
+    started = time.monotonic()
+
+    with pytest.raises(TimeoutError, match="within 0.1s"):
+        call_with_policy("test_deadline", lambda: release.wait(5), CallPolicy(deadline=0.1, attempts=3))
+    release.set()
+    assert time.monotonic() - started < 1
+    assert counts("test_deadline")["interviewai_llm_deadline_exceeded_total"] == 1
+
+
+def test_slow_attempt_is_hedged_and_fastest_answer_wins():
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(1)
+            return "slow"
+        return "fast"
+
+    started = time.monotonic()
+    policy = CallPolicy(deadline=5, attempts=1, hedge=True)
+    assert call_with_policy("test_hedge", func, policy, hedge_after=0.05) == "fast"
+    assert time.monotonic() - started < 0.5
+    assert counts("test_hedge")["interviewai_llm_hedges_total"] == 1
+    assert counts("test_hedge")["interviewai_llm_hedge_wins_total"] == 1
+
+
+def test_hedging_needs_the_policy_to_allow_it():
+    func = flaky(0)
+
+    assert call_with_policy("test_no_hedge", func, CallPolicy(deadline=5), hedge_after=0) == "ok"
+    assert len(func.calls) == 1
+    assert counts("test_no_hedge")["interviewai_llm_hedges_total"] == 0
+
+
+def call_in_background(function, func, policy, hedge_after=None):
+    """Start ``call_with_policy`` on a thread; returns a dict filled with its result or error."""
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = call_with_policy(function, func, policy, hedge_after)
+        except Exception as e:
+            outcome["error"] = e
+
+    outcome["thread"] = threading.Thread(target=run)
+    outcome["thread"].start()
+    return outcome
+
+
+def test_time_queued_for_a_slot_does_not_trigger_a_hedge():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=1)
+    calls = []
+
+    def func():
+        with limiter.slot():
+            calls.append(1)
+            return "ok"
+
+    limiter.acquire()
+    outcome = call_in_background("test_queued_hedge", func, CallPolicy(deadline=5, attempts=1, hedge=True), 0.02)
+    time.sleep(0.2)
+    limiter.release()
+    outcome["thread"].join(5)
+
+    assert outcome["result"] == "ok"
+    assert calls == [1]
+    assert counts("test_queued_hedge")["interviewai_llm_hedges_total"] == 0
+
+
+def test_hedge_clock_starts_once_admitted():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=2)
+    calls = []
+
+    def func():
+        with limiter.slot():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(1)
+                return "slow"
+            return "fast"
+
+    limiter.acquire()
+    limiter.acquire()
+    outcome = call_in_background("test_admitted_hedge", func, CallPolicy(deadline=5, attempts=1, hedge=True), 0.05)
+    time.sleep(0.2)
+    limiter.release()
+    limiter.release()
+    outcome["thread"].join(5)
+
+    assert outcome["result"] == "fast"
+    assert counts("test_admitted_hedge")["interviewai_llm_hedges_total"] == 1
+
+
+def test_no_hedge_while_others_queue_on_the_limiter():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=1)
+    release = threading.Event()
+
+    def func():
+        with limiter.slot():
+            release.wait(5)
+            return "ok"
+
+    outcome = call_in_background("test_busy_hedge", func, CallPolicy(deadline=5, attempts=1, hedge=True), 0.05)
+    waiter = threading.Thread(target=limiter.acquire)
+    wait_until(lambda: limiter.snapshot()["in_flight"] == 1)
+    waiter.start()
+    time.sleep(0.1)
+    release.set()
+    outcome["thread"].join(5)
+    waiter.join(5)
+
+    assert outcome["result"] == "ok"
+    assert counts("test_busy_hedge")["interviewai_llm_hedges_total"] == 0
+
+
+def test_abandoned_attempt_skips_the_call_once_admitted():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=1)
+    calls = []
+
+    def func():
+        with limiter.slot():
+            calls.append(1)
+
+    limiter.acquire()
+    with pytest.raises(TimeoutError):
+        call_with_policy("test_abandoned", func, CallPolicy(deadline=0.1, attempts=1))
+    limiter.release()
+    wait_until(lambda: limiter.snapshot()["acquired"].get(0) == 2 and limiter.snapshot()["in_flight"] == 0)
+
+    assert calls == []
+    assert limiter.limit == 1
+
+
+def test_stream_yields_every_item_and_raises_its_errors():
+    def broken():
+        yield "a"
+        raise QuotaError("dropped")
+
+    assert list(stream_with_deadline("test_stream", lambda: iter("abc"), 1, 1)) == ["a", "b", "c"]
+    with pytest.raises(QuotaError):
+        list(stream_with_deadline("test_stream", broken, 1, 1))
+
+
+def test_stream_must_start_within_the_deadline():
+    release = threading.Event()
+
+    def stalled():
+        release.wait(5)
+        yield "late"
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError, match="did not start streaming"):
+        list(stream_with_deadline("test_stream_start", stalled, 0.1, 5))
+    release.set()
+    assert time.monotonic() - started < 1
+    assert counts("test_stream_start")["interviewai_llm_deadline_exceeded_total"] == 1
+
+
+def test_stalled_stream_is_abandoned_and_releases_its_slot():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=1)
+    release = threading.Event()
+    sent = []
+
+    def stalls_mid_stream():
+        with limiter.slot():
+            for chunk in ("a", "b", "c"):
+                sent.append(chunk)
+                yield chunk
+                if chunk == "a":
+                    release.wait(5)
+
+    received = []
+    with pytest.raises(TimeoutError, match="stalled"):
+        for chunk in stream_with_deadline("test_stream_stall", stalls_mid_stream, 5, 0.1):
+            received.append(chunk)
+    assert received == ["a"]
+    assert limiter.snapshot()["in_flight"] == 1
+
+    release.set()
+    wait_until(lambda: limiter.snapshot()["in_flight"] == 0)
+    assert sent == ["a", "b"]
+    assert counts("test_stream_stall")["interviewai_llm_stream_stalls_total"] == 1
+
+
+def test_stream_queued_past_its_deadline_is_never_sent():
+    limiter = AdaptiveLimiter(requests_per_minute=60000, max_concurrency=1)
+    sent = []
+
+    def stream():
+        with limiter.slot():
+            sent.append(1)
+            yield "a"
+
+    limiter.acquire()
+    with pytest.raises(TimeoutError):
+        list(stream_with_deadline("test_stream_queued", stream, 0.1, 5))
+    limiter.release()
+    wait_until(lambda: limiter.snapshot()["acquired"].get(0) == 2 and limiter.snapshot()["in_flight"] == 0)
+
+    assert sent == []
+
+
+def test_is_retryable():
+    assert is_retryable(QuotaError())
+    assert is_retryable(TimeoutError())
+    assert is_retryable(ConnectionError())
+    assert not is_retryable(ValueError())
@@ -0,0 +1,133 @@
+import threading
+import time
+
+import fakeredis
+import pytest
+
+from storage import MemoryStorage, RedisStorage, SQLiteStorage, open_configured_storage, open_storage
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        return MemoryStorage()
+    if request.param == "sqlite":
+        return SQLiteStorage(str(tmp_path / "cache" / "test.sqlite3"))
+    return RedisStorage(fakeredis.FakeRedis(decode_responses=True), prefix="test")
+
+
+def pause():
+    # Keep access times distinct so LRU order is deterministic
+    time.sleep(0.002)
+
+
+def test_get_returns_value_and_write_time(storage):
+    before = time.time()
+    storage.set("ns", "key", "value")
+
+    value, created_at = storage.get("ns", "key")
+    assert value == "value"
+    assert before <= created_at <= time.time()
+    assert storage.get("ns", "missing") is None
+    assert storage.get("other", "key") is None
+
+
+def test_set_evicts_least_recently_used(storage):
+    for key in ("a", "b", "c"):
+        storage.set("ns", key, key, max_entries=3)
+        pause()
+    storage.get("ns", "a")
+    pause()
+
+    assert storage.set("ns", "d", "d", max_entries=3) == 1
+    assert storage.get("ns", "b") is None
+    assert storage.get_all("ns") == {"a": "a", "c": "c", "d": "d"}
+
+
+def test_peek_leaves_lru_order_alone(storage):
+    for key in ("a", "b"):
+        storage.set("ns", key, key, max_entries=2)
+        pause()
+
+    value, _ = storage.peek("ns", "a")
+    assert value == "a"
+    assert storage.peek("ns", "missing") is None
+    pause()
+    storage.set("ns", "c", "c", max_entries=2)
+    assert storage.get_all("ns") == {"b": "b", "c": "c"}
+
+
+def test_set_many_and_get_all(storage):
+    storage.set_many("ns", {"a": "1", "b": "2"})
+    storage.set_many("ns", {"b": "3"})
+    storage.set_many("ns", {})
+
+    assert storage.get_all("ns") == {"a": "1", "b": "3"}
+    assert storage.count("ns") == 2
+    assert storage.get_all("empty") == {}
+
+
+def test_delete_and_clear(storage):
+    storage.set_many("ns", {"a": "1", "b": "2"})
+    storage.set("other", "a", "1")
+
+    storage.delete("ns", "a")
+    assert storage.get_all("ns") == {"b": "2"}
+    storage.clear("ns")
+    assert storage.count("ns") == 0
+    assert storage.count("other") == 1
+
+
+def test_expire_drops_whole_namespace(storage):
+    storage.set_many("kept", {"a": "1"})
+    storage.expire("kept", 60)
+    storage.set_many("gone", {"a": "1", "b": "2"})
+    storage.expire("gone", -1)
+
+    assert storage.get_all("kept") == {"a": "1"}
+    assert storage.get("gone", "a") is None
+    assert storage.count("gone") == 0
+
+
+def test_concurrent_gets_and_sets_do_not_fail(storage):
+    errors = []
+
+    def worker(number):
+        try:
+            for step in range(100):
+                storage.set("ns", f"key{(number * 7 + step) % 40}", "value" * 40, max_entries=30)
+                storage.get("ns", f"key{(number + step) % 40}")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert storage.count("ns") == 30
+
+
+def test_sqlite_entries_survive_reopening(tmp_path):
+    path = str(tmp_path / "test.sqlite3")
+    SQLiteStorage(path).set("ns", "key", "value")
+
+    assert SQLiteStorage(path).get("ns", "key")[0] == "value"
+
+
+def test_open_storage_rejects_unknown_backend():
+    assert isinstance(open_storage("memory"), MemoryStorage)
+    with pytest.raises(ValueError, match="Unknown storage backend"):
+        open_storage("dynamodb")
+
+
+def test_configured_storage_reads_the_environment_when_opened(monkeypatch, tmp_path):
+    path = str(tmp_path / "scratch.sqlite3")
+    monkeypatch.setenv("INTERVIEWAI_STORAGE", "sqlite")
+    monkeypatch.setenv("INTERVIEWAI_CACHE_PATH", path)
+
+    storage = open_configured_storage()
+    assert isinstance(storage, SQLiteStorage)
+    assert storage.path == path
@@ -0,0 +1,32 @@
+import socket
+
+import pytest
+
+import telemetry
+
+
+def test_metrics_server_warns_once_when_port_is_taken(monkeypatch):
+    monkeypatch.setattr(telemetry, "_server", None)
+    monkeypatch.setattr(telemetry, "_server_error", None)
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        port = taken.getsockname()[1]
+
+        with pytest.warns(RuntimeWarning, match="metrics server disabled"):
+            assert telemetry.start_metrics_server(port, host="127.0.0.1") is None
+        # Later reruns neither retry the bind nor warn again
+        assert telemetry.start_metrics_server(port, host="127.0.0.1") is None
+
+
+def test_prometheus_describes_each_metric_once():
+    tracer = telemetry.LLMTracer()
+    for cache in ("interview_questions", "resume_analysis"):
+        tracer.add_collector(
+            lambda cache=cache: [("interviewai_cache_hits_total", "counter", "Cache hits by cache.", [({"cache": cache}, 3)])]
+        )
+
+    lines = tracer.prometheus().splitlines()
+    assert lines.count("# TYPE interviewai_cache_hits_total counter") == 1
+    assert 'interviewai_cache_hits_total{cache="interview_questions"} 3' in lines
+    assert 'interviewai_cache_hits_total{cache="resume_analysis"} 3' in lines
@@ -0,0 +1,166 @@
+"""Precompute interview question research for every role and a list of top companies.
+
+Walks every role in ``JOB_CATEGORIES`` against each company and stores the
+research in the shared research cache, so interactive users find it warm
+instead of waiting on web searches. Entries that are still fresh are
+skipped and each result is written as soon as it finishes, so an
+interrupted run picks up where it left off and a nightly run only
+refreshes what went stale, oldest first. Research runs a few pairs at a
+time.
+
+Rate limits are enforced per process, so the app's limiters never see the
+warm-up's requests. Warm-up holds itself to its own, smaller Gemini and
+Tavily budgets (``--gemini-rpm``/``--tavily-rpm``) to leave the providers'
+quota for interactive users on the same API keys.
+
+Use the same storage settings (``INTERVIEWAI_STORAGE`` and friends) as the
+app, with the API keys in ``GOOGLE_API_KEY``/``TAVILY_API_KEY`` or
+``.streamlit/secrets.toml``:
+
+    python warmup.py --dry-run
+    python warmup.py --companies "Google,Stripe" --categories Technology --workers 4
+    python warmup.py --gemini-rpm 30 --tavily-rpm 20
+
+A nightly cron entry might look like:
+
+    0 3 * * * cd /srv/interviewai && python warmup.py --limit 300
+"""
+import argparse
+import os
+import sys
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from limits import BACKGROUND, GEMINI_MAX_CONCURRENCY, TAVILY_MAX_CONCURRENCY, limiters
+from research import JOB_CATEGORIES, create_research_agent, open_research_cache, research_cache_key, research_interview_questions
+from storage import open_configured_storage
+
+# Companies warmed alongside every role; comma separated
+WARMUP_COMPANIES = os.environ.get(
+    "INTERVIEWAI_WARMUP_COMPANIES",
+    "Google,Microsoft,Amazon,Meta,Apple,Netflix,Goldman Sachs,JPMorgan Chase,McKinsey,Deloitte",
+)
+# Research requests run at once
+WARMUP_WORKERS = int(os.environ.get("INTERVIEWAI_WARMUP_WORKERS", "4"))
+# Request budgets for this process; the app's own limiters do not count warm-up requests
+WARMUP_GEMINI_RPM = float(os.environ.get("INTERVIEWAI_WARMUP_GEMINI_RPM", "60"))
+WARMUP_TAVILY_RPM = float(os.environ.get("INTERVIEWAI_WARMUP_TAVILY_RPM", "30"))
+
+SECRETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".streamlit", "secrets.toml")
+
+
+def load_api_keys():
+    """Return ``(google_api_key, tavily_api_key)`` from the environment, falling back to the app's secrets file."""
+    secrets = {}
+    if os.path.exists(SECRETS_PATH):
+        with open(SECRETS_PATH, "rb") as secrets_file:
+            secrets = tomllib.load(secrets_file)
+    return (
+        os.environ.get("GOOGLE_API_KEY") or secrets.get("GOOGLE_API_KEY"),
+        os.environ.get("TAVILY_API_KEY") or secrets.get("TAVILY_API_KEY"),
+    )
+
+
+def plan_warmup(cache, companies, categories, refresh_after):
+    """Return the ``(company, role)`` pairs needing research, missing entries first, then oldest.
+
+    An entry needs research when it is missing or older than
+    ``refresh_after`` (a fraction of the cache TTL). Pairs are de-duplicated
+    by cache key, so roles listed under several categories run once.
+    """
+    stale_after = cache.ttl_seconds * refresh_after
+    pending = {}
+    for category in categories:
+        for role in JOB_CATEGORIES[category]:
+            for company in companies:
+                key = research_cache_key(company, role)
+                if key in pending:
+                    continue
+                age = cache.age(key)
+                if age is None or age >= stale_after:
+                    pending[key] = (float("inf") if age is None else age, company, role)
+    return [(company, role) for _, company, role in sorted(pending.values(), key=lambda item: -item[0])]
+
+
+def run_warmup(agent, cache, pairs, workers):
+    """Research ``pairs`` with at most ``workers`` in flight; returns the number that failed."""
+    failed = 0
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warmup")
+    futures = {
+        executor.submit(research_interview_questions, agent, company, role, cache, BACKGROUND): (company, role)
+        for company, role in pairs
+    }
+    try:
+        for done, future in enumerate(as_completed(futures), 1):
+            company, role = futures[future]
+            try:
+                content, elapsed, tool_calls = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[{done}/{len(pairs)}] ✗ {role} @ {company}: {e}", flush=True)
+                continue
+            status = "✓" if content else "✗ empty response,"
+            failed += not content
+            print(f"[{done}/{len(pairs)}] {status} {role} @ {company} in {elapsed:.1f}s, {tool_calls} web searches", flush=True)
+    finally:
+        # On interruption, drop the queued pairs; the next run resumes from the cache
+        executor.shutdown(wait=False, cancel_futures=True)
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--companies", default=WARMUP_COMPANIES, help="comma-separated companies to warm for every role")
+    parser.add_argument("--categories", help="comma-separated JOB_CATEGORIES to warm (default: all)")
+    parser.add_argument("--workers", type=int, default=WARMUP_WORKERS, help="research requests run at once")
+    parser.add_argument("--gemini-rpm", type=float, default=WARMUP_GEMINI_RPM, help="Gemini requests per minute for this run")
+    parser.add_argument("--tavily-rpm", type=float, default=WARMUP_TAVILY_RPM, help="Tavily searches per minute for this run")
+    parser.add_argument("--refresh-after", type=float, help="refresh entries older than this fraction of the cache TTL")
+    parser.add_argument("--limit", type=int, help="research at most this many pairs in this run")
+    parser.add_argument("--dry-run", action="store_true", help="list the pairs that need research and exit")
+    args = parser.parse_args()
+
+    companies = [company.strip() for company in args.companies.split(",") if company.strip()]
+    categories = list(JOB_CATEGORIES)
+    if args.categories:
+        categories = [category.strip() for category in args.categories.split(",")]
+        unknown = [category for category in categories if category not in JOB_CATEGORIES]
+        if unknown:
+            parser.error(f"unknown categories {', '.join(unknown)}; expected some of {', '.join(JOB_CATEGORIES)}")
+
+    cache = open_research_cache(open_configured_storage())
+    refresh_after = cache.refresh_after if args.refresh_after is None else args.refresh_after
+    pairs = plan_warmup(cache, companies, categories, refresh_after)
+    total = sum(len(JOB_CATEGORIES[category]) for category in categories) * len(companies)
+    print(f"{len(pairs)} of {total} company/role pairs need research", flush=True)
+    if args.limit is not None:
+        pairs = pairs[:args.limit]
+    if args.dry_run:
+        for company, role in pairs:
+            print(f"  {role} @ {company}")
+        return 0
+    if not pairs:
+        return 0
+
+    google_api_key, tavily_api_key = load_api_keys()
+    if not google_api_key or not tavily_api_key:
+        print("GOOGLE_API_KEY and TAVILY_API_KEY are required", file=sys.stderr)
+        return 2
+
+    limiters.budgets.update(
+        gemini=(args.gemini_rpm, GEMINI_MAX_CONCURRENCY),
+        tavily=(args.tavily_rpm, TAVILY_MAX_CONCURRENCY),
+    )
+    started = time.perf_counter()
+    try:
+        failed = run_warmup(create_research_agent(google_api_key, tavily_api_key), cache, pairs, args.workers)
+    except KeyboardInterrupt:
+        print("Interrupted; finished pairs are cached and the next run resumes from there", file=sys.stderr)
+        return 130
+    print(f"Researched {len(pairs) - failed} of {len(pairs)} pairs in {time.perf_counter() - started:.0f}s", flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())